@@ -82,6 +82,9 @@ from .tree_node import (ITreeNode, ITreeNodeAdapter, MultiTreeNode,
 
 from .ui import UI
 
+from .ui_db import (PrefsStore, ShelvePrefsStore, SQLitePrefsStore,
+    get_ui_db, set_ui_db)
+
 from .ui_info import UIInfo
 
 from .ui_traits import (ATheme, Border, HasBorder, HasMargin, Image, Margin,
@@ -103,6 +103,11 @@ class Editor ( HasPrivateTraits ):
     # Is the underlying GUI widget scrollable?
     scrollable = Bool( False )
 
+    # Can the editor be re-bound to a new context by 'retarget'? Editors which
+    # listen to the edited object themselves must either extend 'retarget' to
+    # move their listeners, or set this to False:
+    retargetable = Bool( True )
+
     # The EditorFactory used to create this editor:
     factory = factory_trait
 
@@ -204,6 +209,63 @@ class Editor ( HasPrivateTraits ):
         self.object = self.ui = self.item = self.factory = self.control = \
         self.label_control = self.old_value = self._context_object = None
 
+    #---------------------------------------------------------------------------
+    #  Assigns any pending user input to the trait being edited:
+    #---------------------------------------------------------------------------
+
+    def flush ( self ):
+        """ Assigns any user input which the editor has not yet assigned to
+            the trait being edited (e.g. because it is waiting for the user to
+            stop typing).
+        """
+        pass
+
+    #---------------------------------------------------------------------------
+    #  Returns whether the editor can be re-bound to a new context:
+    #---------------------------------------------------------------------------
+
+    def can_retarget ( self ):
+        """ Returns whether the editor can be re-bound to the objects of a new
+            user interface context by **retarget**.
+
+            Editors which are not **retargetable**, are synchronized with
+            other object traits, contain a nested user interface, or listen
+            to another object cannot be re-bound, since those links are
+            specific to the original objects.
+        """
+        return (self.retargetable and
+                (self._user_to is None) and (self._user_from is None) and
+                (self._ui is None) and (self._object is None))
+
+    #---------------------------------------------------------------------------
+    #  Re-binds the editor to the objects of a new context:
+    #---------------------------------------------------------------------------
+
+    def retarget ( self, remove = False ):
+        """ Re-binds the editor to the objects of its user interface's
+            context, after the context has been replaced.
+
+            This is done in two steps: the user interface first calls the
+            method with **remove** set to True, while the old context is still
+            in place, then without it once the new context has been set.
+        """
+        name = self.extended_name
+        if remove:
+            if name != 'None':
+                self.context_object.on_trait_change( self._update_editor,
+                                                     name, remove = True )
+            return
+
+        # Discard the cached context object, and bind to the new object:
+        self.__dict__.pop( '_traits_cache_context_object', None )
+        self.object = eval( self.object_name, globals(), self.ui.context )
+        if name != 'None':
+            self.context_object.on_trait_change( self._update_editor, name,
+                                                 dispatch = 'ui' )
+
+        self.old_value = getattr( self.object, self.name, Undefined )
+        self.update_editor()
+
     #---------------------------------------------------------------------------
     #  Returns the context object the editor is using (Property implementation):
     #---------------------------------------------------------------------------
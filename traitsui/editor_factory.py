@@ -25,13 +25,66 @@
 
 from __future__ import absolute_import
 
-import sys, os
+import sys, os, pkgutil
 
 from traits.api import HasPrivateTraits, Callable, Str, Bool, Event, Any, Property
 
-from .helper import enum_values_changed
+from traits.trait_base import ETSConfig
 
-from .toolkit import toolkit_object
+from .helper import EnumValues
+
+from .toolkit import toolkit, toolkit_object
+
+#-------------------------------------------------------------------------------
+#  Data:
+#-------------------------------------------------------------------------------
+
+# The editor classes resolved for each (factory class, editor class name,
+# toolkit name), or None if the toolkit does not define such an editor:
+_toolkit_editors = {}
+
+# The default editor classes of each toolkit, keyed by ('module:class name',
+# toolkit name):
+_toolkit_defaults = {}
+
+# The number of editor class lookups served by (hits) and added to (misses)
+# the cache:
+toolkit_editor_stats = { 'hits': 0, 'misses': 0 }
+
+#-------------------------------------------------------------------------------
+#  Returns whether the current toolkit's backend package has a module:
+#-------------------------------------------------------------------------------
+
+def _backend_has_module ( module_name ):
+    """ Returns whether the backend package of the current toolkit contains a
+        module called *module_name* (without importing it).
+    """
+    package = 'traitsui.' + toolkit().__module__.split( '.' )[-2]
+    try:
+        return (pkgutil.find_loader( package + '.' + module_name ) is not None)
+    except ImportError:
+        return True
+
+#-------------------------------------------------------------------------------
+#  Returns a default editor class of the current toolkit:
+#-------------------------------------------------------------------------------
+
+def _toolkit_default ( name ):
+    """ Returns the toolkit object with the specified 'module:class name',
+        caching it once it has been successfully imported.
+    """
+    key = ( name, ETSConfig.toolkit )
+    try:
+        return _toolkit_defaults[ key ]
+    except KeyError:
+        pass
+
+    try:
+        result = _toolkit_defaults[ key ] = toolkit_object( name, True )
+    except ( ImportError, AttributeError ):
+        result = toolkit_object( name )
+
+    return result
 
 #-------------------------------------------------------------------------------
 #  'EditorFactory' abstract base class:
@@ -176,20 +229,64 @@ class EditorFactory ( HasPrivateTraits ):
     def _get_toolkit_editor(cls, class_name):
         """
         Returns the editor by name class_name in the backend package.
+
+        The result is cached for each factory class, editor class name and
+        toolkit, including the case where the backend does not define such
+        an editor. A backend module which exists but fails to import (e.g.
+        because of a circular import during start up) is not cached, so the
+        lookup is tried again next time.
         """
-        editor_factory_classes = [factory_class for factory_class in cls.mro()
-                                  if issubclass(factory_class, EditorFactory)]
-        for index in range(len( editor_factory_classes )):
+        toolkit()
+        key = (cls, class_name, ETSConfig.toolkit)
+        try:
+            result = _toolkit_editors[key]
+        except KeyError:
+            toolkit_editor_stats['misses'] += 1
+            try:
+                result = cls._find_toolkit_editor(class_name)
+            except AttributeError:
+                result = None
+            _toolkit_editors[key] = result
+        else:
+            toolkit_editor_stats['hits'] += 1
+
+        if result is None:
+            raise AttributeError("The %s backend does not define a %s for %s"
+                                 % (ETSConfig.toolkit, class_name,
+                                    cls.__name__))
+        return result
+
+    @classmethod
+    def _find_toolkit_editor(cls, class_name):
+        """
+        Searches the backend package for the editor by name class_name.
+
+        Raises AttributeError if the backend does not define the editor, or
+        ImportError if a backend module which could define it exists, but
+        could not be imported.
+        """
+        import_error = None
+        for factory_class in cls.mro():
+            if not issubclass(factory_class, EditorFactory):
+                continue
+
+            module_name = None
             try:
-                factory_class = editor_factory_classes[index]
                 editor_file_name = os.path.basename(
                                 sys.modules[factory_class.__module__].__file__)
-                return toolkit_object(':'.join([editor_file_name.split('.')[0],
-                                             class_name]), True)
-            except Exception, e:
-                if index == len(editor_factory_classes)-1:
-                    raise e
-        return None
+                module_name = editor_file_name.split('.')[0]
+                return toolkit_object(':'.join([module_name, class_name]),
+                                      True)
+            except AttributeError:
+                pass
+            except ImportError, e:
+                if _backend_has_module(module_name):
+                    import_error = e
+
+        if import_error is not None:
+            raise import_error
+
+        raise AttributeError(class_name)
 
     #---------------------------------------------------------------------------
     #  Property getters
@@ -206,7 +303,7 @@ class EditorFactory ( HasPrivateTraits ):
         try:
             SimpleEditor = self._get_toolkit_editor('SimpleEditor')
         except:
-            SimpleEditor = toolkit_object('editor_factory:SimpleEditor')
+            SimpleEditor = _toolkit_default('editor_factory:SimpleEditor')
         return SimpleEditor
 
 
@@ -235,7 +332,7 @@ class EditorFactory ( HasPrivateTraits ):
         try:
             TextEditor = self._get_toolkit_editor('TextEditor')
         except:
-            TextEditor = toolkit_object('editor_factory:TextEditor')
+            TextEditor = _toolkit_default('editor_factory:TextEditor')
         return TextEditor
 
 
@@ -250,7 +347,7 @@ class EditorFactory ( HasPrivateTraits ):
         try:
             ReadonlyEditor = self._get_toolkit_editor('ReadonlyEditor')
         except:
-            ReadonlyEditor = toolkit_object('editor_factory:ReadonlyEditor')
+            ReadonlyEditor = _toolkit_default('editor_factory:ReadonlyEditor')
         return ReadonlyEditor
 
 
@@ -286,8 +383,9 @@ class EditorWithListFactory ( EditorFactory ):
     def _values_changed ( self ):
         """ Recomputes the mappings whenever the **values** trait is changed.
         """
+        self._enum_values = enum = EnumValues( self.values )
         self._names, self._mapping, self._inverse_mapping = \
-            enum_values_changed( self.values )
+            enum.names, enum.mapping, enum.inverse_mapping
 
         self.values_modified = True
 
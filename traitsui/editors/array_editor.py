@@ -26,12 +26,16 @@ from __future__ import absolute_import
 
 import numpy
 
-from traits.api import Bool, HasTraits, Int, Float, Instance, false, TraitError
+from traits.api import Bool, HasTraits, Int, Float, Instance, false, \
+    TraitError, Trait, Str, Any
+from traits.trait_base import xgetattr
 
 from ..editor import Editor
 
 from ..editor_factory import EditorFactory
 
+from ..undo import AbstractUndoItem, value_size
+
 # CIRCULAR IMPORT FIXME: Importing from the source rather than traits.ui.api
 # to avoid circular imports, as this EditorFactory will be part of
 # traits.ui.api as well.
@@ -62,6 +66,298 @@ class ToolkitEditorFactory ( EditorFactory ):
     # Is user input set when the Enter key is pressed?
     enter_set = Bool( False )
 
+    # Arrays with more elements than this are edited using a virtual grid of
+    # cells read from (and written to) the array on demand, rather than with
+    # one editor per element (0 means never). Structured arrays are always
+    # edited using a grid. The grid edits the array in place, so the trait's
+    # change notifications pass the same array as both the old and new value
+    # (each edited cell is recorded in the undo history instead). (Qt only)
+    grid_threshold = Int( 400 )
+
+    #---------------------------------------------------------------------------
+    #  Returns whether an array should be edited using a virtual grid:
+    #---------------------------------------------------------------------------
+
+    def use_grid ( self, value ):
+        """ Returns whether an array should be edited using a virtual grid.
+        """
+        if not isinstance( value, numpy.ndarray ):
+            return False
+
+        if value.dtype.names is not None:
+            return True
+
+        threshold = self.grid_threshold
+        return ((threshold > 0) and (value.size > threshold))
+
+    #---------------------------------------------------------------------------
+    #  'Editor' factory methods:
+    #---------------------------------------------------------------------------
+
+    def simple_editor ( self, ui, object, name, description, parent ):
+        """ Generates an editor using the "simple" style.
+        """
+        klass = self._grid_editor_class( object, name, 'GridEditor' )
+        if klass is None:
+            return super( ToolkitEditorFactory, self ).simple_editor(
+                              ui, object, name, description, parent )
+
+        return klass( parent,
+                      factory     = self,
+                      ui          = ui,
+                      object      = object,
+                      name        = name,
+                      description = description )
+
+    def custom_editor ( self, ui, object, name, description, parent ):
+        """ Generates an editor using the "custom" style.
+        """
+        klass = self._grid_editor_class( object, name, 'GridEditor' )
+        if klass is None:
+            return super( ToolkitEditorFactory, self ).custom_editor(
+                              ui, object, name, description, parent )
+
+        return klass( parent,
+                      factory     = self,
+                      ui          = ui,
+                      object      = object,
+                      name        = name,
+                      description = description )
+
+    def readonly_editor ( self, ui, object, name, description, parent ):
+        """ Generates an "editor" that is read-only.
+        """
+        klass = self._grid_editor_class( object, name, 'ReadonlyGridEditor' )
+        if klass is None:
+            return super( ToolkitEditorFactory, self ).readonly_editor(
+                              ui, object, name, description, parent )
+
+        return klass( parent,
+                      factory     = self,
+                      ui          = ui,
+                      object      = object,
+                      name        = name,
+                      description = description )
+
+    #---------------------------------------------------------------------------
+    #  Private methods:
+    #---------------------------------------------------------------------------
+
+    def _grid_editor_class ( self, object, name, class_name ):
+        """ Returns the toolkit's grid editor class if the array being edited
+            should use one (and the toolkit has one), or None otherwise.
+        """
+        if self.use_grid( xgetattr( object, name, None ) ):
+            try:
+                return self._get_toolkit_editor( class_name )
+            except:
+                pass
+
+        return None
+
+#-------------------------------------------------------------------------------
+#  'ArrayGrid' class:
+#-------------------------------------------------------------------------------
+
+class ArrayGrid ( object ):
+    """ Presents an array as a grid of cells which are read from, and written
+        to, the array buffer on demand.
+
+        A 1D array is a single column, a 2D array a grid of rows and columns,
+        and a 1D structured (record) array has one named column per field.
+    """
+
+    #---------------------------------------------------------------------------
+    #  Initializes the object:
+    #---------------------------------------------------------------------------
+
+    def __init__ ( self, array, format = None ):
+        """ Initializes the object. *format* is used to convert cell values
+            to text (str by default).
+        """
+        if format is None:
+            format = str
+        self.format = format
+        self.set_array( array )
+
+    #---------------------------------------------------------------------------
+    #  Sets the array presented by the grid:
+    #---------------------------------------------------------------------------
+
+    def set_array ( self, array ):
+        """ Sets the array presented by the grid, returning whether the
+            shape of the grid (or its column names) changed.
+        """
+        names = array.dtype.names
+        if names is not None:
+            if len( array.shape ) != 1:
+                raise TraitError( 'Only 1D structured arrays supported' )
+            shape = ( array.shape[0], len( names ) )
+        elif len( array.shape ) == 1:
+            shape = ( array.shape[0], 1 )
+        elif len( array.shape ) == 2:
+            shape = array.shape
+        else:
+            raise TraitError( 'Only 1D or 2D arrays supported' )
+
+        old = getattr( self, 'array', None )
+        self.array = array
+        self.names = names
+        self.row_count, self.column_count = shape
+
+        return ((old is None) or (old.shape != array.shape) or
+                (old.dtype != array.dtype))
+
+    #---------------------------------------------------------------------------
+    #  Returns the name of a column:
+    #---------------------------------------------------------------------------
+
+    def column_name ( self, column ):
+        """ Returns the name of a column (the field name for a structured
+            array, and the column index otherwise).
+        """
+        if self.names is not None:
+            return self.names[ column ]
+        return str( column )
+
+    #---------------------------------------------------------------------------
+    #  Returns the value or text of a cell:
+    #---------------------------------------------------------------------------
+
+    def get_value ( self, row, column ):
+        """ Returns the value of a cell.
+        """
+        array = self.array
+        if self.names is not None:
+            return array[ self.names[ column ] ][ row ]
+        if len( array.shape ) == 1:
+            return array[ row ]
+        return array[ row, column ]
+
+    def get_text ( self, row, column ):
+        """ Returns the text of a cell.
+        """
+        return self.format( self.get_value( row, column ) )
+
+    #---------------------------------------------------------------------------
+    #  Sets the value of a cell from text:
+    #---------------------------------------------------------------------------
+
+    def set_text ( self, row, column, text ):
+        """ Converts text to the cell's type and writes it into the array,
+            returning False if the text is not a valid value.
+        """
+        array = self.array
+        if self.names is not None:
+            dtype = array.dtype.fields[ self.names[ column ] ][0]
+        else:
+            dtype = array.dtype
+
+        text = text.strip()
+        try:
+            if dtype.kind == 'b':
+                value = (text.lower() in ( '1', 'true', 'yes', 'on' ))
+            elif dtype.kind in 'SUO':
+                value = text
+            else:
+                value = dtype.type( text )
+        except ( ValueError, TypeError, OverflowError ):
+            return False
+
+        self.set_value( row, column, value )
+
+        return True
+
+    #---------------------------------------------------------------------------
+    #  Sets the value of a cell:
+    #---------------------------------------------------------------------------
+
+    def set_value ( self, row, column, value ):
+        """ Writes a value into a cell of the array.
+        """
+        array = self.array
+        if self.names is not None:
+            array[ self.names[ column ] ][ row ] = value
+        elif len( array.shape ) == 1:
+            array[ row ] = value
+        else:
+            array[ row, column ] = value
+
+#-------------------------------------------------------------------------------
+#  'ArrayCellUndoItem' class:
+#-------------------------------------------------------------------------------
+
+class ArrayCellUndoItem ( AbstractUndoItem ):
+    """ A change to a single cell of an array edited in place, which can be
+        undone.
+    """
+    #---------------------------------------------------------------------------
+    #  Trait definitions:
+    #---------------------------------------------------------------------------
+
+    # Object the change occurred on
+    object    = Trait( HasTraits )
+    # Name of the array trait that changed
+    name      = Str
+    # Row of the changed cell
+    row       = Int
+    # Column of the changed cell
+    column    = Int
+    # Old value of the cell
+    old_value = Any
+    # New value of the cell
+    new_value = Any
+
+    #---------------------------------------------------------------------------
+    #  Undoes the change:
+    #---------------------------------------------------------------------------
+
+    def undo ( self ):
+        """ Undoes the change.
+        """
+        self._set_cell( self.old_value )
+
+    #---------------------------------------------------------------------------
+    #  Re-does the change:
+    #---------------------------------------------------------------------------
+
+    def redo ( self ):
+        """ Re-does the change.
+        """
+        self._set_cell( self.new_value )
+
+    #---------------------------------------------------------------------------
+    #  Returns the approximate number of bytes used by the item:
+    #---------------------------------------------------------------------------
+
+    def memory_size ( self ):
+        """ Returns the approximate number of bytes used by the item.
+        """
+        return value_size( self.old_value ) + value_size( self.new_value )
+
+    #---------------------------------------------------------------------------
+    #  Returns a 'pretty print' form of the object:
+    #---------------------------------------------------------------------------
+
+    def __repr__ ( self ):
+        """ Returns a "pretty print" form of the object.
+        """
+        return 'undo( %s.%s[%d, %d] = %r )' % (
+               self.object.__class__.__name__, self.name, self.row,
+               self.column, self.old_value )
+
+    #---------------------------------------------------------------------------
+    #  Private methods:
+    #---------------------------------------------------------------------------
+
+    def _set_cell ( self, value ):
+        """ Writes a value back into the cell, and notifies listeners of the
+            trait that the array has been modified in place.
+        """
+        array = getattr( self.object, self.name )
+        ArrayGrid( array ).set_value( self.row, self.column, value )
+        self.object.trait_property_changed( self.name, array, array )
+
 #-------------------------------------------------------------------------------
 #  'ArrayStructure' class:
 #-------------------------------------------------------------------------------
@@ -25,7 +25,7 @@ useful for tools such as debuggers.
 
 from __future__ import absolute_import
 
-from traits.api import Instance, Str, Color, Enum, Bool
+from traits.api import Instance, Str, Color, Enum, Bool, Int
 
 from ..editor_factory import EditorFactory
 
@@ -83,6 +83,25 @@ class ToolkitEditorFactory ( EditorFactory ):
     # Is user input set on every change?
     auto_set = Bool( True )
 
+    # Delay (in milliseconds) after the last change before the code is set:
+    auto_set_delay = Int( 0 )
+
+    # Should the trait value only be updated once the user has stopped editing
+    # for **sync_delay** milliseconds, rather than on every change? Each edit
+    # is still reported immediately through the **edits** trait. This avoids
+    # copying the whole document on each keystroke when editing large files.
+    incremental = Bool( False )
+
+    # Delay (in milliseconds) between the last edit and the update of the
+    # trait value for an **incremental** editor
+    sync_delay = Int( 300 )
+
+    # Object trait which is assigned each edit made by the user, as a
+    # ( position, removed, inserted ) tuple, where *removed* is the number of
+    # characters removed at *position* and *inserted* is the text inserted
+    # there (optional)
+    edits = Str
+
     # Should the editor auto-scroll when a new **selected_line** value is set?
     auto_scroll = Bool( True )
 
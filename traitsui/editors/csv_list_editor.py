@@ -221,6 +221,11 @@ class CSVListEditor(TextEditor):
     enter_set : bool
         If True, the user input sets the value when the Enter key is pressed.
 
+    auto_set_delay : int
+        If greater than 0, the value is set only once the user has stopped
+        typing for this many milliseconds, or the input field loses the focus.
+        Default is 0.
+
     Example
     -------
     The following will display a window containing a single input field.
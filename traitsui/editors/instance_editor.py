@@ -85,6 +85,11 @@ class ToolkitEditorFactory ( EditorFactory ):
     # The ID to use with the view
     id = Str
 
+    # Should the custom editor re-target the user interface it displays at a
+    # new value of the same class (when the same view is used), rather than
+    # building a new user interface?
+    reuse_view = Bool( False )
+
     # Kind of pop-up editor (live, modal, nonmodal, wizard)
     kind = AKind
 
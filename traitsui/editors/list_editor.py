@@ -95,11 +95,28 @@ class ToolkitEditorFactory ( EditorFactory ):
     # Show a right-click context menu for the notebook tabs?  (Qt only)
     show_notebook_menu = Bool(False)
 
+    # Only create editors for the list items visible in the custom style's
+    # scroll viewport, recycling them as the list is scrolled? Every row is
+    # assumed to have the same height as the first one. (Qt only)
+    virtual = Bool(False)
+
+    # The number of rows above and below the viewport which a virtual list
+    # also creates editors for:
+    virtual_margin = Int(10)
+
     #-- Notebook Specific Traits -----------------------------------------------
 
     # Are notebook items deletable?
     deletable = Bool(False)
 
+    # Only build the UI of each notebook page when its tab is first activated?
+    # (Qt only)
+    lazy = Bool(False)
+
+    # The maximum number of page UIs a lazy notebook keeps alive, disposing of
+    # the least recently viewed ones beyond it (0 means no limit). (Qt only)
+    max_live_pages = Int(0)
+
     # The extended name of the trait on each page object which should be used
     # to determine whether or not an individual page should be deletable.
     deletable_trait = Str()
@@ -156,6 +173,11 @@ class ToolkitEditorFactory ( EditorFactory ):
     def _get_custom_editor_class ( self ):
         if self.use_notebook:
             return toolkit_object('list_editor:NotebookEditor')
+        if self.virtual:
+            try:
+                return toolkit_object('list_editor:VirtualEditor', True)
+            except:
+                pass
         return toolkit_object('list_editor:CustomEditor')
 
 #-------------------------------------------------------------------------------
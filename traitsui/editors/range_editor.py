@@ -55,6 +55,9 @@ class ToolkitEditorFactory ( EditorFactory ):
     # Is user input set when the Enter key is pressed?
     enter_set = Bool(False)
 
+    # Delay (in milliseconds) before auto-setting the text field's value
+    auto_set_delay = Int(0)
+
     # Label for the low end of the range
     low_label = Unicode
 
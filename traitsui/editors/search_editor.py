@@ -21,7 +21,7 @@
 
 from __future__ import absolute_import
 
-from traits.api import Bool, Property, Str
+from traits.api import Bool, Int, Property, Str
 from ..toolkit import toolkit_object
 from ..basic_editor_factory import BasicEditorFactory
 
@@ -43,6 +43,10 @@ class SearchEditor(BasicEditorFactory):
     # Is user input set when the Enter key is pressed?
     enter_set = Bool(False)
 
+    # Milliseconds to wait for typing to stop before auto-setting the search
+    # text (0 means no delay)
+    auto_set_delay = Int(0)
+
     # Whether to show a search button on the widget
     search_button = Bool(True)
 
@@ -41,6 +41,10 @@ class _ShellEditor ( Editor ):
     """ Base class for an editor that displays an interactive Python shell.
     """
 
+    # The editor listens to the edited object itself, so it cannot be
+    # re-targeted at a new context:
+    retargetable = False
+
     #---------------------------------------------------------------------------
     #  Trait definitions:
     #---------------------------------------------------------------------------
@@ -117,6 +117,13 @@ class ToolkitEditorFactory ( EditorFactory ):
     # Is the table editable?
     editable = Bool( True )
 
+    # Should the displayed cell values be cached in blocks of rows, rather
+    # than being fetched from the columns on each repaint? Only set this when
+    # the editor is notified of every change to the displayed values, since
+    # cached values are only refreshed then (which is not the case for
+    # columns with dotted names or computed values, for example):
+    cache_blocks = Bool( False )
+
     # Should the editor become active after the first click
     edit_on_first_click = Bool( True )
 
@@ -162,6 +169,10 @@ class ToolkitEditorFactory ( EditorFactory ):
     # Height to use for the edit view
     edit_view_height = Float( -1.0 )
 
+    # Should the edit view built for one item be reused (re-targeted) for the
+    # next selected item of the same class, rather than being rebuilt?
+    reuse_edit_view = Bool( False )
+
     # Layout orientation of the table and its associated editor pane. This
     # attribute applies only if **edit_view** is not ' '.
     orientation = Orientation
@@ -303,6 +314,15 @@ class ToolkitEditorFactory ( EditorFactory ):
     # is created
     row_factory_kw = Dict
 
+    # The number of milliseconds to collect changes to the traits of the table
+    # items for before the changed rows are redrawn (0 means they are redrawn
+    # as soon as the GUI event loop is idle):
+    update_interval = Int( 0 )
+
+    # The maximum number of changed rows redrawn individually; if more rows
+    # change before they are redrawn, the whole table is redrawn instead:
+    update_batch_size = Int( 1000 )
+
     # Hooks for replacing parts of the implementation.
     table_view_factory = Callable()
     source_model_factory = Callable()
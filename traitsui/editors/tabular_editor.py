@@ -25,7 +25,7 @@
 
 from __future__ import absolute_import
 
-from traits.api import Str, Bool, Property, List, Enum, Instance
+from traits.api import Str, Bool, Int, Property, List, Enum, Instance
 
 from ..ui_traits import Image
 
@@ -67,6 +67,21 @@ class TabularEditor ( BasicEditorFactory ):
     # this feature adds and removed Traits listeners to each item in the list.
     auto_update = Bool( False )
 
+    # Should the displayed cell values be cached in blocks of rows, rather
+    # than being fetched from the adapter on each repaint? Only set this when
+    # the editor is notified of every change to the displayed values (e.g.
+    # using **auto_update**), since cached values are only refreshed then:
+    cache_blocks = Bool( False )
+
+    # The number of milliseconds to collect changes to the traits of the table
+    # items for before the changed rows are redrawn (0 means they are redrawn
+    # as soon as the GUI event loop is idle):
+    update_interval = Int( 0 )
+
+    # The maximum number of changed rows redrawn individually; if more rows
+    # change before they are redrawn, the whole table is redrawn instead:
+    update_batch_size = Int( 1000 )
+
     # The optional extended name of the trait to synchronize the selection
     # values with:
     selected = Str
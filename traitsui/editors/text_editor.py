@@ -24,7 +24,7 @@
 
 from __future__ import absolute_import
 
-from traits.api import Dict, Str, Any, Bool
+from traits.api import Dict, Str, Any, Bool, Int
 
 # CIRCULAR IMPORT FIXME: Importing from the source rather than traits.ui.api
 # to avoid circular imports, as this EditorFactory will be part of
@@ -78,6 +78,10 @@ class ToolkitEditorFactory ( EditorFactory ):
     # Is user input set when the Enter key is pressed?
     enter_set = Bool( False )
 
+    # Delay (in milliseconds) after the last keystroke before user input is
+    # set by 'auto_set' (0 sets it on every keystroke):
+    auto_set_delay = Int( 0 )
+
     # Is multi-line text allowed?
     multi_line = Bool( True )
 
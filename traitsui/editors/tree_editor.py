@@ -22,9 +22,10 @@
 
 from __future__ import absolute_import
 
-from traits.api import Any, Dict, Bool, Tuple, Int, List, Instance, Str, Enum
+from traits.api import (Any, Dict, Bool, Tuple, Int, List, Instance, Str,
+    Enum, on_trait_change)
 
-from ..tree_node import TreeNode
+from ..tree_node import TreeNode, MultiTreeNode, ITreeNodeAdapterBridge
 
 from ..dock_window_theme import DockWindowTheme
 
@@ -56,6 +57,16 @@ class ToolkitEditorFactory ( EditorFactory ):
     # Mapping from TreeNode tuples to MultiTreeNodes
     multi_nodes = Dict
 
+    # The number of node resolutions served from/added to the node cache:
+    node_cache_stats = Dict( { 'hits': 0, 'misses': 0 } )
+
+    # Mapping from object classes to the cacheable nodes which handle them
+    # and the resolved node (None if it depends on non-cacheable nodes):
+    _node_cache = Dict
+
+    # Mapping from classes to the nodes used by 'node_for_class':
+    _class_cache = Dict
+
     # The column header labels if any.
     column_headers = List(Str)
 
@@ -71,6 +82,10 @@ class ToolkitEditorFactory ( EditorFactory ):
     # Reference to a shared object editor
     editor = Instance( EditorFactory )
 
+    # The maximum number of node editor user interfaces kept for reuse when
+    # the selection changes (0 means always build a new one):
+    editor_cache_size = Int( 8 )
+
     # The DockWindow graphical theme
     # FIXME: Implemented only in wx backend.
     dock_theme = Instance( DockWindowTheme )
@@ -165,6 +180,172 @@ class ToolkitEditorFactory ( EditorFactory ):
     # This works only in the qt backend and if there is only one column in tree
     word_wrap = Bool(False)
 
+    # Use a virtual, model based tree which only creates the nodes that are
+    # visible, fetches the children of large nodes in pages, and releases the
+    # contents of collapsed nodes. This works only in the qt backend, and does
+    # not support drag and drop or word wrapping.
+    virtual = Bool(False)
+
+    # The number of child nodes a virtual tree fetches at a time (0 means
+    # fetch all of the children of a node at once):
+    fetch_size = Int(500)
+
+    #---------------------------------------------------------------------------
+    #  'Editor' factory methods:
+    #---------------------------------------------------------------------------
+
+    def _get_simple_editor_class ( self ):
+        """ Returns the editor class to use for "simple" style views, which is
+            the toolkit's VirtualEditor (if it has one) when **virtual** is
+            set.
+        """
+        if self.virtual:
+            try:
+                return self._get_toolkit_editor( 'VirtualEditor' )
+            except:
+                pass
+
+        return super( ToolkitEditorFactory, self )._get_simple_editor_class()
+
+    #---------------------------------------------------------------------------
+    #  Returns the TreeNode associated with a specified object:
+    #---------------------------------------------------------------------------
+
+    def node_for_object ( self, object ):
+        """ Returns the TreeNode associated with a specified object.
+
+            The nodes which handle each class of object are cached, so only
+            the nodes which are not **cacheable** are asked about each object.
+        """
+        if object is None:
+            return ITreeNodeAdapterBridge( adapter = object )
+
+        klass = object.__class__
+        entry = self._node_cache.get( klass )
+        if entry is None:
+            self.node_cache_stats[ 'misses' ] += 1
+            nodes = [ node for node in self.nodes
+                      if node.cacheable and node.is_node_for( object ) ]
+            if self._has_dynamic_nodes():
+                entry = ( nodes, None )
+            else:
+                entry = ( nodes, self._resolve_node( object, nodes ) )
+            self._node_cache[ klass ] = entry
+        else:
+            self.node_cache_stats[ 'hits' ] += 1
+
+        nodes, node = entry
+        if node is None:
+            if self._has_dynamic_nodes():
+                nodes = [ node for node in self.nodes
+                          if (node in nodes) or ((not node.cacheable) and
+                                                 node.is_node_for( object )) ]
+            node = self._resolve_node( object, nodes )
+
+        if node is False:
+            return ITreeNodeAdapterBridge( adapter = object )
+
+        return node
+
+    #---------------------------------------------------------------------------
+    #  Returns the TreeNode associated with a specified class:
+    #---------------------------------------------------------------------------
+
+    def node_for_class ( self, klass ):
+        """ Returns the TreeNode associated with a specified class.
+        """
+        nodes = self._class_cache
+        if klass not in nodes:
+            for node in self.nodes:
+                if issubclass( klass, tuple( node.node_for ) ):
+                    break
+            else:
+                node = None
+            nodes[ klass ] = node
+
+        return nodes[ klass ]
+
+    #---------------------------------------------------------------------------
+    #  Returns the node and class associated with a specified class name:
+    #---------------------------------------------------------------------------
+
+    def node_for_class_name ( self, class_name ):
+        """ Returns the node and class associated with a specified class name.
+        """
+        names = self._class_name_cache
+        if names is None:
+            self._class_name_cache = names = {}
+            for node in self.nodes:
+                for klass in node.node_for:
+                    names.setdefault( klass.__name__, ( node, klass ) )
+
+        return names.get( class_name, ( None, None ) )
+
+    #-- Private Methods --------------------------------------------------------
+
+    def _has_dynamic_nodes ( self ):
+        """ Returns whether any of the nodes are not cacheable.
+        """
+        if self._dynamic_nodes is None:
+            self._dynamic_nodes = [ node for node in self.nodes
+                                    if not node.cacheable ]
+
+        return (len( self._dynamic_nodes ) > 0)
+
+    def _resolve_node ( self, object, nodes ):
+        """ Returns the node to use for an object given all of the nodes which
+            handle it (or False if none do).
+        """
+        # If only one found, we're done, return it:
+        if len( nodes ) == 1:
+            return nodes[0]
+
+        # If none found, give up:
+        if len( nodes ) == 0:
+            return False
+
+        # Use all selected nodes that have the same 'node_for' list as the
+        # first selected node:
+        base  = nodes[0].node_for
+        nodes = [ node for node in nodes if base == node.node_for ]
+
+        # If only one left, then return that node:
+        if len( nodes ) == 1:
+            return nodes[0]
+
+        # Otherwise, return a MultiTreeNode based on all selected nodes...
+
+        # Use the node with no specified children as the root node. If not
+        # found, just use the first selected node as the 'root node':
+        for i, node in enumerate( nodes ):
+            if node.children == '':
+                root_node = node
+                del nodes[i]
+                break
+        else:
+            root_node = nodes[0]
+
+        # If we have a matching MultiTreeNode already cached, return it:
+        key = ( root_node, ) + tuple( nodes )
+        if key in self.multi_nodes:
+            return self.multi_nodes[ key ]
+
+        # Otherwise create one, cache it, and return it:
+        self.multi_nodes[ key ] = multi_node = MultiTreeNode(
+                                                    root_node = root_node,
+                                                    nodes     = nodes )
+
+        return multi_node
+
+    @on_trait_change( 'nodes, nodes_items, nodes:[node_for, node_for_items, '
+                      'node_for_class, node_for_interface, cacheable]' )
+    def _nodes_modified ( self ):
+        """ Discards the cached node resolutions when the nodes change.
+        """
+        self._node_cache.clear()
+        self._class_cache.clear()
+        self._class_name_cache = self._dynamic_nodes = None
+
 # Define the TreeEditor class.
 TreeEditor = ToolkitEditorFactory
 
@@ -25,6 +25,9 @@
 
 from __future__ import absolute_import
 
+from bisect import bisect_left, insort
+from collections import OrderedDict
+from operator import itemgetter
 from string import uppercase, lowercase
 
 from traits.api import BaseTraitHandler, CTrait, Enum, TraitError
@@ -84,9 +87,9 @@ def enum_values_changed ( values, strfunc=unicode ):
     """
 
     if isinstance( values, dict ):
-        data = [ ( strfunc( v ), n ) for n, v in values.items() ]
+        data = [ ( strfunc( v ), n ) for n, v in values.iteritems() ]
         if len( data ) > 0:
-            data.sort( lambda x, y: cmp( x[0], y[0] ) )
+            data.sort( key = itemgetter( 0 ) )
             col = data[0][0].find( ':' ) + 1
             if col > 0:
                 data = [ ( n[ col: ], v ) for n, v in data ]
@@ -98,17 +101,453 @@ def enum_values_changed ( values, strfunc=unicode ):
             raise TraitError, "Invalid value for 'values' specified"
         if handler.is_mapped:
             data = [ ( strfunc( n ), n ) for n in handler.map.keys() ]
-            data.sort( lambda x, y: cmp( x[0], y[0] ) )
+            data.sort( key = itemgetter( 0 ) )
         else:
             data = [ ( strfunc( v ), v ) for v in handler.values ]
     else:
         data = [ ( strfunc( v ), v ) for v in values ]
 
     names           = [ x[0] for x in data ]
-    mapping         = {}
-    inverse_mapping = {}
-    for name, value in data:
-        mapping[ name ] = value
-        inverse_mapping[ value ] = name
+    mapping         = dict( data )
+    inverse_mapping = dict( ( value, name ) for name, value in data )
 
     return ( names, mapping, inverse_mapping )
+
+#-------------------------------------------------------------------------------
+#  'EnumValues' class:
+#-------------------------------------------------------------------------------
+
+class EnumValues ( object ):
+    """ The names of a set of enumeration values and the mappings between
+        them, which can be updated incrementally as a list of values changes,
+        and which support completing a prefix of a name.
+    """
+
+    def __init__ ( self, values = (), strfunc = unicode ):
+        self.strfunc = strfunc
+        self.set_values( values )
+
+    def set_values ( self, values ):
+        """ Recomputes the names and mappings for a new set of values.
+        """
+        self.names, self.mapping, self.inverse_mapping = \
+            enum_values_changed( values, self.strfunc )
+        self._sorted = None
+
+    def update_items ( self, index, removed, added ):
+        """ Applies a change to a list of values (as described by a
+            TraitListEvent), replacing the values *removed* at *index* with
+            the values *added*.
+
+            Returns False (without changing anything) if the change can not
+            be applied incrementally, either because it is not a simple slice
+            change or because it would make some names or values ambiguous.
+        """
+        names = self.names
+        if ((not isinstance( index, int )) or
+            ((index + len( removed )) > len( names )) or
+            (len( self.mapping ) != len( names )) or
+            (len( self.inverse_mapping ) != len( names ))):
+            return False
+
+        mapping       = self.mapping
+        inverse       = self.inverse_mapping
+        removed_names = set( names[ index: index + len( removed ) ] )
+        added_names   = [ self.strfunc( value ) for value in added ]
+        try:
+            added_values = set( added )
+            if ((len( set( added_names ) ) != len( added_names )) or
+                (len( added_values ) != len( added ))):
+                return False
+            for name, value in zip( added_names, added ):
+                if (((name in mapping) and (name not in removed_names)) or
+                    ((value in inverse) and
+                     (inverse[ value ] not in removed_names))):
+                    return False
+        except TypeError:
+            # Unhashable values:
+            return False
+
+        sorted_names = self._sorted
+        for name in removed_names:
+            del inverse[ mapping.pop( name ) ]
+            if sorted_names is not None:
+                del sorted_names[ bisect_left( sorted_names, name ) ]
+
+        names[ index: index + len( removed ) ] = added_names
+        for name, value in zip( added_names, added ):
+            mapping[ name ] = value
+            inverse[ value ] = name
+            if sorted_names is not None:
+                insort( sorted_names, name )
+
+        return True
+
+    def complete ( self, prefix, limit = 0 ):
+        """ Returns the names starting with *prefix* in sorted order (at most
+            *limit* of them, if *limit* is not 0).
+        """
+        if self._sorted is None:
+            self._sorted = sorted( self.names )
+
+        sorted_names = self._sorted
+        result       = []
+        for i in xrange( bisect_left( sorted_names, prefix ),
+                         len( sorted_names ) ):
+            name = sorted_names[ i ]
+            if (not name.startswith( prefix )) or (len( result ) == limit > 0):
+                break
+            result.append( name )
+
+        return result
+
+#-------------------------------------------------------------------------------
+#  Finds the single changed range between two sequences:
+#-------------------------------------------------------------------------------
+
+def common_affixes ( a, b ):
+    """ Returns the lengths of the longest common prefix of two sequences
+        (such as strings or lists), and of the longest common suffix which
+        does not overlap it.
+
+        Slices which halve in size are compared, rather than single items, so
+        long sequences are compared at C speed.
+    """
+    na, nb = len( a ), len( b )
+    lo, hi = 0, min( na, nb )
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[ lo: mid ] == b[ lo: mid ]:
+            lo = mid
+        else:
+            hi = mid - 1
+    prefix = lo
+
+    lo, hi = 0, min( na, nb ) - prefix
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[ na - mid: na - lo ] == b[ nb - mid: nb - lo ]:
+            lo = mid
+        else:
+            hi = mid - 1
+
+    return ( prefix, lo )
+
+def text_delta ( old, new ):
+    """ Returns the smallest single replacement which turns *old* into *new*,
+        as a ( start, end, text ) tuple meaning that old[start:end] is
+        replaced by *text*.
+    """
+    prefix, suffix = common_affixes( old, new )
+
+    return ( prefix, len( old ) - suffix, new[ prefix: len( new ) - suffix ] )
+
+#-------------------------------------------------------------------------------
+#  'LRUCache' class:
+#-------------------------------------------------------------------------------
+
+class LRUCache ( object ):
+    """ A bounded mapping which discards its least recently used entries once
+        it holds more than *size* of them.
+    """
+
+    def __init__ ( self, size = 128 ):
+        self.size  = size
+        self._data = OrderedDict()
+
+    def get ( self, key, default = None ):
+        """ Returns the value for *key* (marking it as the most recently used),
+            or *default* if there is no such entry.
+        """
+        try:
+            value = self._data.pop( key )
+        except KeyError:
+            return default
+
+        self._data[ key ] = value
+
+        return value
+
+    def pop ( self, key, default = None ):
+        """ Removes the entry for *key* (if any) and returns its value.
+        """
+        return self._data.pop( key, default )
+
+    def clear ( self ):
+        """ Removes all entries from the cache.
+        """
+        self._data.clear()
+
+    def keys ( self ):
+        """ Returns the keys of the cache, least recently used first.
+        """
+        return self._data.keys()
+
+    def __setitem__ ( self, key, value ):
+        data = self._data
+        data.pop( key, None )
+        data[ key ] = value
+        while len( data ) > self.size:
+            data.popitem( last = False )
+
+    def __contains__ ( self, key ):
+        return ( key in self._data )
+
+    def __len__ ( self ):
+        return len( self._data )
+
+#-------------------------------------------------------------------------------
+#  'RowIndex' class:
+#-------------------------------------------------------------------------------
+
+class RowIndex ( object ):
+    """ Maps the identity of the items of a list to their row indices, so that
+        the row of an item can be found without scanning the list. The index
+        is built lazily from the list returned by the *items* callable and is
+        then kept up to date by calling *items_changed* for each change made
+        to the list (or *reset* when the whole list is replaced).
+    """
+
+    def __init__ ( self, items ):
+        self.items = items
+        self._rows = None
+
+    def row_for ( self, item ):
+        """ Returns the row index of the specified item, or -1 if the item is
+            not in the list. Items which are not in the list themselves are
+            looked for by equality (unless the list is an array, which has no
+            **index** method).
+        """
+        rows = self._rows
+        if rows is None:
+            rows = self._build()
+
+        items = self.items()
+        row   = rows.get( id( item ) )
+        if row is not None:
+            if (row < len( items )) and (items[ row ] is item):
+                return row
+
+            # The index is out of date, so rebuild it:
+            row = self._build().get( id( item ) )
+            if row is not None:
+                return row
+
+        try:
+            return items.index( item )
+        except ( ValueError, AttributeError ):
+            return -1
+
+    def items_changed ( self, row, removed, added ):
+        """ Updates the index after the *removed* items have been replaced by
+            the *added* items at the specified *row*.
+        """
+        rows = self._rows
+        if rows is None:
+            return
+
+        if self._duplicates:
+            self._rows = None
+            return
+
+        for item in removed:
+            rows.pop( id( item ), None )
+
+        # Only the following rows need to be updated if they have shifted:
+        items = self.items()
+        end   = len( items )
+        if len( removed ) == len( added ):
+            end = row + len( added )
+
+        for i in xrange( row, end ):
+            rows[ id( items[ i ] ) ] = i
+
+        if len( rows ) != len( items ):
+            # Some item now occurs more than once in the list:
+            self._rows = None
+
+    def reset ( self ):
+        """ Discards the index, so that it is rebuilt the next time it is
+            used.
+        """
+        self._rows = None
+
+    def _build ( self ):
+        """ Builds the index from the current list of items.
+        """
+        items = self.items()
+        rows  = {}
+        for i in xrange( len( items ) - 1, -1, -1 ):
+            rows[ id( items[ i ] ) ] = i
+
+        self._duplicates = ( len( rows ) != len( items ) )
+        self._rows       = rows
+
+        return rows
+
+#-------------------------------------------------------------------------------
+#  'RowChanges' class:
+#-------------------------------------------------------------------------------
+
+class RowChanges ( object ):
+    """ Collects the rows of a table which have changed, and reports them as
+        blocks of contiguous rows when they are flushed. A flush is requested
+        (using the *schedule* callable, which is passed the flush method) when
+        the first change is added, so that all of the changes made before the
+        flush occurs are reported together.
+
+        The *update* callable is called with a list of ( first_row, last_row )
+        tuples, or with None if more than *max_rows* rows changed (in which
+        case the whole table should be refreshed).
+    """
+
+    def __init__ ( self, update, schedule, max_rows = 1000 ):
+        self.update    = update
+        self.schedule  = schedule
+        self.max_rows  = max_rows
+        self._rows     = set()
+        self._all      = False
+        self._pending  = False
+
+    def add ( self, row ):
+        """ Adds a changed row (or all rows if *row* is None).
+        """
+        if not self._all:
+            if (row is None) or (len( self._rows ) >= self.max_rows):
+                self._all = True
+                self._rows.clear()
+            else:
+                self._rows.add( row )
+
+        if not self._pending:
+            self._pending = True
+            self.schedule( self.flush )
+
+    def flush ( self ):
+        """ Reports all of the changes added since the last flush.
+        """
+        if not self._pending:
+            return
+
+        rows, self._rows = self._rows, set()
+        all,  self._all  = self._all, False
+        self._pending    = False
+
+        if all:
+            self.update( None )
+        elif len( rows ) > 0:
+            self.update( row_blocks( rows ) )
+
+    def reset ( self ):
+        """ Discards all pending changes.
+        """
+        self._rows.clear()
+        self._all     = False
+        self._pending = False
+
+#-------------------------------------------------------------------------------
+#  Returns the blocks of contiguous rows in a collection of row indices:
+#-------------------------------------------------------------------------------
+
+def row_blocks ( rows ):
+    """ Returns a list of ( first_row, last_row ) tuples describing the blocks
+        of contiguous rows contained in a collection of row indices.
+    """
+    blocks = []
+    first  = last = None
+    for row in sorted( rows ):
+        if (last is not None) and (row == (last + 1)):
+            last = row
+        else:
+            if last is not None:
+                blocks.append( ( first, last ) )
+            first = last = row
+
+    if last is not None:
+        blocks.append( ( first, last ) )
+
+    return blocks
+
+#-------------------------------------------------------------------------------
+#  Matches the items of a new list against those of an old list by identity:
+#-------------------------------------------------------------------------------
+
+def match_items ( old, new ):
+    """ Matches the items of a new list against the items of an old list by
+        identity.
+
+        Returns a list containing, for each item of the new list, the index
+        of the matching item in the old list, or -1 if there is no match.
+        Each old item is matched at most once, in order.
+    """
+    available = {}
+    for i in xrange( len( old ) - 1, -1, -1 ):
+        available.setdefault( id( old[i] ), [] ).append( i )
+
+    matches = []
+    for item in new:
+        indices = available.get( id( item ) )
+        if indices:
+            matches.append( indices.pop() )
+        else:
+            matches.append( -1 )
+
+    return matches
+
+#-------------------------------------------------------------------------------
+#  'UIPool' class:
+#-------------------------------------------------------------------------------
+
+class UIPool ( object ):
+    """ A bounded pool of built (but currently unused) user interfaces, keyed
+        by ( view, object class ), which can be re-targeted at a new context
+        instead of building a new user interface.
+
+        Once the pool holds more than *size* user interfaces, the least
+        recently used ones are disposed of.
+    """
+
+    def __init__ ( self, size = 8 ):
+        self.size   = size
+        self.hits   = 0
+        self.misses = 0
+        self._uis   = OrderedDict()
+
+    def get ( self, key, context ):
+        """ Removes the user interface for *key* from the pool, re-targets it
+            at *context* and returns it. Returns None if there is no such user
+            interface, or if it cannot be re-targeted.
+        """
+        ui = self._uis.pop( key, None )
+        if ui is not None:
+            if ui.retarget( context ):
+                self.hits += 1
+
+                return ui
+
+            ui.dispose()
+
+        self.misses += 1
+
+        return None
+
+    def add ( self, key, ui ):
+        """ Adds a no longer used user interface to the pool, disposing of any
+            user interfaces it displaces.
+        """
+        old = self._uis.pop( key, None )
+        if old is not None:
+            old.dispose()
+
+        self._uis[ key ] = ui
+        while len( self._uis ) > max( self.size, 0 ):
+            self._uis.popitem( last = False )[1].dispose()
+
+    def clear ( self ):
+        """ Disposes of all of the user interfaces in the pool.
+        """
+        while len( self._uis ) > 0:
+            self._uis.popitem( last = False )[1].dispose()
+
+    def __len__ ( self ):
+        return len( self._uis )
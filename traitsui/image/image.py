@@ -15,6 +15,7 @@
 """
 
 import sys
+from cPickle import dumps, loads, HIGHEST_PROTOCOL
 from os import (environ, listdir, remove, stat, makedirs, rename, access,
                 R_OK, W_OK, X_OK)
 from os.path import (join, isdir, isfile, splitext, abspath, dirname,
@@ -23,7 +24,7 @@ from stat import ST_MTIME
 from platform import system
 from zipfile import is_zipfile, ZipFile, ZIP_DEFLATED
 from time import time, sleep, localtime, strftime
-from thread import allocate_lock
+from thread import allocate_lock, get_ident
 from threading import Thread
 
 from traits.api import (HasPrivateTraits, Property, Str, Int, List, Dict,
@@ -34,6 +35,7 @@ from traits.trait_base import get_resource_path, traits_home
 from traitsui.ui_traits import HasMargin, HasBorder, Alignment
 from traitsui.theme import Theme
 from traitsui.toolkit import toolkit
+from traitsui.image.memory_cache import image_memory_cache
 from pyface.api import ImageResource
 from pyface.resource_manager import resource_manager
 from pyface.resource.resource_reference import (ImageReference,
@@ -52,6 +54,19 @@ image_cache_path = join( traits_home(), 'image_cache' )
 # Names of files that should not be copied when ceating a new library copy:
 dont_copy_list = ( 'image_volume.py', 'image_info.py', 'license.txt' )
 
+# The file containing the index of the image volumes found in the libraries:
+image_index_path = join( image_cache_path, 'image_volumes.idx' )
+
+# The version of the image volume index file format:
+ImageIndexVersion = 1
+
+# The ImageVolume, ImageVolumeInfo and ImageInfo traits saved in the index:
+IndexVolumeTraits = ( 'category', 'keywords', 'aliases', 'time_stamp' )
+IndexInfoTraits   = ( 'description', 'copyright', 'license', 'image_names' )
+IndexImageTraits  = ( 'name', 'image_name', 'description', 'category',
+                      'keywords', 'width', 'height', 'alignment' )
+IndexMarginTraits = ( 'border', 'content', 'label' )
+
 #-- Code Generation Templates ----------------------------------------------
 
 # Template for creating an ImageVolumeInfo object:
@@ -210,56 +225,78 @@ def join_image_name ( volume_name, file_name ):
     return '@%s:%s' % ( volume_name, file_name )
 
 #-------------------------------------------------------------------------------
-#  'FastZipFile' class:
+#  'ZipFilePool' class:
 #-------------------------------------------------------------------------------
 
-class FastZipFile ( HasPrivateTraits ):
-    """ Provides fast access to zip files by keeping the underlying zip file
-        open across multiple uses.
+class ZipFilePool ( HasPrivateTraits ):
+    """ Manages the open zip files used by all FastZipFile objects. Each
+        thread reading a zip file gets its own handle, so that reads from
+        different threads do not have to wait for each other. A single reaper
+        thread closes the handles which have not been used for
+        **idle_timeout** seconds.
     """
 
-    # The path to the zip file:
-    path = File
-
-    # The open zip file object (if None, the file is closed):
-    zf = Property
-
-    # The time stamp of when the zip file was most recently accessed:
-    time_stamp = Float
+    # The number of seconds a zip file handle can be idle before it is closed:
+    idle_timeout = Float( 2.0 )
 
-    # The lock used to manage access to the 'zf' trait between the two threads:
+    # The lock used to manage access to the pool's handles:
     access = Any
 
     #-- Public Methods ---------------------------------------------------------
 
-    def namelist ( self ):
-        """ Returns the names of all files in the top-level zip file directory.
+    def namelist ( self, path ):
+        """ Returns the names of all files in the top-level directory of the
+            zip file specified by **path**.
         """
-        self.access.acquire()
+        handle = self._acquire( path )
         try:
-            return self.zf.namelist()
+            return handle[0].namelist()
         finally:
-            self.access.release()
+            self._release( path, handle )
 
-    def read ( self, file_name ):
+    def read ( self, path, file_name ):
         """ Returns the contents of the specified **file_name** from the zip
-            file.
+            file specified by **path**.
         """
-        self.access.acquire()
+        handle = self._acquire( path )
         try:
-            return self.zf.read( file_name )
+            return handle[0].read( file_name )
         finally:
-            self.access.release()
+            self._release( path, handle )
 
-    def close ( self ):
-        """ Temporarily closes the zip file (usually while the zip file is being
-            replaced by a different version).
+    def read_many ( self, path, file_names ):
+        """ Returns a list containing the contents of each of the specified
+            **file_names** from the zip file specified by **path**.
+        """
+        handle = self._acquire( path )
+        try:
+            read = handle[0].read
+
+            return [ read( file_name ) for file_name in file_names ]
+        finally:
+            self._release( path, handle )
+
+    def is_open ( self, path ):
+        """ Returns whether any handles for the zip file specified by **path**
+            are currently open.
         """
+        return (self._handles is not None) and (path in self._handles)
+
+    def close ( self, path ):
+        """ Closes all handles for the zip file specified by **path** (usually
+            while the zip file is being replaced by a different version).
+            Handles which are in use are closed as soon as they are released.
+        """
+        if self._handles is None:
+            # No zip file has been opened yet:
+            return
+
         self.access.acquire()
         try:
-            if self._zf is not None:
-                self._zf.close()
-                self._zf = None
+            handles = self._handles.pop( path, {} )
+            for handle in handles.itervalues():
+                if not handle[2]:
+                    handle[0].close()
         finally:
             self.access.release()
 
@@ -268,39 +305,124 @@ class FastZipFile ( HasPrivateTraits ):
     def _access_default ( self ):
         return allocate_lock()
 
-    #-- Property Implementations -----------------------------------------------
+    #-- Private Methods --------------------------------------------------------
 
-    def _get_zf ( self ):
-        # Restart the time-out:
-        self.time_stamp = time()
+    def _acquire ( self, path ):
+        """ Returns the handle, a list of the form: [ zip_file, time_stamp,
+            in_use ], of the calling thread for the zip file specified by
+            **path**, opening the zip file if necessary.
+        """
+        thread_id = get_ident()
 
-        if self._zf is None:
-            self._zf = ZipFile( self.path, 'r' )
+        self.access.acquire()
+        try:
+            if self._handles is None:
+                self._handles = {}
+
+            handles = self._handles.setdefault( path, {} )
+            handle  = handles.get( thread_id )
+            if handle is not None:
+                handle[2] = True
+
+                return handle
+        finally:
+            self.access.release()
+
+        # Open the zip file outside of the lock, so other threads can continue
+        # reading while it is being opened:
+        handle = [ ZipFile( path, 'r' ), time(), True ]
+
+        self.access.acquire()
+        try:
+            self._handles.setdefault( path, {} )[ thread_id ] = handle
             if self._running is None:
-                Thread( target = self._process ).start()
+                reaper = Thread( target = self._process )
+                reaper.setDaemon( True )
+                reaper.start()
                 self._running = True
+        finally:
+            self.access.release()
 
-        return self._zf
+        return handle
 
-    #-- Private Methods --------------------------------------------------------
+    def _release ( self, path, handle ):
+        """ Releases a handle returned by *_acquire*.
+        """
+        self.access.acquire()
+        try:
+            handle[1] = time()
+            handle[2] = False
+
+            # Close the handle if the zip file was closed while it was in use:
+            handles = self._handles.get( path )
+            if (handles is None) or (handles.get( get_ident() ) is not handle):
+                handle[0].close()
+        finally:
+            self.access.release()
 
     def _process ( self ):
-        """ Waits until the zip file has not been accessed for a while, then
-            closes the file and exits.
+        """ Closes each zip file handle which has not been used for a while,
+            and exits when there are no handles left.
         """
         while True:
-            sleep( 1 )
+            sleep( min( self.idle_timeout, 1.0 ) )
             self.access.acquire()
-            if time() > (self.time_stamp + 2.0):
-                if self._zf is not None:
-                    self._zf.close()
-                    self._zf = None
-
-                self._running = None
+            try:
+                expired = time() - self.idle_timeout
+                for path, handles in self._handles.items():
+                    for thread_id, handle in handles.items():
+                        if (not handle[2]) and (handle[1] < expired):
+                            handle[0].close()
+                            del handles[ thread_id ]
+
+                    if len( handles ) == 0:
+                        del self._handles[ path ]
+
+                if len( self._handles ) == 0:
+                    self._running = None
+                    break
+            finally:
                 self.access.release()
-                break
 
-            self.access.release()
+# Create the singleton zip file pool:
+zip_file_pool = ZipFilePool()
+
+#-------------------------------------------------------------------------------
+#  'FastZipFile' class:
+#-------------------------------------------------------------------------------
+
+class FastZipFile ( HasPrivateTraits ):
+    """ Provides fast access to zip files by keeping the underlying zip file
+        open across multiple uses (using the shared zip file pool).
+    """
+
+    # The path to the zip file:
+    path = File
+
+    #-- Public Methods ---------------------------------------------------------
+
+    def namelist ( self ):
+        """ Returns the names of all files in the top-level zip file directory.
+        """
+        return zip_file_pool.namelist( self.path )
+
+    def read ( self, file_name ):
+        """ Returns the contents of the specified **file_name** from the zip
+            file.
+        """
+        return zip_file_pool.read( self.path, file_name )
+
+    def read_many ( self, file_names ):
+        """ Returns a list containing the contents of each of the specified
+            **file_names** from the zip file.
+        """
+        return zip_file_pool.read_many( self.path, file_names )
+
+    def close ( self ):
+        """ Temporarily closes the zip file (usually while the zip file is being
+            replaced by a different version).
+        """
+        zip_file_pool.close( self.path )
 
 #-------------------------------------------------------------------------------
 #  'ImageInfo' class:
@@ -616,9 +738,10 @@ class ImageVolume ( HasPrivateTraits ):
 
             # Copy all of the image files from the current zip file to the new
             # zip file:
-            for name in cur_zf.namelist():
-                if name not in dont_copy_list:
-                    new_zf.writestr( name, cur_zf.read( name ) )
+            names = [ name for name in cur_zf.namelist()
+                      if name not in dont_copy_list ]
+            for name, data in zip( names, cur_zf.read_many( names ) ):
+                new_zf.writestr( name, data )
 
             # Temporarily close the current zip file while we replace it with
             # the new version:
@@ -689,12 +812,13 @@ class ImageVolume ( HasPrivateTraits ):
                           file_name        = file_name )
             else:
                 # Otherwise, create a cache file reference:
-                ref = ImageReference( resource_manager.resource_factory,
-                                      filename = cache_file )
+                ref = VolumeImageReference( resource_manager.resource_factory,
+                                            cache_file, self.name, file_name )
         else:
             # Otherwise, create a normal file reference:
-            ref = ImageReference( resource_manager.resource_factory,
-                                  filename = join( self.path, file_name ) )
+            ref = VolumeImageReference( resource_manager.resource_factory,
+                                        join( self.path, file_name ),
+                                        self.name, file_name )
 
         # Create the ImageResource object using the reference (note that the
         # ImageResource class will not allow us to specify the reference in the
@@ -734,8 +858,24 @@ class ImageVolume ( HasPrivateTraits ):
         return [ ImageVolumeInfo() ]
 
     def _images_default ( self ):
+        indexed_images = self._indexed_images
+        if indexed_images is not None:
+            # Use the image information saved in the image volume index:
+            self._indexed_images = None
+            images = [ ImageInfo( volume = self, **traits )
+                       for traits in indexed_images ]
+            images.sort( key = lambda item: item.image_name )
+
+            return images
+
         return self._load_image_info()
 
+    def _zip_file_default ( self ):
+        if self.is_zip_file and (self.path != ''):
+            return FastZipFile( path = self.path )
+
+        return None
+
     #-- Property Implementations -----------------------------------------------
 
     @cached_property
@@ -885,7 +1025,15 @@ class ZipFileReference ( ResourceReference ):
     #-- ResourceReference Interface Implementation -----------------------------
 
     def load ( self ):
-        """ Loads the resource.
+        """ Loads the resource (using the image memory cache).
+        """
+        return image_memory_cache.image_for(
+                   ( self.volume_name, self.file_name, None ), self._load )
+
+    #-- Private Methods --------------------------------------------------------
+
+    def _load ( self ):
+        """ Loads the resource from the zip file or the image cache file.
         """
         # Check if the cache file has already been created:
         cache_file = self.cache_file
@@ -929,6 +1077,153 @@ class ZipFileReference ( ResourceReference ):
 
         return self.cache_file
 
+#-------------------------------------------------------------------------------
+#  'VolumeImageReference' class:
+#-------------------------------------------------------------------------------
+
+class VolumeImageReference ( ImageReference ):
+    """ A reference to an image file belonging to an image volume, whose
+        decoded image is shared through the image memory cache.
+    """
+
+    # The volume name:
+    volume_name = Str
+
+    # The name of the image file within the volume:
+    file_name = Str
+
+    def __init__ ( self, resource_factory, filename, volume_name, file_name ):
+        super( VolumeImageReference, self ).__init__( resource_factory,
+                                                      filename = filename )
+        self.volume_name = volume_name
+        self.file_name   = file_name
+
+    #-- ResourceReference Interface Implementation -----------------------------
+
+    def load ( self ):
+        """ Loads the resource (using the image memory cache).
+        """
+        return image_memory_cache.image_for(
+                   ( self.volume_name, self.file_name, None ),
+                   super( VolumeImageReference, self ).load )
+
+#-------------------------------------------------------------------------------
+#  'ImageVolumeIndex' class:
+#-------------------------------------------------------------------------------
+
+class ImageVolumeIndex ( HasPrivateTraits ):
+    """ A persistent index of the volumes, images and aliases contained in
+        image volume zip files, which allows an ImageVolume to be recreated
+        without opening its zip file or executing its manifest code.
+    """
+
+    # The path of the index file:
+    path = File( image_index_path )
+
+    # The index entries (the keys are volume zip file paths, and the values are
+    # tuples of the form: ( mtime, volume_traits, info_traits, image_traits )):
+    volumes = Dict
+
+    # Has the index been modified since it was loaded?
+    modified = Bool( False )
+
+    #-- Public Methods ---------------------------------------------------------
+
+    def volume_for ( self, path ):
+        """ Returns an ImageVolume object for the volume zip file specified by
+            **path**, or None if the file is not indexed or has been modified
+            since it was indexed.
+        """
+        entry = self.volumes.get( path )
+        if entry is None:
+            return None
+
+        mtime, volume_traits, info_traits, image_traits = entry
+        try:
+            if stat( path )[ ST_MTIME ] != mtime:
+                return None
+        except OSError:
+            return None
+
+        volume = ImageVolume(
+            name = splitext( basename( path ) )[0],
+            path = path,
+            info = [ ImageVolumeInfo( **traits ) for traits in info_traits ],
+            **volume_traits )
+        volume._indexed_images = image_traits
+
+        return volume
+
+    def add ( self, volume ):
+        """ Adds (or updates) the index entry for the specified ImageVolume.
+        """
+        volume_traits = dict( [ ( name, getattr( volume, name ) )
+                                for name in IndexVolumeTraits ] )
+        for name in ( 'keywords', 'aliases' ):
+            volume_traits[ name ] = list( volume_traits[ name ] )
+
+        info_traits = []
+        for info in volume.info:
+            traits = info.get( *IndexInfoTraits )
+            traits[ 'image_names' ] = list( traits[ 'image_names' ] )
+            info_traits.append( traits )
+
+        # Only save image traits which have actually been set, so that indexing
+        # a volume never causes its images to be loaded:
+        image_traits = []
+        for image in volume.images:
+            values = image.__dict__
+            traits = {}
+            for name in IndexImageTraits:
+                if name in values:
+                    traits[ name ] = values[ name ]
+
+            for name in IndexMarginTraits:
+                if name in values:
+                    margin = values[ name ]
+                    traits[ name ] = ( margin.left, margin.right, margin.top,
+                                       margin.bottom )
+
+            if 'keywords' in traits:
+                traits[ 'keywords' ] = list( traits[ 'keywords' ] )
+
+            image_traits.append( traits )
+
+        self.volumes[ volume.path ] = ( stat( volume.path )[ ST_MTIME ],
+                                        volume_traits, info_traits,
+                                        image_traits )
+        self.modified = True
+
+    def save ( self ):
+        """ Saves the index (if it has been modified). Failing to save the
+            index is not an error, since it will simply be rebuilt later.
+        """
+        if not self.modified:
+            return
+
+        try:
+            index_dir = dirname( self.path )
+            if not exists( index_dir ):
+                makedirs( index_dir )
+
+            write_file( self.path, dumps( ( ImageIndexVersion, self.volumes ),
+                                          HIGHEST_PROTOCOL ) )
+            self.modified = False
+        except ( IOError, OSError ):
+            pass
+
+    #-- Default Value Implementations ------------------------------------------
+
+    def _volumes_default ( self ):
+        try:
+            version, volumes = loads( read_file( self.path ) )
+            if version == ImageIndexVersion:
+                return volumes
+        except:
+            pass
+
+        return {}
+
 #-------------------------------------------------------------------------------
 #  'ImageLibrary' class:
 #-------------------------------------------------------------------------------
@@ -947,6 +1242,10 @@ class ImageLibrary ( HasPrivateTraits ):
     # The list of available images in the library:
     images = Property( List, depends_on = 'volumes.images' )
 
+    # The index used to find the contents of image volumes without opening
+    # them:
+    index = Instance( ImageVolumeIndex, () )
+
     #-- Private Traits ---------------------------------------------------------
 
     # Mapping from a 'virtual' library name to a 'real' library name:
@@ -1023,6 +1322,7 @@ class ImageLibrary ( HasPrivateTraits ):
 
             self.catalog[ volume.name ] = volume
             self.volumes.append( volume )
+            self.index.save()
 
         elif isdir( file_name ):
             # Load all image volumes from the specified path:
@@ -1035,6 +1335,7 @@ class ImageLibrary ( HasPrivateTraits ):
                 catalog[ volume.name ] = volume
 
             self.volumes.extend( volumes )
+            self.index.save()
         else:
             # Handle an unrecognized argument:
             raise TraitError( "The add method argument must be None or a file "
@@ -1220,6 +1521,9 @@ class ImageLibrary ( HasPrivateTraits ):
             for path in paths.split( separator ):
                 result.extend( self._add_path( path ) )
 
+        # Save any volumes added to the image volume index:
+        self.index.save()
+
         # Return the list of default volumes found:
         return result
 
@@ -1277,6 +1581,13 @@ class ImageLibrary ( HasPrivateTraits ):
         """
         path = abspath( path )
 
+        # Check if the volume can be recreated from the image volume index:
+        volume = self.index.volume_for( path )
+        if volume is not None:
+            self._add_aliases( volume )
+
+            return volume
+
         # Make sure the path is a valid zip file:
         if is_zipfile( path ):
 
@@ -1322,6 +1633,9 @@ class ImageLibrary ( HasPrivateTraits ):
                 # require write access to the volume:
                 volume.save()
 
+            # Add the volume to the image volume index:
+            self.index.add( volume )
+
             # Return the volume:
             return volume
 
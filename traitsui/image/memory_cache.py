@@ -0,0 +1,191 @@
+#-------------------------------------------------------------------------------
+#
+#  Copyright (c) 2013, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in enthought/LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+#
+#-------------------------------------------------------------------------------
+
+""" Defines the ImageMemoryCache object used to share decoded toolkit images
+    between all of the Traits UI editors which display them.
+"""
+
+#-------------------------------------------------------------------------------
+#  Imports:
+#-------------------------------------------------------------------------------
+
+from collections import OrderedDict
+
+from thread import allocate_lock
+
+from traitsui.toolkit import toolkit
+
+#-------------------------------------------------------------------------------
+#  Constants:
+#-------------------------------------------------------------------------------
+
+# The default number of bytes of decoded image data the cache can hold:
+DefaultBudget = 32 * 1024 * 1024
+
+# The number of bytes assumed for each pixel of a decoded image:
+BytesPerPixel = 4
+
+# The number of bytes assumed for an image whose size cannot be determined
+# (that of a 32x32 pixel image):
+UnknownImageBytes = 32 * 32 * BytesPerPixel
+
+#-------------------------------------------------------------------------------
+#  'ImageMemoryCache' class:
+#-------------------------------------------------------------------------------
+
+class ImageMemoryCache ( object ):
+    """ A cache of decoded toolkit images, keyed by tuples of the form:
+        ( volume, name, size ), where *size* is None for an image decoded at
+        its natural size. When the total size of the cached images exceeds
+        the byte **budget**, the least recently used images are evicted.
+
+        The same image object is returned to every caller requesting it, so
+        callers must not modify the images returned by the cache (an image
+        which needs to be changed should be copied first).
+    """
+
+    def __init__ ( self, budget = DefaultBudget ):
+        self._images    = OrderedDict()
+        self._access    = allocate_lock()
+        self._budget    = budget
+        self.bytes      = 0
+        self.hits       = 0
+        self.misses     = 0
+        self.evictions  = 0
+
+    #-- Public Methods ---------------------------------------------------------
+
+    def get ( self, key ):
+        """ Returns the cached image for the specified key, or None if it is
+            not in the cache. The returned image is shared, and must not be
+            modified.
+        """
+        self._access.acquire()
+        try:
+            entry = self._images.pop( key, None )
+            if entry is None:
+                self.misses += 1
+
+                return None
+
+            # Move the image to the most recently used end of the cache:
+            self._images[ key ] = entry
+            self.hits += 1
+
+            return entry[0]
+        finally:
+            self._access.release()
+
+    def add ( self, key, image, nbytes = None ):
+        """ Adds an image to the cache for the specified key, evicting the
+            least recently used images if the cache is over budget.
+        """
+        if nbytes is None:
+            nbytes = image_bytes( image )
+
+        self._access.acquire()
+        try:
+            old = self._images.pop( key, None )
+            if old is not None:
+                self.bytes -= old[1]
+
+            if nbytes <= self._budget:
+                self._images[ key ] = ( image, nbytes )
+                self.bytes += nbytes
+
+            self._evict()
+        finally:
+            self._access.release()
+
+    def image_for ( self, key, create ):
+        """ Returns the cached image for the specified key, calling the
+            **create** function to decode (and cache) it if necessary.
+        """
+        image = self.get( key )
+        if image is None:
+            image = create()
+            if image is not None:
+                self.add( key, image )
+
+        return image
+
+    def clear ( self ):
+        """ Removes all images from the cache.
+        """
+        self._access.acquire()
+        try:
+            self._images.clear()
+            self.bytes = 0
+        finally:
+            self._access.release()
+
+    def stats ( self ):
+        """ Returns a dictionary describing the current cache usage.
+        """
+        return {
+            'count':     len( self._images ),
+            'bytes':     self.bytes,
+            'budget':    self._budget,
+            'hits':      self.hits,
+            'misses':    self.misses,
+            'evictions': self.evictions
+        }
+
+    #-- Property Implementations -----------------------------------------------
+
+    def _get_budget ( self ):
+        return self._budget
+
+    def _set_budget ( self, budget ):
+        self._access.acquire()
+        try:
+            self._budget = budget
+            self._evict()
+        finally:
+            self._access.release()
+
+    # The maximum number of bytes of decoded image data the cache can hold:
+    budget = property( _get_budget, _set_budget )
+
+    #-- Private Methods --------------------------------------------------------
+
+    def _evict ( self ):
+        """ Evicts the least recently used images until the cache is within
+            its byte budget.
+        """
+        images = self._images
+        while (self.bytes > self._budget) and (len( images ) > 0):
+            key, ( image, nbytes ) = images.popitem( last = False )
+            self.bytes     -= nbytes
+            self.evictions += 1
+
+#-------------------------------------------------------------------------------
+#  Returns the approximate number of bytes used by a decoded toolkit image:
+#-------------------------------------------------------------------------------
+
+def image_bytes ( image ):
+    """ Returns the approximate number of bytes used by a decoded toolkit
+        image.
+    """
+    try:
+        width, height = toolkit().image_size( image )
+    except Exception:
+        # Still charge the image against the budget, so that images of an
+        # unknown size cannot grow the cache without limit:
+        return UnknownImageBytes
+
+    return width * height * BytesPerPixel
+
+# Create the singleton image memory cache:
+image_memory_cache = ImageMemoryCache()
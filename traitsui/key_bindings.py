@@ -40,6 +40,24 @@ from traits.trait_base import SequenceTypes
 # Trait definition for key bindings
 Binding = Str( event = 'binding', editor = KeyBindingEditor() )
 
+#-------------------------------------------------------------------------------
+#  Data:
+#-------------------------------------------------------------------------------
+
+# Incremented whenever any key binding or KeyBindings tree is modified, so
+# that the compiled dispatch tables of all KeyBindings objects (which can
+# include the bindings of their children) know when to be rebuilt:
+_generation = 0
+
+#-------------------------------------------------------------------------------
+#  Marks all compiled dispatch tables as out of date:
+#-------------------------------------------------------------------------------
+
+def _bindings_modified ( ):
+    global _generation
+
+    _generation += 1
+
 #-------------------------------------------------------------------------------
 #  'KeyBinding' class:
 #-------------------------------------------------------------------------------
@@ -85,6 +103,7 @@ class KeyBinding ( HasStrictTraits ):
     #---------------------------------------------------------------------------
 
     def _binding_changed ( self ):
+        _bindings_modified()
         if self.owner is not None:
             self.owner.binding_modified = self
 
@@ -161,6 +180,7 @@ class KeyBindings ( HasPrivateTraits ):
                                                       maxlen = n,
                                                       mode   = 'list' ) )
         self.bindings = [ binding.set( owner = self ) for binding in bindings ]
+        _bindings_modified()
 
     #---------------------------------------------------------------------------
     #  Processes a keyboard event:
@@ -219,6 +239,7 @@ class KeyBindings ( HasPrivateTraits ):
         del self.controllers
         del self.children
         del self.bindings
+        _bindings_modified()
 
         self.parent = self._root = self.focus_owner = None
 
@@ -266,6 +287,7 @@ class KeyBindings ( HasPrivateTraits ):
     def _binding_modified_changed ( self, binding ):
         """ Handles a binding being changed.
         """
+        _bindings_modified()
         binding1 = binding.binding1
         binding2 = binding.binding2
         for a_binding in self.bindings:
@@ -289,6 +311,7 @@ class KeyBindings ( HasPrivateTraits ):
     def _children_modified ( self, removed, added ):
         """ Handles child KeyBindings being added to the object.
         """
+        _bindings_modified()
         for item in added:
             item.parent = self
 
@@ -305,6 +328,7 @@ class KeyBindings ( HasPrivateTraits ):
         self.add_trait( 'bindings', List( KeyBinding, minlen = n, maxlen = n ) )
         self.__dict__.update( state )
         self.bindings = self.bindings[:]
+        _bindings_modified()
 
     #-- Private Methods --------------------------------------------------------
 
@@ -317,31 +341,58 @@ class KeyBindings ( HasPrivateTraits ):
 
         return bindings
 
+    def _get_tree ( self, nodes ):
+        """ Returns this object and all of its descendants, in the order their
+            bindings are searched.
+        """
+        nodes.append( self )
+        for child in self.children:
+            child._get_tree( nodes )
+
+        return nodes
+
+    def _dispatch_table ( self, recursive ):
+        """ Returns the dictionary mapping each key name to the list of
+            ( KeyBindings, KeyBinding ) pairs bound to it, in search order,
+            for this object (and all of its children if *recursive*).
+            The table is only rebuilt when a binding or child is modified.
+        """
+        if self._tables_generation != _generation:
+            self._tables            = {}
+            self._tables_generation = _generation
+
+        table = self._tables.get( recursive )
+        if table is None:
+            table = self._tables[ recursive ] = {}
+            nodes = self._get_tree( [] ) if recursive else [ self ]
+            for node in nodes:
+                for binding in node.bindings:
+                    for key_name in set( ( binding.binding1,
+                                           binding.binding2 ) ):
+                        if key_name != '':
+                            table.setdefault( key_name, [] ).append(
+                                ( node, binding ) )
+
+        return table
+
     def _do ( self, key_name, controllers, args, recursive ):
         """ Process the specified key for the specified set of controllers for
-            this KeyBindings object and all of its children.
+            this KeyBindings object and (if *recursive*) all of its children.
         """
-        # Search through our own bindings for a match:
-        for binding in self.bindings:
-            if (key_name == binding.binding1) or (key_name == binding.binding2):
-                method_name = '%s%s%s' % (
-                              self.prefix, binding.method_name, self.suffix )
-                for controller in (controllers + self.controllers):
-                    method = getattr( controller, method_name, None )
-                    if method is not None:
-                        result = method( *args )
-                        if result is not False:
-                            return True
-
-                if binding.method_name == 'edit_bindings':
-                    self.edit()
-                    return True
-
-        # If recursive, continue searching through a children's bindings:
-        if recursive:
-            for child in self.children:
-                if child._do( key_name, controllers, args, recursive ):
-                    return True
+        for node, binding in self._dispatch_table( recursive ).get( key_name,
+                                                                    () ):
+            method_name = '%s%s%s' % (
+                          node.prefix, binding.method_name, node.suffix )
+            for controller in (controllers + node.controllers):
+                method = getattr( controller, method_name, None )
+                if method is not None:
+                    result = method( *args )
+                    if result is not False:
+                        return True
+
+            if binding.method_name == 'edit_bindings':
+                node.edit()
+                return True
 
         # Indicate no one processed the key:
         return False
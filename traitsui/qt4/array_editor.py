@@ -24,12 +24,18 @@
 # FIXME: ToolkitEditorFactory is a proxy class defined here just for backward
 # compatibility. The class has been moved to the
 # traitsui.editors.array_editor file.
+from pyface.qt import QtGui
+
 from traitsui.editors.array_editor \
-    import SimpleEditor as BaseSimpleEditor, ToolkitEditorFactory
+    import SimpleEditor as BaseSimpleEditor, ToolkitEditorFactory, ArrayGrid, \
+    ArrayCellUndoItem
 
 from editor \
     import Editor
 
+from array_model \
+    import ArrayModel
+
 #-------------------------------------------------------------------------------
 #  'SimpleEditor' class:
 #-------------------------------------------------------------------------------
@@ -51,4 +57,105 @@ class ReadonlyEditor(SimpleEditor):
     # Set the value of the readonly trait.
     readonly = True
 
+#-------------------------------------------------------------------------------
+#  'GridEditor' class:
+#-------------------------------------------------------------------------------
+
+class GridEditor ( Editor ):
+    """ Editor for large or structured arrays, which displays the array in a
+        virtual grid whose cells are read from, and edited directly in, the
+        array buffer.
+    """
+
+    # Is the editor read-only?
+    readonly = False
+
+    # Is the grid editor scrollable? This value overrides the default.
+    scrollable = True
+
+    # The ( row, column, old_value, new_value ) of the cell being edited
+    _cell = None
+
+    #---------------------------------------------------------------------------
+    #  Finishes initializing the editor by creating the underlying toolkit
+    #  widget:
+    #---------------------------------------------------------------------------
+
+    def init ( self, parent ):
+        """ Finishes initializing the editor by creating the underlying toolkit
+            widget.
+        """
+        self._model  = ArrayModel( self, ArrayGrid( self.value,
+                                                    self.string_value ) )
+        self.control = control = QtGui.QTableView()
+        control.setModel( self._model )
+        control.setAlternatingRowColors( True )
+        control.verticalHeader().setDefaultSectionSize(
+            control.fontMetrics().height() + 4 )
+
+    #---------------------------------------------------------------------------
+    #  Updates the editor when the object trait changes external to the editor:
+    #---------------------------------------------------------------------------
+
+    def update_editor ( self ):
+        """ Updates the editor when the object trait changes externally to the
+            editor.
+        """
+        if not self._busy:
+            self._model.set_array( self.value )
+
+    #---------------------------------------------------------------------------
+    #  Handles a cell of the array being edited:
+    #---------------------------------------------------------------------------
+
+    def array_changed ( self, row, column, old_value, new_value ):
+        """ Handles a cell of the array being modified in place by an edit,
+            recording the change in the undo history.
+        """
+        self.ui.do_undoable( self._array_changed, row, column, old_value,
+                             new_value )
+
+    def _array_changed ( self, row, column, old_value, new_value ):
+        """ Notifies listeners of the trait that the array has been modified
+            in place by an edit.
+        """
+        self._cell = ( row, column, old_value, new_value )
+        self._busy = True
+        try:
+            value = self.value
+            self.object.trait_property_changed( self.name, value, value )
+        finally:
+            self._busy = False
+            self._cell = None
+
+    #---------------------------------------------------------------------------
+    #  Creates an undo history entry:
+    #---------------------------------------------------------------------------
+
+    def get_undo_item ( self, object, name, old_value, new_value ):
+        """ Creates an undo history entry, which records just the edited cell
+            when the array has been modified in place by an edit.
+        """
+        cell = self._cell
+        if cell is None:
+            return super( GridEditor, self ).get_undo_item(
+                              object, name, old_value, new_value )
+
+        row, column, old_cell, new_cell = cell
+        return ArrayCellUndoItem( object    = object,
+                                  name      = name,
+                                  row       = row,
+                                  column    = column,
+                                  old_value = old_cell,
+                                  new_value = new_cell )
+
+#-------------------------------------------------------------------------------
+#  'ReadonlyGridEditor' class:
+#-------------------------------------------------------------------------------
+
+class ReadonlyGridEditor ( GridEditor ):
+
+    # Set the value of the readonly trait.
+    readonly = True
+
 ### EOF #######################################################################
@@ -0,0 +1,195 @@
+#------------------------------------------------------------------------------
+#
+#  Copyright (c) 2013, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in enthought/LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+#
+#------------------------------------------------------------------------------
+
+""" Defines the table model used by the array grid editor.
+"""
+
+#-------------------------------------------------------------------------------
+#  Imports:
+#-------------------------------------------------------------------------------
+
+from pyface.qt import QtCore
+
+#-------------------------------------------------------------------------------
+#  'ArrayModel' class:
+#-------------------------------------------------------------------------------
+
+class ArrayModel(QtCore.QAbstractTableModel):
+    """ A model which presents the cells of an ArrayGrid, reading them from
+        the array only when the view asks for them.
+    """
+
+    def __init__(self, editor, grid, parent=None):
+        """ Initialise the object.
+        """
+        QtCore.QAbstractTableModel.__init__(self, parent)
+
+        self._editor = editor
+        self.grid = grid
+
+    #-- Public Methods ---------------------------------------------------------
+
+    def set_array(self, array):
+        """ Replaces the array presented by the model, resetting the model only
+            if the shape of the grid changed, and otherwise emitting a single
+            change notification covering every cell.
+        """
+        grid = self.grid
+        if grid.set_array(array):
+            self.beginResetModel()
+            self.endResetModel()
+        elif (grid.row_count > 0) and (grid.column_count > 0):
+            self.dataChanged.emit(self.index(0, 0),
+                self.index(grid.row_count - 1, grid.column_count - 1))
+
+    #-- QAbstractItemModel Interface -------------------------------------------
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        """ Reimplemented to return the number of rows of the grid.
+        """
+        if parent.isValid():
+            return 0
+        return self.grid.row_count
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        """ Reimplemented to return the number of columns of the grid.
+        """
+        if parent.isValid():
+            return 0
+        return self.grid.column_count
+
+    def flags(self, index):
+        """ Reimplemented to make the cells editable unless the editor is
+            read-only.
+        """
+        flags = QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable
+        if not self._editor.readonly:
+            flags |= QtCore.Qt.ItemIsEditable
+        return flags
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        """ Reimplemented to read the text of a cell from the array.
+        """
+        if role in (QtCore.Qt.DisplayRole, QtCore.Qt.EditRole):
+            return self.grid.get_text(index.row(), index.column())
+        if role == QtCore.Qt.TextAlignmentRole:
+            return int(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
+        return None
+
+    def setData(self, index, value, role=QtCore.Qt.EditRole):
+        """ Reimplemented to write an edited cell straight into the array.
+        """
+        if role != QtCore.Qt.EditRole:
+            return False
+
+        grid = self.grid
+        row, column = index.row(), index.column()
+        old_value = grid.get_value(row, column)
+        if not grid.set_text(row, column, unicode(value)):
+            return False
+
+        self.dataChanged.emit(index, index)
+        self._editor.array_changed(row, column, old_value,
+                                   grid.get_value(row, column))
+
+        return True
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        """ Reimplemented to return the column names and row indices.
+        """
+        if role != QtCore.Qt.DisplayRole:
+            return None
+        if orientation == QtCore.Qt.Horizontal:
+            return self.grid.column_name(section)
+        return str(section)
+
+#-------------------------------------------------------------------------------
+#  'ArrayViewModel' class:
+#-------------------------------------------------------------------------------
+
+class ArrayViewModel(QtCore.QAbstractTableModel):
+    """ A read-only model which presents the formatted cells of an
+        ArrayViewData, optionally preceded by an index column.
+    """
+
+    def __init__(self, data, titles, show_index=True, parent=None):
+        """ Initialise the object.
+        """
+        QtCore.QAbstractTableModel.__init__(self, parent)
+
+        self.array_data = data
+        self.titles = titles
+        self.show_index = show_index
+
+    #-- Public Methods ---------------------------------------------------------
+
+    def set_array(self, array):
+        """ Replaces the array presented by the model.
+        """
+        data = self.array_data
+        old_shape = (data.row_count, data.column_count)
+        data.set_array(array)
+        if (data.row_count, data.column_count) != old_shape:
+            self.beginResetModel()
+            self.endResetModel()
+        elif (self.rowCount() > 0) and (self.columnCount() > 0):
+            self.dataChanged.emit(self.index(0, 0),
+                self.index(self.rowCount() - 1, self.columnCount() - 1))
+
+    #-- QAbstractItemModel Interface -------------------------------------------
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        """ Reimplemented to return the number of rows of the array view.
+        """
+        if parent.isValid():
+            return 0
+        return self.array_data.row_count
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        """ Reimplemented to return the number of columns of the array view.
+        """
+        if parent.isValid():
+            return 0
+        return self.array_data.column_count + int(self.show_index)
+
+    def flags(self, index):
+        """ Reimplemented to make the cells read-only.
+        """
+        return QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        """ Reimplemented to return the formatted text of a cell.
+        """
+        if role == QtCore.Qt.DisplayRole:
+            column = index.column() - int(self.show_index)
+            if column < 0:
+                return str(index.row())
+            return self.array_data.get_text(index.row(), column)
+        if role == QtCore.Qt.TextAlignmentRole:
+            return int(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
+        return None
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        """ Reimplemented to return the column titles.
+        """
+        if (orientation != QtCore.Qt.Horizontal) or (
+            role != QtCore.Qt.DisplayRole):
+            return None
+
+        column = section - int(self.show_index)
+        if column < 0:
+            return 'Index'
+        if column < len(self.titles):
+            return self.titles[column]
+        return ''
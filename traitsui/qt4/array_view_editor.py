@@ -16,14 +16,70 @@
 #  Imports:
 #-------------------------------------------------------------------------------
 
+from pyface.qt import QtGui
+
 from traitsui.ui_editors.array_view_editor \
-    import _ArrayViewEditor as BaseArrayViewEditor
+    import ArrayViewData, array_view_titles
+
+from editor import Editor
 
-from ui_editor import UIEditor
+from array_model import ArrayViewModel
 
 #-------------------------------------------------------------------------------
 #  '_ArrayViewEditor' class:
 #-------------------------------------------------------------------------------
 
-class _ArrayViewEditor(BaseArrayViewEditor, UIEditor):
-    pass
+class _ArrayViewEditor(Editor):
+    """ Displays a 1D or 2D array (including memory mapped arrays) in a table
+        whose cells are read from the array and formatted only when visible.
+    """
+
+    # Indicate that the editor is scrollable/resizable:
+    scrollable = True
+
+    #---------------------------------------------------------------------------
+    #  Finishes initializing the editor by creating the underlying toolkit
+    #  widget:
+    #---------------------------------------------------------------------------
+
+    def init(self, parent):
+        """ Finishes initializing the editor by creating the underlying toolkit
+            widget.
+        """
+        factory = self.factory
+        value = self.value
+        data = ArrayViewData(value, factory.format, factory.transpose)
+        self._model = ArrayViewModel(data, self._titles(value),
+                                     factory.show_index)
+
+        self.control = control = QtGui.QTableView()
+        control.setModel(self._model)
+        control.setFont(factory.font)
+        control.verticalHeader().hide()
+        control.verticalHeader().setDefaultSectionSize(
+            control.fontMetrics().height() + 4)
+        if len(factory.titles) == 0:
+            control.horizontalHeader().hide()
+
+    #---------------------------------------------------------------------------
+    #  Updates the editor when the object trait changes external to the editor:
+    #---------------------------------------------------------------------------
+
+    def update_editor(self):
+        """ Updates the editor when the object trait changes externally to the
+            editor.
+        """
+        value = self.value
+        self._model.titles = self._titles(value)
+        self._model.set_array(value)
+
+    #-- Private Methods --------------------------------------------------------
+
+    def _titles(self, value):
+        """ Returns the titles of the data columns used to display an array.
+        """
+        titles = array_view_titles(value.shape, self.factory.titles,
+                                   self.factory.transpose)
+        if len(value.shape) == 1:
+            titles = titles[:1] or ['Data']
+        return titles
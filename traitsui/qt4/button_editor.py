@@ -28,6 +28,8 @@ from traitsui.editors.button_editor \
 
 from editor import Editor
 
+from helper import icon_cache
+
 #-------------------------------------------------------------------------------
 #  'SimpleEditor' class:
 #-------------------------------------------------------------------------------
@@ -64,8 +66,7 @@ class SimpleEditor ( Editor ):
             self.control = QtGui.QToolButton()
             self.control.toolButtonStyle = QtCore.Qt.ToolButtonTextOnly
             self.control.setText(self.string_value(label))
-            self.object.on_trait_change(self._update_menu, self.factory.values_trait)
-            self.object.on_trait_change(self._update_menu, self.factory.values_trait + "_items")
+            self._menu_listeners(False)
             self._menu = QtGui.QMenu()
             self._update_menu()
             self.control.setMenu(self._menu)
@@ -80,6 +81,36 @@ class SimpleEditor ( Editor ):
         self.set_tooltip()
 
 
+    def dispose(self):
+        """ Disposes of the contents of an editor.
+        """
+        if self.factory.values_trait:
+            self._menu_listeners(True)
+
+        super(SimpleEditor, self).dispose()
+
+    def retarget(self, remove=False):
+        """ Re-binds the editor (including its menu) to the objects of a new
+            context.
+        """
+        if remove and self.factory.values_trait:
+            self._menu_listeners(True)
+
+        super(SimpleEditor, self).retarget(remove)
+
+        if (not remove) and self.factory.values_trait:
+            self._menu_listeners(False)
+            self._update_menu()
+
+    def _menu_listeners(self, remove):
+        """ Adds/Removes the listeners which keep the menu up to date.
+        """
+        values_trait = self.factory.values_trait
+        self.object.on_trait_change(self._update_menu, values_trait,
+                                    remove=remove)
+        self.object.on_trait_change(self._update_menu,
+                                    values_trait + "_items", remove=remove)
+
     def _label_changed(self, label):
         self.control.setText(self.string_value(label))
 
@@ -149,7 +180,7 @@ class CustomEditor ( SimpleEditor ):
         self.control.setText(self.string_value(factory.label))
 
         if factory.image is not None:
-            self.control.setIcon(factory.image.create_icon())
+            self.control.setIcon(icon_cache(factory.image))
 
         QtCore.QObject.connect(self.control, QtCore.SIGNAL('clicked()'),
                 self.update_object )
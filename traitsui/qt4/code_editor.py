@@ -24,6 +24,8 @@ from traits.api import Str, Unicode, List, Int, Event, Bool, \
     TraitError, on_trait_change
 from traits.trait_base import SequenceTypes
 
+from traitsui.helper import text_delta
+
 # FIXME: ToolkitEditorFactory is a proxy class defined here just for backward
 # compatibility. The class has been moved to the
 # traitsui.editors.code_editor file.
@@ -33,7 +35,7 @@ from pyface.key_pressed_event import KeyPressedEvent
 
 from constants import OKColor, ErrorColor
 from editor import Editor
-from helper import pixmap_cache
+from helper import Debouncer, pixmap_cache
 
 #-------------------------------------------------------------------------------
 #  Constants:
@@ -102,6 +104,10 @@ class SourceEditor ( Editor ):
     # The lexer to use.
     lexer = Str
 
+    # The most recent edit made by the user, as a ( position, removed,
+    # inserted ) tuple:
+    edit = Event
+
     #---------------------------------------------------------------------------
     #  Finishes initializing the editor by creating the underlying toolkit
     #  widget:
@@ -122,9 +128,22 @@ class SourceEditor ( Editor ):
         # Set up listeners for the signals we care about
         code_editor = self._widget.code
         if not self.readonly:
-            code_editor.textChanged.connect(self.update_object)
-            if factory.auto_set:
+            if factory.incremental:
+                # Only report the changed range of each edit, and update the
+                # trait value once the user pauses:
+                self._debouncer = Debouncer(factory.sync_delay,
+                                            self.update_object)
+                code_editor.document().contentsChange.connect(
+                    self._contents_changed)
+            elif factory.auto_set and (factory.auto_set_delay > 0):
+                self._debouncer = Debouncer(factory.auto_set_delay,
+                                            self.update_object)
+                code_editor.textChanged.connect(self._debouncer.trigger)
+            else:
                 code_editor.textChanged.connect(self.update_object)
+
+            if self._debouncer is not None:
+                self._debouncer.watch(code_editor)
         if factory.selected_text != '':
             code_editor.selectionChanged.connect(self._selection_changed)
         if (factory.line != '') or (factory.column != ''):
@@ -141,6 +160,7 @@ class SourceEditor ( Editor ):
         self.sync_value( factory.line, 'line' )
         self.sync_value( factory.column, 'column' )
 
+        self.sync_value( factory.edits, 'edit', 'to' )
         self.sync_value( factory.selected_start_pos, 'selected_start_pos', 'to')
         self.sync_value( factory.selected_end_pos, 'selected_end_pos', 'to')
 
@@ -172,6 +192,9 @@ class SourceEditor ( Editor ):
         QtCore.QObject.disconnect(self._widget, QtCore.SIGNAL('lostFocus'),
                                   self.update_object)
 
+        # Flush any edits not yet copied to the trait:
+        self.flush()
+
         super( SourceEditor, self ).dispose()
 
     #---------------------------------------------------------------------------
@@ -202,9 +225,23 @@ class SourceEditor ( Editor ):
         new_value = self.value
         if isinstance( new_value, SequenceTypes ):
             new_value = '\n'.join( [ line.rstrip() for line in new_value ] )
-        control = self._widget
-        if control.code.toPlainText() != new_value:
-            control.code.setPlainText(new_value)
+        code = self._widget.code
+        if self._debouncer is not None:
+            # The new value replaces any edits not yet copied to the trait:
+            self._debouncer.cancel()
+        old_value = unicode(code.toPlainText())
+        if old_value == '':
+            code.setPlainText(new_value)
+        elif old_value != new_value:
+            # Only replace the range which actually changed, so that the
+            # user's cursor, selection and scroll position are preserved:
+            start, end, text = text_delta(old_value, unicode(new_value))
+            cursor = QtGui.QTextCursor(code.document())
+            cursor.beginEditBlock()
+            cursor.setPosition(start)
+            cursor.setPosition(end, QtGui.QTextCursor.KeepAnchor)
+            cursor.insertText(text)
+            cursor.endEditBlock()
 
             # TODO: check the readonly flag and make sure the editor
             # is still readonly when we're done.
@@ -217,6 +254,28 @@ class SourceEditor ( Editor ):
 
         self._locked = False
 
+    #---------------------------------------------------------------------------
+    #  Handles an edit of the document in incremental mode:
+    #---------------------------------------------------------------------------
+
+    def _contents_changed ( self, position, removed, added ):
+        """ Handles an edit of the document by reporting the changed range
+            and scheduling an update of the trait value.
+        """
+        if self._locked:
+            return
+
+        inserted = u''
+        if added > 0:
+            cursor = QtGui.QTextCursor(self._widget.code.document())
+            cursor.setPosition(position)
+            cursor.setPosition(position + added, QtGui.QTextCursor.KeepAnchor)
+            # Qt uses the paragraph separator for line breaks in selections:
+            inserted = unicode(cursor.selectedText()).replace(u'\u2029', u'\n')
+
+        self.edit = ( position, removed, inserted )
+        self._debouncer.trigger()
+
     #---------------------------------------------------------------------------
     #  Handles an error that occurs while setting the object's trait value:
     #---------------------------------------------------------------------------
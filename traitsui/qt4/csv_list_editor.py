@@ -34,14 +34,20 @@ class SimpleEditor(QtSimpleEditor):
     prepare = _prepare_method
     dispose = _dispose_method
 
+    # The evaluation and formatting functions are specific to the edited
+    # object, so the editor cannot be re-targeted at a new context:
+    retargetable = False
+
 class CustomEditor(QtCustomEditor):
     """ Custom Editor style for CSVListEditor. """
     prepare = _prepare_method
     dispose = _dispose_method
+    retargetable = False
 
 class ReadonlyEditor(QtReadonlyEditor):
     """ Readonly Editor style for CSVListEditor. """
     prepare = _prepare_method
     dispose = _dispose_method
+    retargetable = False
 
 TextEditor = SimpleEditor
@@ -57,6 +57,30 @@ class Editor ( UIEditor ):
         if control is not None:
             control._editor = self
 
+    #---------------------------------------------------------------------------
+    #  Disposes of the contents of an editor:
+    #---------------------------------------------------------------------------
+
+    def dispose ( self ):
+        """ Disposes of the contents of an editor.
+        """
+        if self._debouncer is not None:
+            self._debouncer.dispose()
+            self._debouncer = None
+
+        super( Editor, self ).dispose()
+
+    #---------------------------------------------------------------------------
+    #  Assigns any user input still waiting for the auto_set delay to pass:
+    #---------------------------------------------------------------------------
+
+    def flush ( self ):
+        """ Assigns any user input to the trait which is still waiting for the
+            **auto_set_delay** of the editor factory to pass.
+        """
+        if self._debouncer is not None:
+            self._debouncer.flush()
+
     #---------------------------------------------------------------------------
     #  Assigns focus to the editor's underlying toolkit widget:
     #---------------------------------------------------------------------------
@@ -395,6 +419,11 @@ class Editor ( UIEditor ):
 class EditorWithList ( Editor ):
     """ Editor for an object that contains a list.
     """
+
+    # The editor listens to the edited object itself, so it cannot be
+    # re-targeted at a new context:
+    retargetable = False
+
     #---------------------------------------------------------------------------
     #  Trait definitions:
     #---------------------------------------------------------------------------
@@ -37,7 +37,7 @@ from constants \
     import OKColor, ErrorColor
 
 from traitsui.helper \
-    import enum_values_changed
+    import EnumValues
 
 #-------------------------------------------------------------------------------
 #  'BaseEditor' class:
@@ -60,6 +60,9 @@ class BaseEditor ( Editor ):
     # Current inverse mapping from values to names:
     inverse_mapping = Property
 
+    # The EnumValues holding the current names and mappings:
+    enum = Property
+
     #---------------------------------------------------------------------------
     #  Finishes initializing the editor by creating the underlying toolkit
     #  widget:
@@ -76,6 +79,15 @@ class BaseEditor ( Editor ):
             self.values_changed()
             self._object.on_trait_change( self._values_changed,
                                           ' ' + self._name, dispatch = 'ui' )
+
+            # Changes to the items of a list of values are applied
+            # incrementally:
+            self._items_name = self._name + '_items'
+            if self._object.trait( self._items_name ) is None:
+                self._items_name = None
+            else:
+                self._object.on_trait_change( self._values_items_changed,
+                                    self._items_name, dispatch = 'ui' )
         else:
             factory.on_trait_change( self.rebuild_editor, 'values_modified',
                                      dispatch = 'ui' )
@@ -87,10 +99,7 @@ class BaseEditor ( Editor ):
     def _get_names ( self ):
         """ Gets the current set of enumeration names.
         """
-        if self._object is None:
-            return self.factory._names
-
-        return self._names
+        return self.enum.names
 
     #---------------------------------------------------------------------------
     #  Gets the current mapping:
@@ -99,10 +108,7 @@ class BaseEditor ( Editor ):
     def _get_mapping ( self ):
         """ Gets the current mapping.
         """
-        if self._object is None:
-            return self.factory._mapping
-
-        return self._mapping
+        return self.enum.mapping
 
     #---------------------------------------------------------------------------
     #  Gets the current inverse mapping:
@@ -111,10 +117,19 @@ class BaseEditor ( Editor ):
     def _get_inverse_mapping ( self ):
         """ Gets the current inverse mapping.
         """
+        return self.enum.inverse_mapping
+
+    #---------------------------------------------------------------------------
+    #  Gets the current enumeration values:
+    #---------------------------------------------------------------------------
+
+    def _get_enum ( self ):
+        """ Gets the EnumValues holding the current names and mappings.
+        """
         if self._object is None:
-            return self.factory._inverse_mapping
+            return self.factory._enum_values
 
-        return self._inverse_mapping
+        return self._enum
 
     #---------------------------------------------------------------------------
     #  Rebuilds the contents of the editor whenever the original factory
@@ -134,8 +149,7 @@ class BaseEditor ( Editor ):
     def values_changed ( self ):
         """ Recomputes the cached data based on the underlying enumeration model.
         """
-        self._names, self._mapping, self._inverse_mapping = \
-            enum_values_changed( self._value(), self.string_value )
+        self._enum = EnumValues( self._value(), self.string_value )
 
     #---------------------------------------------------------------------------
     #  Handles the underlying object model's enumeration set being changed:
@@ -147,6 +161,20 @@ class BaseEditor ( Editor ):
         self.values_changed()
         self.rebuild_editor()
 
+    #---------------------------------------------------------------------------
+    #  Handles the items of the underlying object model's list of values being
+    #  changed:
+    #---------------------------------------------------------------------------
+
+    def _values_items_changed ( self, event ):
+        """ Handles the items of the underlying object model's list of values
+            being changed.
+        """
+        if not self._enum.update_items( event.index, event.removed,
+                                        event.added ):
+            self.values_changed()
+        self.rebuild_editor()
+
     #---------------------------------------------------------------------------
     #  Disposes of the contents of an editor:
     #---------------------------------------------------------------------------
@@ -157,12 +185,127 @@ class BaseEditor ( Editor ):
         if self._object is not None:
             self._object.on_trait_change( self._values_changed,
                                           ' ' + self._name, remove = True )
+            if self._items_name is not None:
+                self._object.on_trait_change( self._values_items_changed,
+                                              self._items_name, remove = True )
         else:
             self.factory.on_trait_change( self.rebuild_editor,
                                           'values_modified', remove = True )
 
         super( BaseEditor, self ).dispose()
 
+#-------------------------------------------------------------------------------
+#  '_SharedEnumModel' class:
+#-------------------------------------------------------------------------------
+
+class _SharedEnumModel(object):
+    """ The names of a set of enumeration values, and a list model presenting
+        them, shared by all of the combo box editors displaying the same
+        values.
+
+        Editors taking their values from the same object trait (using the same
+        factory) share the names and mappings too, so each change to the
+        values is only applied once.
+    """
+
+    # The shared models, by the source of their values:
+    shared = {}
+
+    def __init__(self, key, strfunc):
+        self.key = key
+        self.enum = EnumValues((), strfunc)
+        self.model = QtGui.QStringListModel()
+        self.editors = []
+
+        # The values (or factory EnumValues) the model currently presents:
+        self._source = None
+
+        # The last list event applied to the values:
+        self._event = None
+
+    @classmethod
+    def acquire(cls, editor):
+        """ Returns the shared model for the values of an editor.
+        """
+        if editor._object is None:
+            key = (id(editor.factory),)
+        else:
+            key = (id(editor._object), editor._name, id(editor.factory))
+
+        shared = cls.shared.get(key)
+        if shared is None:
+            shared = cls.shared[key] = cls(key, editor.string_value)
+        shared.editors.append(editor)
+
+        return shared
+
+    def release(self, editor):
+        """ Releases the shared model for an editor which is being disposed.
+        """
+        self.editors = [e for e in self.editors if e is not editor]
+        if len(self.editors) == 0:
+            del self.shared[self.key]
+        else:
+            # Don't keep the disposed editor alive:
+            self.enum.strfunc = self.editors[0].string_value
+
+    def set_enum(self, enum):
+        """ Makes the model present the names of a factory's EnumValues.
+        """
+        if enum is not self._source:
+            self._source = enum
+            self._set_names(enum.names)
+
+    def set_values(self, values):
+        """ Makes the model (and shared names and mappings) reflect an object
+            trait's values, returning the shared EnumValues.
+        """
+        if values is not self._source:
+            self._source = values
+            self.enum.set_values(values)
+            self._set_names(self.enum.names)
+
+        return self.enum
+
+    def update_items(self, event):
+        """ Applies a change to the items of an object trait's list of values
+            (once, however many editors report it).
+        """
+        if event is self._event:
+            return
+        self._event = event
+
+        enum = self.enum
+        index, removed, added = event.index, event.removed, event.added
+        if not enum.update_items(index, removed, added):
+            enum.set_values(self._source)
+            self._set_names(enum.names)
+            return
+
+        model = self.model
+        self._block_signals(True)
+        try:
+            if len(removed) > 0:
+                model.removeRows(index, len(removed))
+            if len(added) > 0:
+                model.insertRows(index, len(added))
+                for row in xrange(index, index + len(added)):
+                    model.setData(model.index(row), enum.names[row])
+        finally:
+            self._block_signals(False)
+
+    def _set_names(self, names):
+        self._block_signals(True)
+        try:
+            self.model.setStringList(names)
+        finally:
+            self._block_signals(False)
+
+    def _block_signals(self, block):
+        for editor in self.editors:
+            if editor.control is not None:
+                editor.control.blockSignals(block)
+
 #-------------------------------------------------------------------------------
 #  'SimpleEditor' class:
 #-------------------------------------------------------------------------------
@@ -171,6 +314,17 @@ class SimpleEditor ( BaseEditor ):
     """ Simple style of enumeration editor, which displays a combo box.
     """
 
+    #---------------------------------------------------------------------------
+    #  Class constants:
+    #---------------------------------------------------------------------------
+
+    # Does the combo box display a list model shared with the other editors of
+    # the same values?
+    shares_model = True
+
+    # The maximum number of names offered when completing text input:
+    max_completions = 100
+
     #---------------------------------------------------------------------------
     #  Finishes initializing the editor by creating the underlying toolkit
     #  widget:
@@ -183,7 +337,12 @@ class SimpleEditor ( BaseEditor ):
         super( SimpleEditor, self ).init( parent )
 
         self.control = control = self.create_combo_box()
-        control.addItems(self.names)
+        if self.shares_model:
+            control.setModel(self._get_shared().model)
+            if self._object is None:
+                self._shared.set_enum(self.factory._enum_values)
+        else:
+            control.addItems(self.names)
 
         QtCore.QObject.connect(control,
                                QtCore.SIGNAL('currentIndexChanged(QString)'),
@@ -201,6 +360,14 @@ class SimpleEditor ( BaseEditor ):
                                    self.update_autoset_text_object)
             control.setInsertPolicy(QtGui.QComboBox.NoInsert)
 
+            # Complete names using the (prefix indexed) enumeration values:
+            completer = QtGui.QCompleter(control)
+            completer.setModel(QtGui.QStringListModel(completer))
+            completer.setCompletionMode(
+                QtGui.QCompleter.UnfilteredPopupCompletion)
+            control.setCompleter(completer)
+            control.lineEdit().textEdited.connect(self._complete_text)
+
         self._no_enum_update = 0
         self.set_tooltip()
 
@@ -324,13 +491,85 @@ class SimpleEditor ( BaseEditor ):
         """ Rebuilds the contents of the editor whenever the original factory
             object's **values** trait changes.
         """
-        self.control.blockSignals(True)
-        self.control.clear()
-        self.control.addItems(self.names)
-        self.control.blockSignals(False)
+        if self.shares_model:
+            if self._object is None:
+                self._shared.set_enum(self.factory._enum_values)
+        else:
+            self.control.blockSignals(True)
+            self.control.clear()
+            self.control.addItems(self.names)
+            self.control.blockSignals(False)
 
         self.update_editor()
 
+    #---------------------------------------------------------------------------
+    #  Recomputes the cached data based on the underlying enumeration model:
+    #---------------------------------------------------------------------------
+
+    def values_changed ( self ):
+        """ Recomputes the cached data based on the underlying enumeration model.
+        """
+        if self.shares_model:
+            self._enum = self._get_shared().set_values(self._value())
+        else:
+            super(SimpleEditor, self).values_changed()
+
+    #---------------------------------------------------------------------------
+    #  Handles the items of the underlying object model's list of values being
+    #  changed:
+    #---------------------------------------------------------------------------
+
+    def _values_items_changed ( self, event ):
+        """ Handles the items of the underlying object model's list of values
+            being changed.
+        """
+        if self.shares_model:
+            self._get_shared().update_items(event)
+            self._enum = self._shared.enum
+            self.update_editor()
+        else:
+            super(SimpleEditor, self)._values_items_changed(event)
+
+    #---------------------------------------------------------------------------
+    #  Disposes of the contents of an editor:
+    #---------------------------------------------------------------------------
+
+    def dispose ( self ):
+        """ Disposes of the contents of an editor.
+        """
+        if self._shared is not None:
+            # Detach the combo box from the shared model before releasing it,
+            # as the combo box is only deleted later:
+            if self.control is not None:
+                self.control.setModel(QtGui.QStringListModel(self.control))
+            self._shared.release(self)
+            self._shared = None
+
+        super(SimpleEditor, self).dispose()
+
+    #-- Private Methods --------------------------------------------------------
+
+    def _get_shared(self):
+        """ Returns the model shared with the other editors of the same
+            values.
+        """
+        if self._shared is None:
+            self._shared = _SharedEnumModel.acquire(self)
+        return self._shared
+
+    def _complete_text(self, text):
+        """ Offers the names starting with the text typed by the user.
+        """
+        prefix = unicode(text)
+        names = []
+        if prefix != '':
+            names = self.enum.complete(prefix, self.max_completions)
+
+        completer = self.control.completer()
+        completer.model().setStringList(names)
+        if len(names) > 0:
+            completer.complete()
+
 #-------------------------------------------------------------------------------
 #  'RadioEditor' class:
 #-------------------------------------------------------------------------------
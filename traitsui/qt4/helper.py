@@ -27,6 +27,9 @@ from traits.api \
 from traitsui.ui_traits \
     import convert_image, SequenceTypes
 
+from traitsui.image.memory_cache \
+    import image_memory_cache
+
 #-------------------------------------------------------------------------------
 #  Trait definitions:
 #-------------------------------------------------------------------------------
@@ -59,11 +62,21 @@ def pixmap_cache(name, path=None):
             filename = os.path.join(path, name)
     filename = os.path.abspath(filename)
 
-    pm = QtGui.QPixmap()
-    if not QtGui.QPixmapCache.find(filename, pm):
-        pm.load(filename)
-        QtGui.QPixmapCache.insert(filename, pm)
-    return pm
+    return image_memory_cache.image_for(('', filename, None),
+                                        lambda: QtGui.QPixmap(filename))
+
+#-------------------------------------------------------------------------------
+#  Convert an ImageResource to a QIcon using a cached image:
+#-------------------------------------------------------------------------------
+
+def icon_cache(image_resource, size=None):
+    """ Return a QIcon for an ImageResource, sharing its decoded image with
+        every other user of the same image file through the image memory
+        cache.
+    """
+    key = ('', image_resource.absolute_path, size)
+    return QtGui.QIcon(image_memory_cache.image_for(key,
+        lambda: image_resource.create_image(size)))
 
 #-------------------------------------------------------------------------------
 #  Positions a window on the screen with a specified width and height so that
@@ -154,6 +167,77 @@ def open_fbi():
     except ImportError:
         pass
 
+#-------------------------------------------------------------------------------
+#  'Debouncer' class:
+#-------------------------------------------------------------------------------
+
+class Debouncer(QtCore.QObject):
+    """ Coalesces a rapid series of calls to **trigger** into a single call of
+        a callback, made once **trigger** has not been called for *delay*
+        milliseconds.
+
+        A pending call can be made at once using **flush**, which also happens
+        whenever a widget passed to **watch** loses the keyboard focus.
+    """
+
+    def __init__(self, delay, callback):
+        """ Initialise the object.
+        """
+        QtCore.QObject.__init__(self)
+
+        self._callback = callback
+        self._timer = timer = QtCore.QTimer(self)
+        timer.setSingleShot(True)
+        timer.setInterval(delay)
+        timer.timeout.connect(self._fire)
+
+    @property
+    def pending(self):
+        """ Whether a call of the callback is waiting for the delay to pass.
+        """
+        return self._timer.isActive()
+
+    def trigger(self, *args):
+        """ Restarts the delay before the callback is called. Any arguments
+            (e.g. those of the signal connected to it) are ignored.
+        """
+        self._timer.start()
+
+    def flush(self):
+        """ Calls the callback at once if a call is pending.
+        """
+        if self._timer.isActive():
+            self._timer.stop()
+            self._fire()
+
+    def cancel(self):
+        """ Discards any pending call of the callback.
+        """
+        self._timer.stop()
+
+    def watch(self, control):
+        """ Flushes any pending call whenever the control loses the focus.
+        """
+        control.installEventFilter(self)
+
+    def dispose(self):
+        """ Discards any pending call and releases the callback.
+        """
+        self._timer.stop()
+        self._callback = None
+
+    def eventFilter(self, obj, event):
+        """ Reimplemented to flush pending calls on focus out events.
+        """
+        if event.type() == QtCore.QEvent.FocusOut:
+            self.flush()
+
+        return False
+
+    def _fire(self):
+        if self._callback is not None:
+            self._callback()
+
 #-------------------------------------------------------------------------------
 #  'IconButton' class:
 #-------------------------------------------------------------------------------
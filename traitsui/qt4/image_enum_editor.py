@@ -93,6 +93,10 @@ class SimpleEditor(BaseEditor, SimpleEnumEditor):
     """ Simple style of image enumeration editor, which displays a combo box.
     """
 
+    # The combo box displays its own image model. This value overrides the
+    # default.
+    shares_model = False
+
     #---------------------------------------------------------------------------
     #  Returns the QComboBox used for the editor control:
     #---------------------------------------------------------------------------
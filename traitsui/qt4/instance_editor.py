@@ -344,6 +344,11 @@ class CustomEditor ( Editor ):
         """
         panel = self._panel
         if panel is not None:
+            # Re-target the current user interface at the new value if it
+            # uses the same view for the same class of object:
+            if self._retarget_ui():
+                return
+
             # Dispose of the previous contents of the panel:
             layout = panel.layout()
             if layout is None:
@@ -378,6 +383,7 @@ class CustomEditor ( Editor ):
                 self._ui = ui = view.ui( context, panel, 'subpanel',
                                          value.trait_view_elements(), handler,
                                          self.factory.id )
+                self._ui_key    = ( view, value.__class__ )
                 control         = ui.control
                 self.scrollable = ui._scrollable
                 ui.parent       = self.ui
@@ -388,6 +394,30 @@ class CustomEditor ( Editor ):
             # FIXME: Handle stretch.
             layout.addWidget(control)
 
+    #---------------------------------------------------------------------------
+    #  Re-targets the current user interface at the current value:
+    #---------------------------------------------------------------------------
+
+    def _retarget_ui ( self ):
+        """ Tries to re-target the user interface currently displayed at the
+            current value, returning whether it succeeded.
+        """
+        ui, value = self._ui, self.value
+        if ((ui is None) or (not self.factory.reuse_view) or
+            (not isinstance( value, HasTraits )) or
+            isinstance( value, Handler )):
+            return False
+
+        view = self.view_for( value, self.item_for( value ) )
+        if self._ui_key != ( view, value.__class__ ):
+            return False
+
+        context = value.trait_context()
+        context.setdefault( 'context', self.object )
+        context.setdefault( 'context_handler', self.ui.handler )
+
+        return ui.retarget( context )
+
     #---------------------------------------------------------------------------
     #  Disposes of the contents of an editor:
     #---------------------------------------------------------------------------
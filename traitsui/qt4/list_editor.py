@@ -101,17 +101,7 @@ class SimpleEditor ( Editor ):
         self._trait_handler = trait_handler
 
         # Create a scrolled window to hold all of the list item controls:
-        self.control = QtGui.QScrollArea()
-        self.control.setFrameShape(QtGui.QFrame.NoFrame)
-        self.control.setWidgetResizable(True)
-
-        # Create a widget with a grid layout as the container.
-        self._list_pane = QtGui.QWidget()
-        self._list_pane.setSizePolicy(QtGui.QSizePolicy.Expanding,
-                                      QtGui.QSizePolicy.Expanding)
-        layout = QtGui.QGridLayout(self._list_pane)
-        layout.setAlignment(QtCore.Qt.AlignLeft | QtCore.Qt.AlignTop)
-        layout.setContentsMargins(0, 0, 0, 0)
+        self._create_control()
 
         # Remember the editor to use for each individual list item:
         editor = self.factory.editor
@@ -129,6 +119,26 @@ class SimpleEditor ( Editor ):
                                extended_name + '_items?', dispatch = 'ui' )
         self.set_tooltip()
 
+    #---------------------------------------------------------------------------
+    #  Creates the scroll area and the pane holding the list item controls:
+    #---------------------------------------------------------------------------
+
+    def _create_control ( self ):
+        """ Creates the scroll area and the pane holding the list item
+            controls.
+        """
+        self.control = QtGui.QScrollArea()
+        self.control.setFrameShape(QtGui.QFrame.NoFrame)
+        self.control.setWidgetResizable(True)
+
+        # Create a widget with a grid layout as the container.
+        self._list_pane = QtGui.QWidget()
+        self._list_pane.setSizePolicy(QtGui.QSizePolicy.Expanding,
+                                      QtGui.QSizePolicy.Expanding)
+        layout = QtGui.QGridLayout(self._list_pane)
+        layout.setAlignment(QtCore.Qt.AlignLeft | QtCore.Qt.AlignTop)
+        layout.setContentsMargins(0, 0, 0, 0)
+
     #---------------------------------------------------------------------------
     #  Disposes of the contents of an editor:
     #---------------------------------------------------------------------------
@@ -144,6 +154,25 @@ class SimpleEditor ( Editor ):
 
         super( SimpleEditor, self ).dispose()
 
+    #---------------------------------------------------------------------------
+    #  Re-binds the editor to the objects of a new context:
+    #---------------------------------------------------------------------------
+
+    def retarget ( self, remove = False ):
+        """ Re-binds the editor (including its 'list items changed' event
+            handler) to the objects of a new context.
+        """
+        extended_name = self.extended_name.replace('.', ':')
+        if remove:
+            self.context_object.on_trait_change( self.update_editor_item,
+                                 extended_name + '_items?', remove = True )
+
+        super( SimpleEditor, self ).retarget( remove )
+
+        if not remove:
+            self.context_object.on_trait_change( self.update_editor_item,
+                                   extended_name + '_items?', dispatch = 'ui' )
+
     #---------------------------------------------------------------------------
     #  Updates the editor when the object trait changes external to the editor:
     #---------------------------------------------------------------------------
@@ -272,8 +301,7 @@ class SimpleEditor ( Editor ):
     def popup_menu ( self ):
         """ Displays the list editor popup menu.
         """
-        layout = self._list_pane.layout()
-        sender = layout.sender()
+        sender = self.control.sender()
 
         self._cur_control = sender
 
@@ -447,6 +475,328 @@ class CustomEditor ( SimpleEditor ):
     # Is the list editor is scrollable? This values overrides the default.
     scrollable = True
 
+#-------------------------------------------------------------------------------
+#  'VirtualEditor' class:
+#-------------------------------------------------------------------------------
+
+class VirtualEditor ( CustomEditor ):
+    """ Custom style of editor for long lists, which only creates editors for
+    the list items inside the scroll viewport (plus a margin of rows), and
+    recycles them as the list is scrolled.
+    """
+
+    #---------------------------------------------------------------------------
+    #  Finishes initializing the editor by creating the underlying toolkit
+    #  widget:
+    #---------------------------------------------------------------------------
+
+    def init ( self, parent ):
+        """ Finishes initializing the editor by creating the underlying toolkit
+            widget.
+        """
+        # Maps list indices to the row widgets currently displaying them:
+        self._slots = {}
+
+        # Row widgets which are not displaying any list item:
+        self._free = []
+
+        # The control displayed for an empty list:
+        self._empty = None
+
+        # The height of each row (0 until the first row has been created):
+        self._row_height = 0
+
+        super( VirtualEditor, self ).init( parent )
+
+        trait_handler   = self._trait_handler
+        self._resizable = ((trait_handler.minlen != trait_handler.maxlen) and
+                           self.mutable)
+
+    #---------------------------------------------------------------------------
+    #  Creates the scroll area and the pane holding the list item controls:
+    #---------------------------------------------------------------------------
+
+    def _create_control ( self ):
+        """ Creates the scroll area and the pane holding the list item
+            controls. The row widgets are positioned on the pane explicitly,
+            so it has no layout.
+        """
+        self.control = _VirtualScrollArea( self )
+        self.control.setFrameShape( QtGui.QFrame.NoFrame )
+        self.control.setWidgetResizable( False )
+
+        self._list_pane = QtGui.QWidget()
+        self.control.setWidget( self._list_pane )
+        self.control.verticalScrollBar().valueChanged.connect(
+            self._scrolled )
+
+    #---------------------------------------------------------------------------
+    #  Disposes of the contents of an editor:
+    #---------------------------------------------------------------------------
+
+    def dispose ( self ):
+        """ Disposes of the contents of an editor.
+        """
+        self.control.verticalScrollBar().valueChanged.disconnect(
+            self._scrolled )
+        self.control._editor = None
+
+        super( VirtualEditor, self ).dispose()
+
+    #---------------------------------------------------------------------------
+    #  Updates the editor when the object trait changes external to the editor:
+    #---------------------------------------------------------------------------
+
+    def update_editor ( self ):
+        """ Updates the editor when the object trait changes externally to the
+            editor.
+        """
+        # All of the row widgets can be reused for the new list:
+        self._free.extend( self._slots.values() )
+        self._slots = {}
+        self._dispose_empty()
+
+        if self._resizable and (len( self.value ) == 0):
+            self.empty_list()
+
+        self._layout_rows()
+
+    #---------------------------------------------------------------------------
+    #  Updates the editor when an item in the object trait changes external to
+    #  the editor:
+    #---------------------------------------------------------------------------
+
+    def update_editor_item ( self, event ):
+        """ Updates the editor when an item in the object trait changes
+        externally to the editor.
+
+        Only the rows affected by the change are updated: rows after the
+        change are renumbered, and rows for replaced items keep their editors.
+        """
+        index = event.index
+        if ((not isinstance( index, int )) or (self._empty is not None) or
+            (len( self.value ) == 0)):
+            self.update_editor()
+            return
+
+        removed  = len( event.removed )
+        delta    = len( event.added ) - removed
+        replaced = index + min( removed, len( event.added ) )
+        value    = self.value
+        slots    = {}
+        for i, slot in self._slots.iteritems():
+            if i < index:
+                slots[i] = slot
+            elif i < replaced:
+                slots[i] = slot
+                self._set_slot_item( slot, i, value[i] )
+            elif i >= (index + removed):
+                slots[i + delta]  = slot
+                slot.proxy.index += delta
+            else:
+                self._free.append( slot )
+        self._slots = slots
+
+        self._layout_rows()
+
+    #---------------------------------------------------------------------------
+    #  Creates an empty list entry (so the user can add a new item):
+    #---------------------------------------------------------------------------
+
+    def empty_list ( self ):
+        """ Creates an empty list entry (so the user can add a new item).
+        """
+        control = IconButton( 'list_editor.png', self.popup_empty_menu )
+        control.is_empty = True
+        self._cur_control = control
+
+        proxy    = ListItemProxy( self.object, self.name, -1, None, None )
+        pcontrol = QtGui.QLabel( '   (Empty List)' )
+        pcontrol.proxy = control.proxy = proxy
+
+        self._empty = empty = QtGui.QWidget( self._list_pane )
+        layout = QtGui.QHBoxLayout( empty )
+        layout.setContentsMargins( 0, 0, 0, 0 )
+        layout.addWidget( control )
+        layout.addWidget( pcontrol )
+        layout.addStretch( 1 )
+        empty.show()
+
+    #-- Private Methods --------------------------------------------------------
+
+    def _scrolled ( self, value ):
+        """ Handles the list being scrolled.
+        """
+        self._layout_rows()
+
+    def _layout_rows ( self ):
+        """ Makes sure that there is a row widget for each list item in or
+            near the viewport, and positions them on the list pane.
+        """
+        pane     = self._list_pane
+        viewport = self.control.viewport()
+        width    = viewport.width()
+        height   = viewport.height()
+
+        if self._empty is not None:
+            pane.resize( width, height )
+            self._empty.setGeometry( 0, 0, width,
+                                     self._empty.sizeHint().height() )
+            self._trim_free( 0 )
+            return
+
+        value   = self.value
+        count   = len( value )
+        columns = self.factory.columns
+        rows    = (count + columns - 1) // columns
+        row_height = self._get_row_height()
+        pane.resize( width, max( rows * row_height, height ) )
+
+        # Determine the range of list items which need a row widget:
+        margin = self.factory.virtual_margin
+        top    = self.control.verticalScrollBar().value() // row_height
+        bottom = (self.control.verticalScrollBar().value() + height +
+                  row_height - 1) // row_height
+        first  = max( 0, top - margin ) * columns
+        last   = min( count, (bottom + margin) * columns )
+
+        # Recycle the row widgets of items which are no longer needed:
+        slots = self._slots
+        for index in [ i for i in slots if (i < first) or (i >= last) ]:
+            self._free.append( slots.pop( index ) )
+
+        column_width = width // columns
+        for index in xrange( first, last ):
+            slot = slots.get( index )
+            if slot is None:
+                slot = slots[ index ] = self._get_slot( index, value[ index ] )
+            row, column = divmod( index, columns )
+            slot.setGeometry( column * column_width, row * row_height,
+                              column_width, row_height )
+
+        self._trim_free( len( slots ) )
+
+    def _get_row_height ( self ):
+        """ Returns the height of each row, measuring the first row widget
+            created if necessary.
+        """
+        if self._row_height == 0:
+            value = self.value
+            if len( value ) == 0:
+                return 1
+            slot = self._get_slot( 0, value[0] )
+            self._row_height = max( 1, slot.sizeHint().height() )
+            self._free.append( slot )
+
+        return self._row_height
+
+    def _get_slot ( self, index, value ):
+        """ Returns a row widget displaying a specified list item, reusing an
+            unused one if possible.
+        """
+        if len( self._free ) > 0:
+            slot = self._free.pop()
+            self._set_slot_item( slot, index, value )
+        else:
+            slot = self._create_slot( index, value )
+        slot.show()
+
+        return slot
+
+    def _create_slot ( self, index, value ):
+        """ Creates a new row widget (and item editor) for a list item.
+        """
+        slot   = QtGui.QWidget( self._list_pane )
+        layout = QtGui.QHBoxLayout( slot )
+        layout.setContentsMargins( 0, 0, 0, 0 )
+
+        proxy = ListItemProxy( self.object, self.name, index,
+                               self._trait_handler.item_trait, value )
+        if self._resizable:
+            control = IconButton( 'list_editor.png', self.popup_menu )
+            control.proxy = proxy
+            layout.addWidget( control )
+
+        peditor = self._editor( self.ui, proxy, 'value', self.description,
+                                slot ).set( object_name = '' )
+        peditor.prepare( slot )
+        pcontrol = peditor.control
+        pcontrol.proxy = proxy
+
+        if isinstance( pcontrol, QtGui.QWidget ):
+            layout.addWidget( pcontrol )
+        else:
+            layout.addLayout( pcontrol )
+
+        slot.proxy       = proxy
+        slot.item_editor = peditor
+
+        return slot
+
+    def _set_slot_item ( self, slot, index, value ):
+        """ Makes a row widget display a different list item, without writing
+            the value back to the list.
+        """
+        # Setting the proxy's value quietly does not log an undoable change
+        # or mark the user interface as modified, so update the item editor
+        # explicitly:
+        slot.proxy.trait_set( trait_change_notify = False, index = index,
+                              value = value )
+        slot.item_editor.update_editor()
+
+    def _trim_free ( self, count ):
+        """ Hides the unused row widgets, disposing of any beyond the
+            specified number.
+        """
+        free = self._free
+        while len( free ) > count:
+            self._dispose_slot( free.pop() )
+        for slot in free:
+            slot.hide()
+
+    def _dispose_slot ( self, slot ):
+        """ Disposes of a row widget and its item editor.
+        """
+        slot.item_editor.dispose()
+        slot.item_editor.control = None
+        slot.hide()
+        slot.deleteLater()
+
+    def _dispose_empty ( self ):
+        """ Disposes of the control displayed for an empty list.
+        """
+        if self._empty is not None:
+            self._empty.hide()
+            self._empty.deleteLater()
+            self._empty = None
+
+    def _dispose_items ( self ):
+        """ Disposes of each current list item.
+        """
+        for slot in self._slots.values() + self._free:
+            self._dispose_slot( slot )
+        self._slots = {}
+        self._free  = []
+        self._dispose_empty()
+
+#-------------------------------------------------------------------------------
+#  '_VirtualScrollArea' class:
+#-------------------------------------------------------------------------------
+
+class _VirtualScrollArea ( QtGui.QScrollArea ):
+    """ A scroll area which lays out the rows of a virtual list editor whenever
+        it is resized.
+    """
+
+    def __init__ ( self, editor ):
+        QtGui.QScrollArea.__init__( self )
+        self._editor = editor
+
+    def resizeEvent ( self, event ):
+        QtGui.QScrollArea.resizeEvent( self, event )
+        if self._editor is not None:
+            self._editor._layout_rows()
+
 #-------------------------------------------------------------------------------
 #  'TextEditor' class:
 #-------------------------------------------------------------------------------
@@ -476,6 +826,10 @@ class NotebookEditor ( Editor ):
     pages.
     """
 
+    # The editor listens to the edited object itself, so it cannot be
+    # re-targeted at a new context:
+    retargetable = False
+
     # The "Close Tab" button.
     close_button = Any()
 
@@ -519,6 +873,10 @@ class NotebookEditor ( Editor ):
         """
         self._uis = []
 
+        # The pages whose UIs have been built in lazy mode, least recently
+        # viewed first:
+        self._live = []
+
         # Create a tab widget to hold each separate object's view:
         self.control = QtGui.QTabWidget()
         signal = QtCore.SIGNAL( 'currentChanged(int)' )
@@ -563,57 +921,48 @@ class NotebookEditor ( Editor ):
         self.close_all()
 
         # Create a tab page for each object in the trait's value:
-        for object in self.value:
-            ui, view_object, monitoring = self._create_page(object)
-
+        for index, object in enumerate( self.value ):
             # Remember the page for later deletion processing:
-            self._uis.append([ui.control, ui, view_object, monitoring])
+            self._uis.append( self._create_page( object, index ) )
 
-        if self.selected: 
+        if self.selected:
             self._selected_changed(self.selected)
 
+        self._activate_current()
+
     #---------------------------------------------------------------------------
     #  Handles some subset of the trait's list being updated:
     #---------------------------------------------------------------------------
 
     def update_editor_item ( self, event ):
         """ Handles an update to some subset of the trait's list.
+
+            Only the pages of the removed and added items are affected.
         """
         index = event.index
+        if not isinstance( index, int ):
+            self.update_editor()
+            return
 
         # Delete the page corresponding to each removed item:
-        page_name = self.factory.page_name[1:]
-
         for i in event.removed:
-            page, ui, view_object, monitoring = self._uis[index]
-            if monitoring:
-                view_object.on_trait_change(self.update_page_name, page_name,
-                        remove=True)
-            ui.dispose()
-            self.control.removeTab(self.control.indexOf(page))
-
-            if self.factory.show_notebook_menu:
-                for name, tmp in self._pagewidgets.items():
-                    if tmp is page:
-                        del self._pagewidgets[name]
-                self._context_menu.removeAction(self._action_dict[name])
-                del self._action_dict[name]
-
-            del self._uis[index]
+            self._remove_page( self._uis.pop( index ) )
 
         # Add a page for each added object:
         first_page = None
         for object in event.added:
-            ui, view_object, monitoring  = self._create_page(object)
-            self._uis[index:index] = [[ui.control, ui, view_object, monitoring]]
+            entry = self._create_page( object, index )
+            self._uis.insert( index, entry )
             index += 1
 
             if first_page is None:
-                first_page = ui.control
+                first_page = entry[0]
 
         if first_page is not None:
             self.control.setCurrentWidget(first_page)
 
+        self._activate_current()
+
     #---------------------------------------------------------------------------
     #  Closes the currently selected tab:
     #---------------------------------------------------------------------------
@@ -625,7 +974,9 @@ class NotebookEditor ( Editor ):
         for i in xrange( len( self._uis ) ):
             page, ui, _, _ = self._uis[i]
             if page is widget:
-                if force or ui.handler.close( ui.info, True ):
+                # A page whose UI has not been built has nothing to veto the
+                # close:
+                if force or (ui is None) or ui.handler.close( ui.info, True ):
                     del self.value[i]
                 break
 
@@ -653,16 +1004,12 @@ class NotebookEditor ( Editor ):
     def close_all ( self ):
         """ Closes all currently open notebook pages.
         """
-        page_name = self.factory.page_name[1:]
-
-        for _, ui, view_object, monitoring in self._uis:
-            if monitoring:
-                view_object.on_trait_change(self.update_page_name, page_name,
-                        remove=True)
-            ui.dispose()
+        for entry in self._uis:
+            self._dispose_page( entry )
 
         # Reset the list of ui's and dictionary of page name counts:
-        self._uis = []
+        self._uis  = []
+        self._live = []
         self._pages = {}
 
         self.control.clear()
@@ -688,8 +1035,8 @@ class NotebookEditor ( Editor ):
         """ Handles the trait defining a particular page's name being changed.
         """
         for i, value in enumerate(self._uis):
-            page, ui, _, _ = value
-            if object is ui.info.object:
+            page, _, view_object, _ = value
+            if object is view_object:
                 name = None
                 handler = getattr(self.ui.handler,
                         '%s_%s_page_name' % (self.object_name, self.name),
@@ -704,19 +1051,32 @@ class NotebookEditor ( Editor ):
                 break
 
     #---------------------------------------------------------------------------
-    #  Creates a page for a specified object and adds it to the tab widget:
+    #  Creates a page for a specified object and inserts it into the tab
+    #  widget:
     #---------------------------------------------------------------------------
 
-    def _create_page ( self, object ):
+    def _create_page ( self, object, index ):
+        """ Creates the page for an object, inserts it into the tab widget at
+            the specified index and returns its [page, ui, view_object,
+            monitoring] entry.
+
+            In **lazy** mode the page is an empty placeholder, and its UI is
+            only built when the page is first activated.
+        """
         # Create the view for the object:
         view_object = object
         factory = self.factory
         if factory.factory is not None:
             view_object = factory.factory(object)
-        ui = view_object.edit_traits( parent = self.control,
-                                 view   = factory.view,
-                                 kind   = factory.ui_kind ).set(
-                                 parent = self.ui )
+
+        if factory.lazy:
+            ui   = None
+            page = QtGui.QWidget()
+            layout = QtGui.QVBoxLayout( page )
+            layout.setContentsMargins( 0, 0, 0, 0 )
+        else:
+            ui   = self._create_page_ui( view_object, self.control )
+            page = ui.control
 
         # Get the name of the page being added to the notebook:
         name       = ''
@@ -751,7 +1111,7 @@ class NotebookEditor ( Editor ):
             if count > 1:
                 name += (' %d' % count)
 
-        # Return the control for the ui, and whether or not its name is being
+        # Insert the page, and remember whether or not its name is being
         # monitored:
         image   = None
         method  = getattr( self.ui.handler, prefix + 'image', None )
@@ -759,9 +1119,9 @@ class NotebookEditor ( Editor ):
             image = method( self.ui.info, object )
 
         if image is None:
-            self.control.addTab(ui.control, name)
+            self.control.insertTab(index, page, name)
         else:
-            self.control.addTab(ui.control, image, name)
+            self.control.insertTab(index, page, image, name)
 
         if self.factory.show_notebook_menu:
             newaction = self._context_menu.addAction(name)
@@ -770,25 +1130,101 @@ class NotebookEditor ( Editor ):
             newaction.setChecked(True)
             newaction.triggered.connect(lambda e,name=name: self._menu_action(e,name=name))
             self._action_dict[name] = newaction
-            self._pagewidgets[name] = ui.control
+            self._pagewidgets[name] = page
+
+        return [page, ui, view_object, monitoring]
+
+    def _create_page_ui ( self, view_object, parent ):
+        """ Creates the UI displayed on the page for a view object.
+        """
+        factory = self.factory
+        return view_object.edit_traits( parent = parent,
+                                        view   = factory.view,
+                                        kind   = factory.ui_kind ).set(
+                                        parent = self.ui )
 
-        return (ui, view_object, monitoring)
+    def _remove_page ( self, entry ):
+        """ Removes a page (and its menu action) from the tab widget.
+        """
+        page = entry[0]
+        self._dispose_page( entry )
+        self.control.removeTab( self.control.indexOf( page ) )
+
+        if self.factory.show_notebook_menu:
+            for name, tmp in self._pagewidgets.items():
+                if tmp is page:
+                    del self._pagewidgets[name]
+                    self._context_menu.removeAction(self._action_dict[name])
+                    del self._action_dict[name]
+                    break
+
+    def _dispose_page ( self, entry ):
+        """ Disposes of the UI and page name listener of a page.
+        """
+        page, ui, view_object, monitoring = entry
+        if monitoring:
+            view_object.on_trait_change( self.update_page_name,
+                                         self.factory.page_name[1:],
+                                         remove = True )
+        self._release_page_ui( entry )
+        if self.factory.lazy:
+            page.deleteLater()
+
+    def _release_page_ui ( self, entry ):
+        """ Disposes of the UI of a page (if it has been built), leaving the
+            page itself in place.
+        """
+        self._live = [ live for live in self._live if live is not entry ]
+        if entry[1] is not None:
+            entry[1].dispose()
+            entry[1] = None
+
+    def _activate_page ( self, entry ):
+        """ Builds the UI of a lazy page if necessary, and makes it the most
+            recently viewed page, disposing of the UI of the least recently
+            viewed page if there are more than **max_live_pages** of them.
+        """
+        page, ui, view_object, _ = entry
+        if ui is None:
+            entry[1] = ui = self._create_page_ui( view_object, page )
+            page.layout().addWidget( ui.control )
+
+        self._live = ([ live for live in self._live if live is not entry ] +
+                      [ entry ])
+
+        limit = self.factory.max_live_pages
+        while (limit > 0) and (len( self._live ) > limit):
+            self._release_page_ui( self._live[0] )
+
+    def _activate_current ( self ):
+        """ Makes sure the UI of the current lazy page has been built, since
+            Qt does not report a tab as activated when it becomes current by
+            being the first tab added.
+        """
+        if self.factory.lazy:
+            widget = self.control.currentWidget()
+            for entry in self._uis:
+                if entry[0] is widget:
+                    self._activate_page( entry )
+                    break
 
     def _tab_activated(self, idx):
         """ Handles a notebook tab being "activated" (i.e. clicked on) by the
             user.
         """
         widget = self.control.widget(idx)
-        for page, ui, _, _ in self._uis:
-            if page is widget:
-                self.selected = ui.info.object
+        for entry in self._uis:
+            if entry[0] is widget:
+                if self.factory.lazy:
+                    self._activate_page(entry)
+                self.selected = entry[2]
                 break
 
     def _selected_changed(self, selected):
         """ Handles the **selected** trait being changed.
         """
-        for page, ui, _, _ in self._uis:
-            if ui.info and selected is ui.info.object:
+        for page, _, view_object, _ in self._uis:
+            if selected is view_object:
                 self.control.setCurrentWidget(page)
                 break
             deletable = self.factory.deletable
@@ -42,6 +42,10 @@ class _ListStrEditor(Editor):
     """ Traits UI editor for editing lists of strings.
     """
 
+    # The editor listens to the edited object itself, so it cannot be
+    # re-targeted at a new context:
+    retargetable = False
+
     #---------------------------------------------------------------------------
     #  Trait definitions:
     #---------------------------------------------------------------------------
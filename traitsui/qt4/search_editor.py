@@ -17,6 +17,7 @@ from pyface.qt import QtCore, QtGui
 
 # ETS imports
 from editor import Editor
+from helper import Debouncer
 
 
 class SearchWidget(QtGui.QLineEdit):
@@ -81,7 +82,14 @@ class SearchEditor(Editor):
             control.setPlaceholderText(self.factory.text)
 
         if self.factory.auto_set:
-            control.textEdited.connect(self.update_object)
+            if self.factory.auto_set_delay > 0:
+                self._debouncer = Debouncer(self.factory.auto_set_delay,
+                                            self.update_object)
+                self._debouncer.watch(control)
+                control.textEdited.connect(self._debouncer.trigger)
+                control.returnPressed.connect(self.flush)
+            else:
+                control.textEdited.connect(self.update_object)
         if self.factory.enter_set:
             control.editingFinished.connect(self.update_object)
 
@@ -98,6 +106,8 @@ class SearchEditor(Editor):
             editor.
         """
         if str(self.control.text()) != self.value:
+            if self._debouncer is not None:
+                self._debouncer.cancel()
             self._no_update = True
             self.control.setText(self.str_value)
             self._no_update = False
@@ -47,6 +47,10 @@ class SimpleEditor ( Editor ):
     selected item up or down in right-side list box.
     """
 
+    # The editor listens to the edited object itself, so it cannot be
+    # re-targeted at a new context:
+    retargetable = False
+
     #---------------------------------------------------------------------------
     #  Trait definitions:
     #---------------------------------------------------------------------------
@@ -16,6 +16,8 @@
 #  Imports:
 #-------------------------------------------------------------------------------
 
+from bisect import bisect_left
+
 from pyface.qt import QtCore, QtGui
 
 from pyface.timer.api import do_later
@@ -28,6 +30,7 @@ from traitsui.api import EnumEditor, InstanceEditor, Group, \
     spring
 from traitsui.editors.table_editor import BaseTableEditor, \
     ReversedList, ToolkitEditorFactory, customize_filter
+from traitsui.helper import RowChanges, RowIndex
 from traitsui.ui_traits import SequenceTypes
 
 from editor import Editor
@@ -43,6 +46,10 @@ class TableEditor(Editor, BaseTableEditor):
         their criteria.
     """
 
+    # The editor listens to the edited object itself, so it cannot be
+    # re-targeted at a new context:
+    retargetable = False
+
     #---------------------------------------------------------------------------
     #  Trait definitions:
     #---------------------------------------------------------------------------
@@ -121,6 +128,10 @@ class TableEditor(Editor, BaseTableEditor):
 
         factory = self.factory
         self.columns = factory.columns[:]
+        self._row_index = RowIndex(self.items)
+        self._row_changes = RowChanges(self._rows_changed,
+                                       self._schedule_row_changes,
+                                       factory.update_batch_size)
         if factory.table_view_factory is not None:
             self.table_view = factory.table_view_factory(editor=self)
         if factory.source_model_factory is not None:
@@ -207,7 +218,8 @@ class TableEditor(Editor, BaseTableEditor):
             self.control.setStretchFactor(0, 2)
 
             # Create the row editor below the table view
-            editor = InstanceEditor(view=factory.edit_view, kind='subpanel')
+            editor = InstanceEditor(view=factory.edit_view, kind='subpanel',
+                                    reuse_view=factory.reuse_edit_view)
             self._ui = self.edit_traits(
                 parent = self.control,
                 kind = 'subpanel',
@@ -233,11 +245,12 @@ class TableEditor(Editor, BaseTableEditor):
         # Make sure we listen for 'items' changes as well as complete list
         # replacements
         self.context_object.on_trait_change(
-            self.update_editor, self.extended_name + '_items', dispatch='ui')
+            self._update_items, self.extended_name + '_items', dispatch='ui')
 
         # Listen for changes to traits on the objects in the list
         self.context_object.on_trait_change(
-            self.refresh_editor, self.extended_name + '.-', dispatch='ui')
+            self._item_trait_changed, self.extended_name + '.-',
+            dispatch='ui')
 
         # Listen for changes on column definitions
         self.on_trait_change(self._update_columns, 'columns', dispatch='ui')
@@ -270,6 +283,7 @@ class TableEditor(Editor, BaseTableEditor):
         # Disconnect the table view from its model to ensure that they do not
         # continue to interact (the control won't be deleted until later).
         self.table_view.setModel(None)
+        self._row_changes.reset()
 
         # Make sure that the auxillary UIs are properly disposed
         if self.toolbar_ui is not None:
@@ -279,11 +293,11 @@ class TableEditor(Editor, BaseTableEditor):
 
         # Remove listener for 'items' changes on object trait
         self.context_object.on_trait_change(
-            self.update_editor, self.extended_name + '_items', remove=True)
+            self._update_items, self.extended_name + '_items', remove=True)
 
         # Remove listener for changes to traits on the objects in the list
         self.context_object.on_trait_change(
-            self.refresh_editor, self.extended_name + '.-', remove=True)
+            self._item_trait_changed, self.extended_name + '.-', remove=True)
 
         # Remove listeners for column definition changes
         self.on_trait_change(self._update_columns, 'columns', remove=True)
@@ -300,26 +314,7 @@ class TableEditor(Editor, BaseTableEditor):
         """Updates the editor when the object trait changes externally to the
         editor."""
 
-        if self._no_notify:
-            return
-
-        self.table_view.setUpdatesEnabled(False)
-        try:
-            filtering = len(self.factory.filters) > 0 or self.filter is not None
-            if filtering:
-                self._update_filtering()
-
-            # invalidate the model, but do not reset it. Resetting the model
-            # may cause problems if the selection sync'ed traits are being used
-            # externally to manage the selections
-            self.model.invalidate()
-
-            self.table_view.resizeColumnsToContents()
-            if self.auto_size:
-                self.table_view.resizeRowsToContents()
-
-        finally:
-            self.table_view.setUpdatesEnabled(True)
+        self._update_items()
 
     def restore_prefs ( self, prefs ):
         """ Restores any saved user preference information associated with the
@@ -345,6 +340,8 @@ class TableEditor(Editor, BaseTableEditor):
     def refresh_editor(self):
         """Requests that the underlying table widget to redraw itself."""
 
+        self._row_changes.reset()
+        self.source_model.invalidate_blocks()
         self.table_view.viewport().update()
 
     #---------------------------------------------------------------------------
@@ -427,13 +424,11 @@ class TableEditor(Editor, BaseTableEditor):
         # Selection mode is 'row' or 'rows'
         if mode.startswith('row'):
             flags |= QtGui.QItemSelectionModel.Rows
-            items = self.items()
+            row_for = self._row_index.row_for
             for obj in objects:
-                try:
-                    row = items.index(obj)
-                except ValueError:
-                    continue
-                indexes.append(self.source_model.index(row, source_column))
+                row = row_for(obj)
+                if row != -1:
+                    indexes.append(self.source_model.index(row, source_column))
 
         # Selection mode is 'column' or 'columns'
         elif mode.startswith('column'):
@@ -445,11 +440,10 @@ class TableEditor(Editor, BaseTableEditor):
 
         # Selection mode is 'cell' or 'cells'
         else:
-            items = self.items()
+            row_for = self._row_index.row_for
             for obj, name in objects:
-                try:
-                    row = items.index(obj)
-                except ValueError:
+                row = row_for(obj)
+                if row == -1:
                     continue
                 column = self._column_index_from_name(name)
                 if column != -1:
@@ -496,6 +490,49 @@ class TableEditor(Editor, BaseTableEditor):
         else:
             self.setx(filter = filter)
 
+    def _update_items(self, event=None):
+        """Updates the editor after the items have changed, either completely
+        or as described by the TraitListEvent *event*."""
+
+        self.source_model.invalidate_blocks()
+
+        change = None
+        if event is not None:
+            change = self._row_change(event)
+
+        if change is None:
+            self._row_index.reset()
+            self.model.reset_sort_keys()
+        else:
+            row, removed, added = change
+            self._row_index.items_changed(row, removed, added)
+            self.model.patch_sort_keys(row, len(removed), added)
+
+        filtering = len(self.factory.filters) > 0 or self.filter is not None
+        if self._no_notify:
+            # Keep the filter mask in step with the items even when the change
+            # originated from the model, since the proxy model relies on it:
+            if filtering:
+                self._patch_filtering(change)
+            return
+
+        self.table_view.setUpdatesEnabled(False)
+        try:
+            if filtering and not self._patch_filtering(change):
+                self._update_filtering()
+
+            # invalidate the model, but do not reset it. Resetting the model
+            # may cause problems if the selection sync'ed traits are being used
+            # externally to manage the selections
+            self.model.invalidate()
+
+            self.table_view.resizeColumnsToContents()
+            if self.auto_size:
+                self.table_view.resizeRowsToContents()
+
+        finally:
+            self.table_view.setUpdatesEnabled(True)
+
     def _update_filtering(self):
         """Update the filter summary and the filtered indices."""
 
@@ -514,6 +551,90 @@ class TableEditor(Editor, BaseTableEditor):
             self.filtered_indices = fi = [ i for i, ok in enumerate(fc) if ok ]
             self.filter_summary = '%i of %i items' % (len(fi), num_items)
 
+    def _row_change(self, event):
+        """Returns the change described by the TraitListEvent *event* as a
+        tuple (row, removed items, added items) expressed in the order of the
+        table rows, or None if it cannot be expressed that way."""
+
+        index = event.index
+        if not isinstance(index, int):
+            return None
+
+        added, removed = event.added, event.removed
+        if self.factory.reverse:
+            # Map the change to the (reversed) order of the table rows:
+            index = len(self.items()) - index - len(added)
+            added, removed = added[::-1], removed[::-1]
+
+        return (index, removed, added)
+
+    def _patch_filtering(self, change):
+        """Updates the filter mask and the filtered indices in place for the
+        *change* returned by '_row_change', only filtering the added items.
+        Returns False if the change cannot be applied incrementally (in which
+        case nothing is modified)."""
+
+        if change is None:
+            return False
+
+        index, removed, added = change
+        removed = len(removed)
+        num_items = len(self.items())
+        fc = self._filtered_cache
+        f = self.filter
+        if f is None:
+            mask = [ True ] * len(added)
+        elif fc is None or (len(fc) != (num_items - len(added) + removed)):
+            return False
+        else:
+            if not callable(f):
+                f = f.filter
+            mask = [ f(item) for item in added ]
+            fc[index: index + removed] = mask
+
+        # Replace the indices of the removed items by those of the added items
+        # and shift the indices of all following items:
+        fi = self.filtered_indices
+        first = bisect_left(fi, index)
+        last = bisect_left(fi, index + removed)
+        delta = len(added) - removed
+        fi[first:] = ([ index + i for i, ok in enumerate(mask) if ok ] +
+                      [ i + delta for i in fi[last:] ])
+
+        if f is None:
+            self.filter_summary = 'All %i items' % num_items
+        else:
+            self.filter_summary = '%i of %i items' % (len(fi), num_items)
+
+        return True
+
+    def _refilter_item(self, obj, row):
+        """Re-evaluates the current filter for a single item (at the specified
+        row) whose traits have changed, updating the filter mask and filtered
+        indices if its state has changed."""
+
+        f = self.filter
+        fc = self._filtered_cache
+        if f is None or fc is None:
+            return
+
+        if not callable(f):
+            f = f.filter
+        ok = f(obj)
+        if bool(ok) == bool(fc[row]):
+            fc[row] = ok
+            return
+
+        fc[row] = ok
+        fi = self.filtered_indices
+        position = bisect_left(fi, row)
+        if ok:
+            fi.insert(position, row)
+        else:
+            del fi[position]
+        self.filter_summary = '%i of %i items' % (len(fi), len(fc))
+        self.model.invalidateFilter()
+
     #-- Trait Property getters/setters -----------------------------------------
 
     @cached_property
@@ -561,6 +682,45 @@ class TableEditor(Editor, BaseTableEditor):
 
     #-- Trait Change Handlers --------------------------------------------------
 
+    def _item_trait_changed(self, object, name, old, new):
+        """Handles a trait on one of the items (or the list itself) being
+        changed."""
+
+        if ((object is self.object) and
+            (name in (self.name, self.name + '_items'))):
+            self.refresh_editor()
+            return
+
+        row = self._row_index.row_for(object)
+        if row == -1:
+            self._row_changes.add(None)
+            return
+
+        if (self._filtered_cache is not None) or self.model.has_sort_keys():
+            self._refilter_item(object, row)
+            self.model.update_sort_key(row)
+
+        # Only redraw the changed rows, once any other pending changes have
+        # been collected:
+        self._row_changes.add(row)
+
+    def _schedule_row_changes(self, flush):
+        """Schedules the collected row changes to be redrawn."""
+
+        QtCore.QTimer.singleShot(self.factory.update_interval, flush)
+
+    def _rows_changed(self, blocks):
+        """Redraws the specified blocks of changed rows (or the whole table if
+        blocks is None)."""
+
+        if self.control is None:
+            return
+
+        if blocks is None:
+            self.refresh_editor()
+        else:
+            self.source_model.rows_changed(blocks)
+
     def _filter_changed(self, old_filter, new_filter):
         """Handles the current filter being changed."""
 
@@ -580,6 +740,8 @@ class TableEditor(Editor, BaseTableEditor):
             if column.renderer:
                 self.table_view.setItemDelegateForColumn(i, column.renderer)
 
+        self.source_model.invalidate_blocks()
+        self.model.reset_sort_keys()
         self.model.reset()
         self.table_view.resizeColumnsToContents()
         if self.auto_size:
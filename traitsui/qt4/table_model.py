@@ -18,6 +18,7 @@
 
 from pyface.qt import QtCore, QtGui
 
+from traitsui.helper import LRUCache
 from traitsui.ui_traits import SequenceTypes
 
 #-------------------------------------------------------------------------------
@@ -41,6 +42,23 @@ v_alignment_map = {
 # MIME type for internal table drag/drop operations
 mime_type = 'traits-ui-table-editor'
 
+# The column roles fetched together for each cell of a data block:
+block_roles = ('value', 'tooltip', 'text_font', 'horizontal_alignment',
+               'vertical_alignment', 'cell_color', 'text_color')
+
+# The Qt roles served from the data blocks:
+block_qt_roles = set([
+    QtCore.Qt.DisplayRole, QtCore.Qt.ToolTipRole, QtCore.Qt.FontRole,
+    QtCore.Qt.TextAlignmentRole, QtCore.Qt.BackgroundRole,
+    QtCore.Qt.ForegroundRole
+])
+
+# The number of rows in each (single column) data block:
+block_rows = 32
+
+# The maximum number of data blocks cached by a model:
+max_blocks = 256
+
 def as_qcolor(color):
     """ Convert a color specification (maybe a tuple) into a QColor.
     """
@@ -63,6 +81,9 @@ class TableModel(QtCore.QAbstractTableModel):
 
         self._editor = editor
 
+        # The cache of recently fetched data blocks:
+        self._blocks = LRUCache(max_blocks)
+
     #---------------------------------------------------------------------------
     #  QAbstractTableModel interface:
     #---------------------------------------------------------------------------
@@ -80,51 +101,29 @@ class TableModel(QtCore.QAbstractTableModel):
     def data(self, mi, role):
         """Reimplemented to return the data."""
 
-        obj = self._editor.items()[mi.row()]
-        column = self._editor.columns[mi.column()]
+        if role == QtCore.Qt.EditRole:
+            role = QtCore.Qt.DisplayRole
 
-        if role == QtCore.Qt.DisplayRole or role == QtCore.Qt.EditRole:
-            text = column.get_value(obj)
-            if text is not None:
-                return text
+        if role in block_qt_roles:
+            row, column = mi.row(), mi.column()
+            if not self._editor.factory.cache_blocks:
+                return self._get_data(row, column, role)
 
-        elif role == QtCore.Qt.ToolTipRole:
-            tooltip = column.get_tooltip(obj)
-            if tooltip:
-                return tooltip
+            start = row - (row % block_rows)
+            key = (start, column)
+            block = self._blocks.get(key)
+            if block is None or (row - start) >= len(block):
+                block = self._blocks[key] = self._fetch_block(start, column)
 
-        elif role == QtCore.Qt.FontRole:
-            font = column.get_text_font(obj)
-            if font is not None:
-                return QtGui.QFont(font)
+            return block[row - start].get(role)
 
-        elif role == QtCore.Qt.TextAlignmentRole:
-            string = column.get_horizontal_alignment(obj)
-            h_alignment = h_alignment_map.get(string, QtCore.Qt.AlignLeft)
-            string = column.get_vertical_alignment(obj)
-            v_alignment = v_alignment_map.get(string, QtCore.Qt.AlignVCenter)
-            return (h_alignment | v_alignment)
-
-        elif role == QtCore.Qt.BackgroundRole:
-            color = column.get_cell_color(obj)
-            if color is None:
-                # FIXME: Yes, this is weird. It should work fine to fall through
-                # to the catch-all None at the end, but it doesn't.
-                return None
-            else:
-                q_color = as_qcolor(color)
-                return QtGui.QBrush(q_color)
-
-        elif role == QtCore.Qt.ForegroundRole:
-            color = column.get_text_color(obj)
-            if color is not None:
-                q_color = as_qcolor(color)
-                return QtGui.QBrush(q_color)
+        obj = self._editor.items()[mi.row()]
 
-        elif role == QtCore.Qt.UserRole:
+        if role == QtCore.Qt.UserRole:
             return obj
 
         elif role == QtCore.Qt.CheckStateRole:
+            column = self._editor.columns[mi.column()]
             if column.get_type(obj) == "bool" and column.show_checkbox:
                 if column.get_raw_value(obj):
                     return QtCore.Qt.Checked
@@ -184,6 +183,7 @@ class TableModel(QtCore.QAbstractTableModel):
 
         self.beginInsertRows(parent, row, row)
         editor.callx(editor.items().insert, row, obj)
+        self.invalidate_blocks()
         self.endInsertRows()
         return True
 
@@ -195,6 +195,7 @@ class TableModel(QtCore.QAbstractTableModel):
         self.beginInsertRows(parent, row, row + count - 1)
         for i in xrange(count):
             editor.callx(items.insert, row + i, editor.create_new_row())
+        self.invalidate_blocks()
         self.endInsertRows()
         return True
 
@@ -207,6 +208,7 @@ class TableModel(QtCore.QAbstractTableModel):
         self.beginRemoveRows(parent, row, row + count - 1)
         for i in xrange(count):
             editor.callx(items.pop, row + i)
+        self.invalidate_blocks()
         self.endRemoveRows()
         return True
 
@@ -251,6 +253,27 @@ class TableModel(QtCore.QAbstractTableModel):
     #  TableModel interface:
     #---------------------------------------------------------------------------
 
+    def invalidate_blocks(self):
+        """Discards all cached data blocks, so that the data is fetched again
+        from the columns the next time it is requested."""
+
+        self._blocks.clear()
+
+    def rows_changed(self, blocks):
+        """Discards the cached data for the specified blocks of rows, and
+        notifies the views that their data has changed. Each block is a
+        (first_row, last_row) tuple."""
+
+        last_column = self.columnCount(None) - 1
+        if last_column < 0:
+            return
+
+        signal = QtCore.SIGNAL('dataChanged(QModelIndex,QModelIndex)')
+        for first, last in blocks:
+            self._invalidate_rows(first, last)
+            self.emit(signal, self.index(first, 0),
+                      self.index(last, last_column))
+
     def moveRow(self, old_row, new_row):
         """Convenience method to move a single row."""
 
@@ -286,6 +309,95 @@ class TableModel(QtCore.QAbstractTableModel):
         # Update the selection for the new location.
         self._editor.set_selection(objects)
 
+    #---------------------------------------------------------------------------
+    #  Private methods:
+    #---------------------------------------------------------------------------
+
+    def _invalidate_rows(self, first, last):
+        """Discards the cached data blocks containing any of the rows from
+        first to last."""
+
+        for key in self._blocks.keys():
+            start = key[0]
+            if (start <= last) and ((start + block_rows) > first):
+                self._blocks.pop(key)
+
+    def _get_data(self, row, column_index, role):
+        """Returns the value of a Qt role for a cell, fetched directly from
+        its column."""
+
+        obj = self._editor.items()[row]
+        column = self._editor.columns[column_index]
+
+        if role == QtCore.Qt.DisplayRole:
+            return column.get_value(obj)
+
+        elif role == QtCore.Qt.ToolTipRole:
+            tooltip = column.get_tooltip(obj)
+            if tooltip:
+                return tooltip
+
+        elif role == QtCore.Qt.FontRole:
+            font = column.get_text_font(obj)
+            if font is not None:
+                return QtGui.QFont(font)
+
+        elif role == QtCore.Qt.TextAlignmentRole:
+            string = column.get_horizontal_alignment(obj)
+            h_alignment = h_alignment_map.get(string, QtCore.Qt.AlignLeft)
+            string = column.get_vertical_alignment(obj)
+            v_alignment = v_alignment_map.get(string, QtCore.Qt.AlignVCenter)
+            return (h_alignment | v_alignment)
+
+        elif role == QtCore.Qt.BackgroundRole:
+            color = column.get_cell_color(obj)
+            if color is not None:
+                return QtGui.QBrush(as_qcolor(color))
+
+        elif role == QtCore.Qt.ForegroundRole:
+            color = column.get_text_color(obj)
+            if color is not None:
+                return QtGui.QBrush(as_qcolor(color))
+
+        return None
+
+    def _fetch_block(self, start, column_index):
+        """Fetches the data for all roles of a block of rows of a column, and
+        returns it as a list containing a dictionary mapping each Qt role to
+        its value for each row."""
+
+        editor = self._editor
+        items = editor.items()
+        column = editor.columns[column_index]
+        end = min(start + block_rows, len(items))
+        objects = [ items[row] for row in xrange(start, end) ]
+
+        block = []
+        for (text, tooltip, font, h_alignment, v_alignment, cell_color,
+             text_color) in column.get_block(objects, block_roles):
+            data = {
+                QtCore.Qt.TextAlignmentRole:
+                    (h_alignment_map.get(h_alignment, QtCore.Qt.AlignLeft) |
+                     v_alignment_map.get(v_alignment, QtCore.Qt.AlignVCenter))
+            }
+
+            if text is not None:
+                data[QtCore.Qt.DisplayRole] = text
+            if tooltip:
+                data[QtCore.Qt.ToolTipRole] = tooltip
+            if font is not None:
+                data[QtCore.Qt.FontRole] = QtGui.QFont(font)
+            if cell_color is not None:
+                data[QtCore.Qt.BackgroundRole] = QtGui.QBrush(
+                    as_qcolor(cell_color))
+            if text_color is not None:
+                data[QtCore.Qt.ForegroundRole] = QtGui.QBrush(
+                    as_qcolor(text_color))
+
+            block.append(data)
+
+        return block
+
 #-------------------------------------------------------------------------------
 #  'SortFilterTableModel' class:
 #-------------------------------------------------------------------------------
@@ -301,6 +413,17 @@ class SortFilterTableModel(QtGui.QSortFilterProxyModel):
 
         self._editor = editor
 
+        # The index of the column whose sort keys have been extracted:
+        self._key_column = -1
+
+        # The sort keys of the items (in source row order), or None if they
+        # have not been extracted or the column must be sorted using 'cmp':
+        self._keys = None
+
+        # The rank of each item in the sorted order of the keys, or None if
+        # it must be recomputed:
+        self._ranks = None
+
     #---------------------------------------------------------------------------
     #  QSortFilterProxyModel interface:
     #---------------------------------------------------------------------------
@@ -319,15 +442,28 @@ class SortFilterTableModel(QtGui.QSortFilterProxyModel):
         return True
 
     def lessThan(self, left_mi, right_mi):
-        """Reimplemented to sort according to the 'cmp' method defined for
-        TableColumn."""
+        """Reimplemented to sort according to the sort keys extracted from the
+        column or, if the column does not support sort keys, according to the
+        'cmp' method defined for TableColumn."""
+
+        column = left_mi.column()
+        if column != self._key_column:
+            self._extract_sort_keys(column)
+
+        left, right = left_mi.row(), right_mi.row()
+        ranks = self._ranks
+        if ranks is not None:
+            return ranks[left] < ranks[right]
+
+        keys = self._keys
+        if keys is not None:
+            return keys[left] < keys[right]
 
         editor = self._editor
-        column = editor.columns[left_mi.column()]
+        column = editor.columns[column]
         items = editor.items()
-        left, right = items[left_mi.row()], items[right_mi.row()]
 
-        return column.cmp(left, right) < 0
+        return column.cmp(items[left], items[right]) < 0
 
     #---------------------------------------------------------------------------
     #  SortFilterTableModel interface:
@@ -346,3 +482,74 @@ class SortFilterTableModel(QtGui.QSortFilterProxyModel):
                          for row in current_rows ]
         new_row = self.mapToSource(self.index(new_row, 0)).row()
         source.moveRows(current_rows, new_row)
+
+    def reset_sort_keys(self):
+        """Discards the extracted sort keys, so that they are extracted again
+        the next time the table is sorted."""
+
+        self._key_column = -1
+        self._keys = self._ranks = None
+
+    def patch_sort_keys(self, row, removed, added):
+        """Updates the extracted sort keys after *removed* items have been
+        replaced by the *added* items at the specified source *row*."""
+
+        keys = self._keys
+        if keys is not None:
+            column = self._editor.columns[self._key_column]
+            new_keys = column.get_sort_keys(added)
+            if new_keys is None:
+                self.reset_sort_keys()
+            else:
+                if not isinstance(new_keys, list):
+                    new_keys = new_keys.tolist()
+                keys[row: row + removed] = new_keys
+                self._ranks = None
+
+    def update_sort_key(self, row):
+        """Re-extracts the sort key of the item at the specified source *row*
+        after one of its traits has changed."""
+
+        keys = self._keys
+        if keys is not None:
+            editor = self._editor
+            column = editor.columns[self._key_column]
+            keys[row] = column.get_sort_keys([ editor.items()[row] ])[0]
+            self._ranks = None
+
+    def has_sort_keys(self):
+        """Returns whether sort keys have been extracted for the items."""
+
+        return (self._keys is not None)
+
+    #---------------------------------------------------------------------------
+    #  Private methods:
+    #---------------------------------------------------------------------------
+
+    def _extract_sort_keys(self, column):
+        """Extracts the sort keys of all items for the specified column, and
+        ranks the items according to them."""
+
+        editor = self._editor
+        items = editor.items()
+        n = len(items)
+        keys = editor.columns[column].get_sort_keys(
+            [ items[i] for i in xrange(n) ])
+        self._key_column = column
+        self._keys = self._ranks = None
+        if keys is None:
+            return
+
+        if isinstance(keys, list):
+            order = sorted(xrange(n), key=keys.__getitem__)
+            ranks = [ 0 ] * n
+            for rank, row in enumerate(order):
+                ranks[row] = rank
+        else:
+            # A NumPy array of keys:
+            order = keys.argsort(kind='mergesort')
+            ranks = order.copy()
+            ranks[order] = xrange(n)
+            keys, ranks = keys.tolist(), ranks.tolist()
+
+        self._keys, self._ranks = keys, ranks
@@ -30,10 +30,12 @@ from pyface.image_resource import ImageResource
 from traits.api import (Any, Bool, Callable, Event, HasStrictTraits, Instance,
     Int, List, NO_COMPARE, Property, TraitListEvent)
 
+from traitsui.helper import RowChanges, RowIndex
 from traitsui.tabular_adapter import TabularAdapter
 from traitsui.ui_traits import Image
 
 from editor import Editor
+from helper import icon_cache
 from tabular_model import TabularModel
 
 
@@ -54,6 +56,10 @@ class TabularEditor(Editor):
         lists of objects, etc).
     """
 
+    # The editor listens to the edited object itself, so it cannot be
+    # re-targeted at a new context:
+    retargetable = False
+
     #-- Trait Definitions ------------------------------------------------------
 
     # The event fired when a table update is needed:
@@ -136,6 +142,10 @@ class TabularEditor(Editor):
         factory = self.factory
         adapter = self.adapter = factory.adapter
         self.model = TabularModel(editor=self)
+        self._row_index = RowIndex(lambda: self.value)
+        self._row_changes = RowChanges(self._rows_changed,
+                                       self._schedule_row_changes,
+                                       factory.update_batch_size)
 
         # Create the control
         control = self.control = self.widget_factory(self)
@@ -195,7 +205,7 @@ class TabularEditor(Editor):
         # replacements:
         try:
             self.context_object.on_trait_change(
-                self.update_editor, self.extended_name+'_items', dispatch='ui')
+                self._update_items, self.extended_name+'_items', dispatch='ui')
         except:
             pass
 
@@ -203,7 +213,8 @@ class TabularEditor(Editor):
         # appropriate listeners:
         if factory.auto_update:
             self.context_object.on_trait_change(
-                self.refresh_editor, self.extended_name + '.-', dispatch='ui')
+                self._item_trait_changed, self.extended_name + '.-',
+                dispatch='ui')
 
         # Create the mapping from user supplied images to QImages:
         for image_resource in factory.images:
@@ -222,11 +233,14 @@ class TabularEditor(Editor):
         """ Disposes of the contents of an editor.
         """
         self.context_object.on_trait_change(
-            self.update_editor, self.extended_name + '_items', remove=True)
+            self._update_items, self.extended_name + '_items', remove=True)
 
         if self.factory.auto_update:
             self.context_object.on_trait_change(
-                self.refresh_editor, self.extended_name + '.-', remove=True)
+                self._item_trait_changed, self.extended_name + '.-',
+                remove=True)
+
+        self._row_changes.reset()
 
         self.on_trait_change(self.refresh_editor, 'adapter.+update',
                              remove=True)
@@ -241,6 +255,59 @@ class TabularEditor(Editor):
         """ Updates the editor when the object trait changes externally to the
             editor.
         """
+        self._row_index.reset()
+        self._update_model()
+
+    def _update_items(self, event):
+        """ Updates the editor when the items of the object trait change.
+        """
+        if isinstance(event.index, int):
+            self._row_index.items_changed(event.index, event.removed,
+                                          event.added)
+        else:
+            self._row_index.reset()
+
+        self._update_model()
+
+    def _item_trait_changed(self, object, name, old, new):
+        """ Handles a trait of one of the items (or the list itself) being
+            changed.
+        """
+        if ((object is self.object) and
+            (name in (self.name, self.name + '_items'))):
+            self.refresh_editor()
+            return
+
+        # Only redraw the changed row, once any other pending changes have
+        # been collected:
+        row = self._row_index.row_for(object)
+        if ((row == -1) or
+            (self.adapter.get_item(self.object, self.name, row) is not object)):
+            row = None
+
+        self._row_changes.add(row)
+
+    def _schedule_row_changes(self, flush):
+        """ Schedules the collected row changes to be redrawn.
+        """
+        QtCore.QTimer.singleShot(self.factory.update_interval, flush)
+
+    def _rows_changed(self, blocks):
+        """ Redraws the specified blocks of changed rows (or the whole table if
+            blocks is None).
+        """
+        if self.control is None:
+            return
+
+        if blocks is None:
+            self.refresh_editor()
+        else:
+            self.model.rows_changed(blocks)
+
+    def _update_model(self):
+        """ Updates the table model after the object trait has changed.
+        """
+        self.model.invalidate_blocks()
         if not self._no_update:
             self.model.reset()
             if self.factory.multi_select:
@@ -255,6 +322,8 @@ class TabularEditor(Editor):
     def refresh_editor(self):
         """ Requests the table view to redraw itself.
         """
+        self._row_changes.reset()
+        self.model.invalidate_blocks()
         self.control.viewport().update()
 
     def callx(self, func, *args, **kw):
@@ -306,7 +375,7 @@ class TabularEditor(Editor):
     def _add_image(self, image_resource):
         """ Adds a new image to the image map.
         """
-        image = image_resource.create_icon()
+        image = icon_cache(image_resource)
 
         self.image_resources[image_resource] = image
         self.images[image_resource.name] = image
@@ -347,11 +416,12 @@ class TabularEditor(Editor):
     def _selected_changed(self, new):
         if not self._no_update:
             try:
-                selected_row = self.value.index(new)
+                selected_row = self._row_index.row_for(new)
             except:
                 pass
             else:
-                self._selected_row_changed(selected_row)
+                if selected_row != -1:
+                    self._selected_row_changed(selected_row)
 
     def _selected_row_changed(self, selected_row):
         if not self._no_update:
@@ -365,24 +435,26 @@ class TabularEditor(Editor):
 
     def _multi_selected_changed(self, new):
         if not self._no_update:
-            values = self.value
+            row_for = self._row_index.row_for
             try:
-                rows = [ values.index(i) for i in new]
+                rows = [ row_for(i) for i in new]
             except:
                 pass
             else:
-                self._multi_selected_rows_changed(rows)
+                if -1 not in rows:
+                    self._multi_selected_rows_changed(rows)
 
     def _multi_selected_items_changed(self, event):
-        values = self.value
+        row_for = self._row_index.row_for
         try:
-            added = [ values.index(item) for item in event.added ]
-            removed = [ values.index(item) for item in event.removed ]
+            added = [ row_for(item) for item in event.added ]
+            removed = [ row_for(item) for item in event.removed ]
         except:
             pass
         else:
-            list_event = TraitListEvent(0, added, removed)
-            self._multi_selected_rows_items_changed(list_event)
+            if (-1 not in added) and (-1 not in removed):
+                list_event = TraitListEvent(0, added, removed)
+                self._multi_selected_rows_items_changed(list_event)
 
     def _multi_selected_rows_changed(self, selected_rows):
         if not self._no_update:
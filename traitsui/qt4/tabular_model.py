@@ -24,6 +24,7 @@
 
 from pyface.qt import QtCore, QtGui
 
+from traitsui.helper import LRUCache
 from traitsui.ui_traits import SequenceTypes
 
 #-------------------------------------------------------------------------------
@@ -41,6 +42,23 @@ alignment_map = {
 # MIME type for internal table drag/drop operations
 tabular_mime_type = 'traits-ui-tabular-editor'
 
+# The adapter roles fetched together for each item of a data block:
+block_roles = ( 'text', 'image', 'tooltip', 'font', 'alignment', 'bg_color',
+                'text_color' )
+
+# The Qt roles served from the data blocks:
+block_qt_roles = set([
+    QtCore.Qt.DisplayRole, QtCore.Qt.DecorationRole, QtCore.Qt.ToolTipRole,
+    QtCore.Qt.FontRole, QtCore.Qt.TextAlignmentRole, QtCore.Qt.BackgroundRole,
+    QtCore.Qt.ForegroundRole
+])
+
+# The number of rows in each (single column) data block:
+block_rows = 32
+
+# The maximum number of data blocks cached by a model:
+max_blocks = 256
+
 #-------------------------------------------------------------------------------
 #  'TabularModel' class:
 #-------------------------------------------------------------------------------
@@ -55,6 +73,9 @@ class TabularModel(QtCore.QAbstractTableModel):
 
         self._editor = editor
 
+        # The cache of recently fetched data blocks:
+        self._blocks = LRUCache(max_blocks)
+
     #---------------------------------------------------------------------------
     #  QAbstractItemModel interface:
     #---------------------------------------------------------------------------
@@ -62,53 +83,22 @@ class TabularModel(QtCore.QAbstractTableModel):
     def data(self, mi, role):
         """ Reimplemented to return the data.
         """
-        editor = self._editor
-        adapter = editor.adapter
-        obj, name = editor.object, editor.name
-        row, column = mi.row(), mi.column()
-
-        if role == QtCore.Qt.DisplayRole or role == QtCore.Qt.EditRole:
-            return adapter.get_text(obj, name, row, column)
-
-        elif role == QtCore.Qt.DecorationRole:
-            image = editor._get_image(adapter.get_image(obj, name, row, column))
-            if image is not None:
-                return image
-
-        elif role == QtCore.Qt.ToolTipRole:
-            tooltip = adapter.get_tooltip(obj, name, row, column)
-            if tooltip:
-                return tooltip
-
-        elif role == QtCore.Qt.FontRole:
-            font = adapter.get_font(obj, name, row, column)
-            if font is not None:
-                return QtGui.QFont(font)
-
-        elif role == QtCore.Qt.TextAlignmentRole:
-            string = adapter.get_alignment(obj, name, column)
-            alignment = alignment_map.get(string, QtCore.Qt.AlignLeft)
-            return (alignment | QtCore.Qt.AlignVCenter)
+        if role == QtCore.Qt.EditRole:
+            role = QtCore.Qt.DisplayRole
+        elif role not in block_qt_roles:
+            return None
 
-        elif role == QtCore.Qt.BackgroundRole:
-            color = adapter.get_bg_color(obj, name, row, column)
-            if color is not None:
-                if isinstance(color, SequenceTypes):
-                    q_color = QtGui.QColor(*color)
-                else:
-                    q_color = QtGui.QColor(color)
-                return QtGui.QBrush(q_color)
+        row, column = mi.row(), mi.column()
+        if not self._editor.factory.cache_blocks:
+            return self._get_data(row, column, role)
 
-        elif role == QtCore.Qt.ForegroundRole:
-            color = adapter.get_text_color(obj, name, row, column)
-            if color is not None:
-                if isinstance(color, SequenceTypes):
-                    q_color = QtGui.QColor(*color)
-                else:
-                    q_color = QtGui.QColor(color)
-                return QtGui.QBrush(q_color)
+        start = row - (row % block_rows)
+        key = (start, column)
+        block = self._blocks.get(key)
+        if block is None or (row - start) >= len(block):
+            block = self._blocks[key] = self._fetch_block(start, column)
 
-        return None
+        return block[row - start].get(role)
 
     def setData(self, mi, value, role):
         """ Reimplmented to allow for modification for the object trait.
@@ -121,6 +111,7 @@ class TabularModel(QtCore.QAbstractTableModel):
         row, column = mi.row(), mi.column()
 
         editor.adapter.set_text(obj, name, row, column, value)
+        self.invalidate_blocks()
         signal = QtCore.SIGNAL('dataChanged(QModelIndex,QModelIndex)')
         self.emit(signal, mi, mi)
         return True
@@ -192,6 +183,7 @@ class TabularModel(QtCore.QAbstractTableModel):
             obj = adapter.get_default_value(editor.object, editor.name)
         self.beginInsertRows(parent, row, row)
         editor.callx(editor.adapter.insert, editor.object, editor.name, row, obj)
+        self.invalidate_blocks()
         self.endInsertRows()
         return True
 
@@ -205,6 +197,7 @@ class TabularModel(QtCore.QAbstractTableModel):
         for i in xrange(count):
             value = adapter.get_default_value(editor.object, editor.name)
             editor.callx(adapter.insert, editor.object, editor.name, row, value)
+        self.invalidate_blocks()
         self.endInsertRows()
         return True
 
@@ -217,6 +210,7 @@ class TabularModel(QtCore.QAbstractTableModel):
         self.beginRemoveRows(parent, row, row + count - 1)
         for i in xrange(count):
             editor.callx(adapter.delete, editor.object, editor.name, row)
+        self.invalidate_blocks()
         self.endRemoveRows()
         n = self.rowCount(None)
         if not editor.factory.multi_select:
@@ -267,6 +261,27 @@ class TabularModel(QtCore.QAbstractTableModel):
     #  TabularModel interface:
     #---------------------------------------------------------------------------
 
+    def invalidate_blocks(self):
+        """ Discards all cached data blocks, so that the data is fetched again
+            from the adapter the next time it is requested.
+        """
+        self._blocks.clear()
+
+    def rows_changed(self, blocks):
+        """ Discards the cached data for the specified blocks of rows, and
+            notifies the views that their data has changed. Each block is a
+            (first_row, last_row) tuple.
+        """
+        last_column = self.columnCount(None) - 1
+        if last_column < 0:
+            return
+
+        signal = QtCore.SIGNAL('dataChanged(QModelIndex,QModelIndex)')
+        for first, last in blocks:
+            self._invalidate_rows(first, last)
+            self.emit(signal, self.index(first, 0),
+                      self.index(last, last_column))
+
     def moveRow(self, old_row, new_row):
         """ Convenience method to move a single row.
         """
@@ -308,3 +323,108 @@ class TabularModel(QtCore.QAbstractTableModel):
         else:
             editor.setx(selected = objects[0])
             editor.selected_row = new_row
+
+    #---------------------------------------------------------------------------
+    #  Private methods:
+    #---------------------------------------------------------------------------
+
+    def _invalidate_rows(self, first, last):
+        """ Discards the cached data blocks containing any of the rows from
+            first to last.
+        """
+        for key in self._blocks.keys():
+            start = key[0]
+            if (start <= last) and ((start + block_rows) > first):
+                self._blocks.pop(key)
+
+    def _get_data(self, row, column, role):
+        """ Returns the value of a Qt role for a cell, fetched directly from
+            the adapter.
+        """
+        editor = self._editor
+        adapter = editor.adapter
+        obj, name = editor.object, editor.name
+
+        if role == QtCore.Qt.DisplayRole:
+            return adapter.get_text(obj, name, row, column)
+
+        elif role == QtCore.Qt.DecorationRole:
+            return editor._get_image(adapter.get_image(obj, name, row, column))
+
+        elif role == QtCore.Qt.ToolTipRole:
+            tooltip = adapter.get_tooltip(obj, name, row, column)
+            if tooltip:
+                return tooltip
+
+        elif role == QtCore.Qt.FontRole:
+            font = adapter.get_font(obj, name, row, column)
+            if font is not None:
+                return QtGui.QFont(font)
+
+        elif role == QtCore.Qt.TextAlignmentRole:
+            string = adapter.get_alignment(obj, name, column)
+            alignment = alignment_map.get(string, QtCore.Qt.AlignLeft)
+            return (alignment | QtCore.Qt.AlignVCenter)
+
+        elif role == QtCore.Qt.BackgroundRole:
+            color = adapter.get_bg_color(obj, name, row, column)
+            if color is not None:
+                return as_qbrush(color)
+
+        elif role == QtCore.Qt.ForegroundRole:
+            color = adapter.get_text_color(obj, name, row, column)
+            if color is not None:
+                return as_qbrush(color)
+
+        return None
+
+    def _fetch_block(self, start, column):
+        """ Fetches the data for all roles of a block of rows of a column from
+            the adapter, and returns it as a list containing a dictionary
+            mapping each Qt role to its value for each row.
+        """
+        editor = self._editor
+        adapter = editor.adapter
+        obj, name = editor.object, editor.name
+        end = min(start + block_rows, adapter.len(obj, name))
+        rows = range(start, end)
+        values = adapter.get_block(obj, name, rows, [column], block_roles)
+
+        block = []
+        for row in rows:
+            text, image, tooltip, font, alignment, bg_color, text_color = \
+                values[(row, column)]
+            data = {
+                QtCore.Qt.DisplayRole: text,
+                QtCore.Qt.TextAlignmentRole:
+                    (alignment_map.get(alignment, QtCore.Qt.AlignLeft) |
+                     QtCore.Qt.AlignVCenter)
+            }
+
+            image = editor._get_image(image)
+            if image is not None:
+                data[QtCore.Qt.DecorationRole] = image
+            if tooltip:
+                data[QtCore.Qt.ToolTipRole] = tooltip
+            if font is not None:
+                data[QtCore.Qt.FontRole] = QtGui.QFont(font)
+            if bg_color is not None:
+                data[QtCore.Qt.BackgroundRole] = as_qbrush(bg_color)
+            if text_color is not None:
+                data[QtCore.Qt.ForegroundRole] = as_qbrush(text_color)
+
+            block.append(data)
+
+        return block
+
+#-------------------------------------------------------------------------------
+#  Helper functions:
+#-------------------------------------------------------------------------------
+
+def as_qbrush(color):
+    """ Convert a color specification (maybe a tuple) into a QBrush.
+    """
+    if isinstance(color, SequenceTypes):
+        return QtGui.QBrush(QtGui.QColor(*color))
+
+    return QtGui.QBrush(QtGui.QColor(color))
@@ -36,6 +36,9 @@ from editor_factory \
 from constants \
     import OKColor
 
+from helper \
+    import Debouncer
+
 #-------------------------------------------------------------------------------
 #  'SimpleEditor' class:
 #-------------------------------------------------------------------------------
@@ -87,12 +90,24 @@ class SimpleEditor ( Editor ):
             control.setEchoMode(QtGui.QLineEdit.Password)
 
         if factory.auto_set and not factory.is_grid_cell:
+            update = self.update_object
+            if factory.auto_set_delay > 0:
+                # Only set the value once the user stops typing, when the
+                # control loses the focus, or when Enter is pressed:
+                self._debouncer = Debouncer(factory.auto_set_delay,
+                                            self.update_object)
+                self._debouncer.watch(control)
+                update = self._debouncer.trigger
+                if not multi_line:
+                    QtCore.QObject.connect(control,
+                        QtCore.SIGNAL('returnPressed()'), self.flush)
+
             if wtype == QtGui.QTextEdit:
                 QtCore.QObject.connect(control,
-                    QtCore.SIGNAL('textChanged()'), self.update_object)
+                    QtCore.SIGNAL('textChanged()'), update)
             else:
                 QtCore.QObject.connect(control,
-                    QtCore.SIGNAL('textEdited(QString)'), self.update_object)
+                    QtCore.SIGNAL('textEdited(QString)'), update)
 
         else:
             # Assume enter_set is set, otherwise the value will never get
@@ -140,6 +155,10 @@ class SimpleEditor ( Editor ):
             unequal = True
 
         if unequal:
+            # The new value replaces any input still waiting to be set:
+            if self._debouncer is not None:
+                self._debouncer.cancel()
+
             self._no_update = True
             self.control.setText(self.str_value)
             self._no_update = False
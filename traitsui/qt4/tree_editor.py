@@ -34,6 +34,8 @@ from traitsui.menu import Menu, Action, Separator
 from clipboard import clipboard, PyMimeData
 from editor import Editor
 from helper import pixmap_cache
+from traitsui.helper import UIPool, match_items
+from tree_model import TreeModel, TreeRecord
 
 logger = logging.getLogger(__name__)
 
@@ -124,7 +126,9 @@ class SimpleEditor ( Editor ):
                     self.control = sa = QtGui.QScrollArea()
                     sa.setFrameShape(QtGui.QFrame.NoFrame)
                     sa.setWidgetResizable(True)
-                    self.control._node_ui = self.control._editor_nid = None
+                    self.control._node_ui = self.control._editor_nid = \
+                        self.control._node_key = None
+                    self.control._ui_pool = UIPool( factory.editor_cache_size )
 
                     # Check to see if there are any existing editors that are
                     # waiting to be bound to the trait editor panel:
@@ -158,15 +162,16 @@ class SimpleEditor ( Editor ):
                     self._editor = editor.control
 
                 # Finally, create only the tree control:
-                self.control = self._tree = _TreeWidget(self)
+                self.control = self._tree = self._create_tree()
             else:
                 # If editable, create a tree control and an editor panel:
-                self._tree = _TreeWidget(self)
+                self._tree = self._create_tree()
 
                 self._editor = sa = QtGui.QScrollArea()
                 sa.setFrameShape(QtGui.QFrame.NoFrame)
                 sa.setWidgetResizable(True)
-                sa._node_ui = sa._editor_nid = None
+                sa._node_ui = sa._editor_nid = sa._node_key = None
+                sa._ui_pool = UIPool( factory.editor_cache_size )
 
                 if factory.orientation == 'horizontal':
                     orient = QtCore.Qt.Horizontal
@@ -180,7 +185,7 @@ class SimpleEditor ( Editor ):
                 splitter.addWidget(sa)
         else:
             # Otherwise, just create the tree control:
-            self.control = self._tree = _TreeWidget(self)
+            self.control = self._tree = self._create_tree()
 
         # Set up the mapping between objects and tree id's:
         self._map = {}
@@ -196,6 +201,15 @@ class SimpleEditor ( Editor ):
         self.sync_value( factory.dclick,   'dclick', 'to' )
         self.sync_value( factory.veto,     'veto',   'from' )
 
+    #---------------------------------------------------------------------------
+    #  Creates the tree control:
+    #---------------------------------------------------------------------------
+
+    def _create_tree ( self ):
+        """ Creates the tree control used by the editor.
+        """
+        return _TreeWidget( self )
+
     #---------------------------------------------------------------------------
     #  Handles the 'selection' trait being changed:
     #---------------------------------------------------------------------------
@@ -261,8 +275,26 @@ class SimpleEditor ( Editor ):
 
             self._tree = None
 
+        self._dispose_ui_pool()
+
         super( SimpleEditor, self ).dispose()
 
+    #---------------------------------------------------------------------------
+    #  Disposes of the node editor user interfaces kept for reuse:
+    #---------------------------------------------------------------------------
+
+    def _dispose_ui_pool ( self ):
+        """ Disposes of the node editor user interfaces kept for reuse by the
+            editor panel this editor owns (if any).
+        """
+        if self.factory.shared_editor:
+            panel = self.control if self.factory._editor is self else None
+        else:
+            panel = self._editor
+
+        if panel is not None:
+            panel._ui_pool.clear()
+
     #---------------------------------------------------------------------------
     #  Expands from the specified node the specified number of sub-levels:
     #---------------------------------------------------------------------------
@@ -409,8 +441,11 @@ class SimpleEditor ( Editor ):
         """ Create  a new TreeWidgetItem as per word_wrap policy.
 
         Index is the index of the new node in the parent:
-            None implies append the child to the end. """
-        if index is None:
+            None implies append the child to the end. If nid is None, the
+            item is created without a parent. """
+        if nid is None:
+            cnid = QtGui.QTreeWidgetItem()
+        elif index is None:
             cnid = QtGui.QTreeWidgetItem(nid)
         else:
             cnid = QtGui.QTreeWidgetItem()
@@ -451,25 +486,148 @@ class SimpleEditor ( Editor ):
 
         cnid = self._create_item(nid, node, object, index)
 
+        # Automatically expand the new node (if requested):
+        if self._setup_item( cnid, node, object ):
+            cnid.setExpanded(True)
+
+        # Return the newly created node:
+        return cnid
+
+    #---------------------------------------------------------------------------
+    #  Sets up the data and listeners of a newly created node:
+    #---------------------------------------------------------------------------
+
+    def _setup_item ( self, cnid, node, object ):
+        """ Sets up the data and listeners of a newly created node, and returns
+            whether it should be expanded automatically.
+        """
         has_children = self._has_children(node, object)
         self._set_node_data( cnid, ( False, node, object ) )
         self._map.setdefault( id( object ), [] ).append(
             ( node.get_children_id(object), cnid ) )
         self._add_listeners( node, object )
 
-        # Automatically expand the new node (if requested):
         if has_children:
             if node.can_auto_open( object ):
-                cnid.setExpanded(True)
-            else:
-                # Qt only draws the control that expands the tree if there is a
-                # child.  As the tree is being populated lazily we create a
-                # dummy that will be removed when the node is expanded for the
-                # first time.
-                cnid._dummy = QtGui.QTreeWidgetItem(cnid)
+                return True
 
-        # Return the newly created node:
-        return cnid
+            # Qt only draws the control that expands the tree if there is a
+            # child.  As the tree is being populated lazily we create a
+            # dummy that will be removed when the node is expanded for the
+            # first time.
+            cnid._dummy = QtGui.QTreeWidgetItem(cnid)
+
+        return False
+
+    #---------------------------------------------------------------------------
+    #  Creates the nodes for a list of child objects:
+    #---------------------------------------------------------------------------
+
+    def _new_nodes ( self, children ):
+        """ Creates (without inserting them into the tree) the nodes for a list
+            of child objects. Returns the new nodes, and the subset of them
+            which should be expanded once they are in the tree.
+        """
+        cnids     = []
+        auto_open = []
+        for child in children:
+            child, child_node = self._node_for( child )
+            if child_node is not None:
+                cnid = self._create_item( None, child_node, child )
+                if self._setup_item( cnid, child_node, child ):
+                    auto_open.append( cnid )
+                cnids.append( cnid )
+
+        return ( cnids, auto_open )
+
+    #---------------------------------------------------------------------------
+    #  Reconciles the child nodes of a node with a new list of child objects:
+    #---------------------------------------------------------------------------
+
+    def _reconcile_children ( self, nid, children ):
+        """ Updates the child nodes of an expanded node to match a new list of
+            child objects.
+
+            Child nodes whose object (and tree node) is still present are
+            kept, together with their listeners, children, expansion and
+            selection state, and only moved into their new position. Nodes
+            for objects which are no longer present are deleted, and nodes
+            for new objects are created, all as a single bulk update.
+        """
+        tree     = self._tree
+        old_nids = self._nodes_for( nid )
+        resolved = [ self._node_for( child ) for child in children ]
+        matches  = match_items( [ self._get_node_data( cnid )[2]
+                                  for cnid in old_nids ],
+                                [ child for child, child_node in resolved ] )
+
+        new_nids = []
+        kept     = set()
+        for ( child, child_node ), i in zip( resolved, matches ):
+            if ((i >= 0) and
+                (self._get_node_data( old_nids[i] )[1] is child_node)):
+                new_nids.append( old_nids[i] )
+                kept.add( i )
+            elif child_node is not None:
+                new_nids.append( ( child, child_node ) )
+
+        # Nothing to do if the children are unchanged:
+        if ((matches == range( len( old_nids ) )) and
+            (len( kept ) == len( old_nids ))):
+            return
+
+        selected = set( [ id( cnid ) for cnid in tree.selectedItems() ] )
+        tree.setUpdatesEnabled(False)
+        blk = tree.blockSignals(True)
+        try:
+            # Delete the nodes for the objects no longer present:
+            for i, cnid in enumerate( old_nids ):
+                if i not in kept:
+                    self._delete_node( cnid )
+
+            # Remember the view state of the nodes being kept, since it is
+            # lost while they are out of the tree:
+            states = []
+            for i in kept:
+                self._save_item_state( old_nids[i], states )
+
+            nid.takeChildren()
+
+            # Create the nodes for the new objects:
+            auto_open = []
+            for i, item in enumerate( new_nids ):
+                if isinstance( item, tuple ):
+                    child, child_node = item
+                    new_nids[i] = cnid = self._create_item( None, child_node,
+                                                            child )
+                    if self._setup_item( cnid, child_node, child ):
+                        auto_open.append( cnid )
+
+            nid.addChildren( new_nids )
+
+            for cnid, expanded, is_selected in states:
+                cnid.setExpanded( expanded )
+                cnid.setSelected( is_selected )
+        finally:
+            tree.blockSignals(blk)
+            tree.setUpdatesEnabled(True)
+
+        for cnid in auto_open:
+            cnid.setExpanded(True)
+
+        # Let everyone know if the selection was affected:
+        if selected != set( [ id( cnid ) for cnid in tree.selectedItems() ] ):
+            self._on_tree_sel_changed()
+
+    def _save_item_state ( self, nid, states ):
+        """ Appends the expansion and selection state of a node and all of its
+            expanded descendants to a list.
+        """
+        expanded = nid.isExpanded()
+        states.append( ( nid, expanded, nid.isSelected() ) )
+        if expanded:
+            for cnid in self._nodes_for( nid ):
+                self._save_item_state( cnid, states )
 
     #---------------------------------------------------------------------------
     #  Deletes a specified tree node and all its children:
@@ -685,52 +843,7 @@ class SimpleEditor ( Editor ):
             isinstance( object[1], TreeNode )):
             return object
 
-        # Select all nodes which understand this object:
-        factory = self.factory
-        nodes   = [ node for node in factory.nodes
-                    if node.is_node_for( object ) ]
-
-        # If only one found, we're done, return it:
-        if len( nodes ) == 1:
-            return ( object, nodes[0] )
-
-        # If none found, give up:
-        if len( nodes ) == 0:
-            return ( object, ITreeNodeAdapterBridge(adapter=object) )
-
-        # Use all selected nodes that have the same 'node_for' list as the
-        # first selected node:
-        base  = nodes[0].node_for
-        nodes = [ node for node in nodes if base == node.node_for ]
-
-        # If only one left, then return that node:
-        if len( nodes ) == 1:
-            return ( object, nodes[0] )
-
-        # Otherwise, return a MultiTreeNode based on all selected nodes...
-
-        # Use the node with no specified children as the root node. If not
-        # found, just use the first selected node as the 'root node':
-        root_node = None
-        for i, node in enumerate( nodes ):
-            if node.children == '':
-                root_node = node
-                del nodes[i]
-                break
-        else:
-            root_node = nodes[0]
-
-        # If we have a matching MultiTreeNode already cached, return it:
-        key = ( root_node, ) + tuple( nodes )
-        if key in factory.multi_nodes:
-            return ( object, factory.multi_nodes[ key ] )
-
-        # Otherwise create one, cache it, and return it:
-        factory.multi_nodes[ key ] = multi_node = MultiTreeNode(
-                                                       root_node = root_node,
-                                                       nodes     = nodes )
-
-        return ( object, multi_node )
+        return ( object, self.factory.node_for_object( object ) )
 
     #---------------------------------------------------------------------------
     #  Returns the TreeNode associated with a specified class:
@@ -739,10 +852,7 @@ class SimpleEditor ( Editor ):
     def _node_for_class ( self, klass ):
         """ Returns the TreeNode associated with a specified class.
         """
-        for node in self.factory.nodes:
-            if issubclass( klass, tuple( node.node_for ) ):
-                return node
-        return None
+        return self.factory.node_for_class( klass )
 
     #---------------------------------------------------------------------------
     #  Returns the node and class associated with a specified class name:
@@ -751,11 +861,7 @@ class SimpleEditor ( Editor ):
     def _node_for_class_name ( self, class_name ):
         """ Returns the node and class associated with a specified class name.
         """
-        for node in self.factory.nodes:
-            for klass in node.node_for:
-                if class_name == klass.__name__:
-                    return ( node, klass )
-        return ( None, None )
+        return self.factory.node_for_class_name( class_name )
 
     #---------------------------------------------------------------------------
     #  Updates the icon for a specified node:
@@ -866,9 +972,15 @@ class SimpleEditor ( Editor ):
         """
         editor = self._editor
         if editor._node_ui is not None:
-            editor.setWidget(None)
-            editor._node_ui.dispose()
-            editor._node_ui = editor._editor_nid = None
+            ui, key = editor._node_ui, editor._node_key
+            if key is not None:
+                # Keep the user interface so it can be reused later:
+                editor.takeWidget()
+                editor._ui_pool.add( key, ui )
+            else:
+                editor.setWidget(None)
+                ui.dispose()
+            editor._node_ui = editor._editor_nid = editor._node_key = None
 
     #---------------------------------------------------------------------------
     #  Gets/Sets the node specific data:
@@ -1066,32 +1178,42 @@ class SimpleEditor ( Editor ):
 
             # If there is a selected object, create a new editor for it:
             if object is not None:
-                # Try to chain the undo history to the main undo history:
                 view = node.get_view( object )
                 if view is None or isinstance(view, str) :
                     view = object.trait_view(view)
 
-                if (self.ui.history is not None) or (view.kind == 'subpanel'):
-                    ui = object.edit_traits( parent = editor,
-                                             view   = view,
-                                             kind   = 'subpanel' )
-                else:
-                    # Otherwise, just set up our own new one:
-                    ui = object.edit_traits( parent = editor,
-                                             view   = view,
-                                             kind   = 'panel' )
-
-
-                # Make our UI the parent of the new UI:
-                ui.parent = self.ui
+                # Try to reuse a previously built editor for the same view and
+                # class of object:
+                ui = key = None
+                if (editor._ui_pool.size > 0) and node.can_reuse_view(object):
+                    key = ( view, object.__class__ )
+                    ui  = editor._ui_pool.get( key, object.trait_context() )
+
+                if ui is None:
+                    # Try to chain the undo history to the main undo history:
+                    if ((self.ui.history is not None) or
+                        (view.kind == 'subpanel')):
+                        ui = object.edit_traits( parent = editor,
+                                                 view   = view,
+                                                 kind   = 'subpanel' )
+                    else:
+                        # Otherwise, just set up our own new one:
+                        ui = object.edit_traits( parent = editor,
+                                                 view   = view,
+                                                 kind   = 'panel' )
+
+                    # Make our UI the parent of the new UI:
+                    ui.parent = self.ui
 
                 # Remember the new editor's UI and node info:
                 editor._node_ui    = ui
                 editor._editor_nid = nid
+                editor._node_key   = key
 
                 # Finish setting up the editor:
                 ui.control.layout().setContentsMargins(0, 0, 0, 0)
                 editor.setWidget(ui.control)
+                ui.control.show()
 
             # Allow the editor view to show any changes that have occurred:
             editor.setUpdatesEnabled(True)
@@ -1504,15 +1626,7 @@ class SimpleEditor ( Editor ):
 
             # Only add/remove the changes if the node has already been expanded:
             if expanded:
-                # Delete all current child nodes:
-                for cnid in self._nodes_for( nid ):
-                    self._delete_node( cnid )
-
-                # Add all of the children back in as new nodes:
-                for child in children:
-                    child, child_node = self._node_for( child )
-                    if child_node is not None:
-                        self._append_node( nid, child_node, child )
+                self._reconcile_children( nid, children )
 
             # Try to expand the node (if requested):
             if node.can_auto_open( object ):
@@ -1532,7 +1646,6 @@ class SimpleEditor ( Editor ):
 
         # Get information about the node that was changed:
         start = event.index
-        n     = len( event.added )
         end   = start + len( event.removed )
         tree  = self._tree
 
@@ -1550,17 +1663,11 @@ class SimpleEditor ( Editor ):
                 for cnid in self._nodes_for( nid )[ start: end ]:
                     self._delete_node( cnid )
 
-                remaining = n - len( event.removed )
-                child_index = 0
-                # Add all of the children that were added:
-                for child in event.added:
-                    child, child_node = self._node_for( child )
-                    if child_node is not None:
-                        insert_index = (start + child_index) if \
-                                        (start <= remaining) else None
-                        self._insert_node( nid, insert_index, child_node,
-                                        child )
-                        child_index += 1
+                # Add all of the children that were added in one go:
+                cnids, auto_open = self._new_nodes( event.added )
+                nid.insertChildren( min( start, nid.childCount() ), cnids )
+                for cnid in auto_open:
+                    cnid.setExpanded(True)
 
             # Try to expand the node (if requested):
             if node.can_auto_open( object ):
@@ -1645,6 +1752,30 @@ class SimpleEditor ( Editor ):
 
 #-- End UI preference save/restore interface -----------------------------------
 
+#-------------------------------------------------------------------------------
+#  Applies the tree editor factory's appearance settings to a tree view:
+#-------------------------------------------------------------------------------
+
+def _init_tree_view(view, factory):
+    """ Applies the appearance settings of a tree editor factory to a tree
+        view.
+    """
+    view.setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
+    view.setHeaderHidden(len(factory.column_headers) == 0)
+    view.setAlternatingRowColors(factory.alternating_row_colors)
+
+    padding = factory.vertical_padding
+    if padding > 0:
+        view.setStyleSheet("""
+        QTreeView::item {
+            padding-top: %spx;
+            padding-bottom: %spx;
+        }
+        """ % (padding, padding))
+
+    if factory.selection_mode == 'extended':
+        view.setSelectionMode(QtGui.QAbstractItemView.ExtendedSelection)
+
 #-------------------------------------------------------------------------------
 #  '_TreeWidget' class:
 #-------------------------------------------------------------------------------
@@ -1659,30 +1790,15 @@ class _TreeWidget(QtGui.QTreeWidget):
         """
         QtGui.QTreeWidget.__init__(self, parent)
 
-        self.setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
         self.setDragEnabled(True)
         self.setAcceptDrops(True)
         # Set up headers if necessary.
         column_count = len(editor.factory.column_headers)
         if column_count > 0:
-            self.setHeaderHidden(False)
             self.setColumnCount(column_count)
             self.setHeaderLabels(editor.factory.column_headers)
-        else:
-            self.setHeaderHidden(True)
 
-        self.setAlternatingRowColors(editor.factory.alternating_row_colors)
-        padding = editor.factory.vertical_padding
-        if padding > 0:
-            self.setStyleSheet("""
-            QTreeView::item {
-                padding-top: %spx;
-                padding-bottom: %spx;
-            }
-            """ % (padding, padding))
-
-        if editor.factory.selection_mode == 'extended':
-            self.setSelectionMode(QtGui.QAbstractItemView.ExtendedSelection)
+        _init_tree_view(self, editor.factory)
 
         self.itemExpanded.connect(editor._on_item_expanded)
         self.itemCollapsed.connect(editor._on_item_collapsed)
@@ -1867,3 +1983,446 @@ class _TreeWidget(QtGui.QTreeWidget):
                                                data, False )
 
         e.acceptProposedAction()
+
+#-------------------------------------------------------------------------------
+#  'VirtualEditor' class:
+#-------------------------------------------------------------------------------
+
+class VirtualEditor ( SimpleEditor ):
+    """ Tree editor which presents the tree through a TreeModel rather than
+        by creating a QTreeWidgetItem for every node.
+
+        Only the children of expanded nodes are created, in pages of the
+        factory's **fetch_size**. Trait listeners are only attached to the
+        nodes in the model (and children listeners only to expanded nodes),
+        and everything below a node is released when it is collapsed.
+
+        Each node is represented by a TreeRecord, which takes the place of
+        the QTreeWidgetItem 'nid' used by the SimpleEditor.
+    """
+
+    #---------------------------------------------------------------------------
+    #  Creates the tree control:
+    #---------------------------------------------------------------------------
+
+    def _create_tree ( self ):
+        """ Creates the tree control used by the editor.
+        """
+        self._expanded = {}
+
+        return _TreeView( self )
+
+    #---------------------------------------------------------------------------
+    #  Disposes of the contents of an editor:
+    #---------------------------------------------------------------------------
+
+    def dispose ( self ):
+        """ Disposes of the contents of an editor.
+        """
+        if self._tree is not None:
+            # Stop the chatter (specifically about the changing selection).
+            self._tree.blockSignals(True)
+
+            self._release_record(self._tree.model().root)
+
+            self._tree = None
+
+        self._dispose_ui_pool()
+
+        super( SimpleEditor, self ).dispose()
+
+    #---------------------------------------------------------------------------
+    #  Expands from the specified node the specified number of sub-levels:
+    #---------------------------------------------------------------------------
+
+    def expand_levels ( self, nid, levels, expand = True ):
+        """ Expands from the specified node the specified number of sub-levels.
+        """
+        if (levels > 0) and (nid.node is not None):
+            if self._has_children( nid.node, nid.object ):
+                model = self._tree.model()
+                if nid.children is None:
+                    model.fetch( nid )
+                if expand and (nid is not model.root):
+                    self._tree.setExpanded(model.index_for(nid), True)
+                for cnid in nid.children[:]:
+                    self.expand_levels( cnid, levels - 1 )
+
+    #---------------------------------------------------------------------------
+    #  Updates the editor when the object trait changes external to the editor:
+    #---------------------------------------------------------------------------
+
+    def update_editor ( self ):
+        """ Updates the editor when the object trait changes externally to the
+            editor.
+        """
+        tree = self._tree
+        if tree is None:
+            return
+
+        model = tree.model()
+        self._release_record(model.root)
+        self._map = {}
+        self._expanded = {}
+
+        root = TreeRecord(None, None, None)
+        object, node = self._node_for( self.value )
+        if node is None:
+            model.set_root(root)
+            return
+
+        if self.factory.hide_root:
+            root = self._create_record( None, object, 0, node )
+            model.set_root(root)
+            nid = root
+        else:
+            nid = self._create_record( root, object, 0, node )
+            root.children = [ nid ]
+            root.pending  = [ object ]
+            model.set_root(root)
+
+        if self.factory.hide_root or self._has_children( node, object ):
+            model.fetch( nid )
+            if not self.factory.hide_root:
+                index = model.index_for(nid)
+                tree.setExpanded(index, True)
+                tree.setCurrentIndex(index)
+
+        self.expand_levels( nid, self.factory.auto_open, False )
+
+        ncolumns = model.columnCount()
+        if ncolumns > 1:
+            for i in range(ncolumns):
+                tree.resizeColumnToContents(i)
+
+    #---------------------------------------------------------------------------
+    #  Creates the record for a child object of a specified record:
+    #---------------------------------------------------------------------------
+
+    def _create_record ( self, parent, object, row, node = None ):
+        """ Creates the record for an object, and starts listening to its
+            label.
+        """
+        if node is None:
+            object, node = self._node_for( object )
+
+        nid  = TreeRecord( parent, node, object, row )
+        info = self._map.setdefault( id( object ), [] )
+        if len( info ) == 0:
+            self._label_listeners( node, object, False )
+        info.append( ( node.get_children_id( object ), nid ) )
+
+        return nid
+
+    #---------------------------------------------------------------------------
+    #  Loads the child objects of a specified record:
+    #---------------------------------------------------------------------------
+
+    def _load_children ( self, nid ):
+        """ Loads the list of child objects of a record (without creating any
+            child records), and starts listening to the children.
+        """
+        node, object = nid.node, nid.object
+        nid.children = []
+        nid.pending  = []
+        if node.allows_children( object ):
+            nid.pending = list( node.get_children( object ) )
+
+            id_object = id( object )
+            count     = self._expanded.get( id_object, 0 )
+            if count == 0:
+                self._children_listeners( node, object, False )
+            self._expanded[ id_object ] = count + 1
+
+    #---------------------------------------------------------------------------
+    #  Releases the children of a specified record:
+    #---------------------------------------------------------------------------
+
+    def _release_children ( self, nid ):
+        """ Releases all of the child records of a record, and stops listening
+            to its children.
+        """
+        children = nid.children
+        if children is None:
+            return
+
+        for cnid in children:
+            self._release_record( cnid )
+        nid.children = nid.pending = None
+
+        node, object = nid.node, nid.object
+        if (node is not None) and node.allows_children( object ):
+            id_object = id( object )
+            count     = self._expanded.get( id_object, 0 ) - 1
+            if count <= 0:
+                self._children_listeners( node, object, True )
+                self._expanded.pop( id_object, None )
+            else:
+                self._expanded[ id_object ] = count
+
+    #---------------------------------------------------------------------------
+    #  Releases a specified record and all of its children:
+    #---------------------------------------------------------------------------
+
+    def _release_record ( self, nid ):
+        """ Releases a record and all of its children.
+        """
+        self._release_children( nid )
+        if nid.node is None:
+            return
+
+        id_object   = id( nid.object )
+        object_info = self._map.get( id_object, [] )
+        for i, info in enumerate( object_info ):
+            if info[1] is nid:
+                del object_info[i]
+                break
+
+        if len( object_info ) == 0:
+            self._label_listeners( nid.node, nid.object, True )
+            self._map.pop( id_object, None )
+
+        # If the released node had an active editor panel showing, remove it:
+        if (self._editor is not None) and (self._editor._editor_nid is nid):
+            self._clear_editor()
+
+    #---------------------------------------------------------------------------
+    #  Adds/Removes the event listeners for a specified object:
+    #---------------------------------------------------------------------------
+
+    def _label_listeners ( self, node, object, remove ):
+        """ Adds/Removes the label event listeners for a specified object.
+        """
+        node.when_label_changed( object, self._label_updated, remove )
+        node.when_column_labels_change( object, self._column_labels_updated,
+                                        remove )
+
+    def _children_listeners ( self, node, object, remove ):
+        """ Adds/Removes the children event listeners for a specified object.
+        """
+        node.when_children_replaced( object, self._children_replaced, remove )
+        node.when_children_changed(  object, self._children_updated,  remove )
+
+    #---------------------------------------------------------------------------
+    #  Gets the node specific data:
+    #---------------------------------------------------------------------------
+
+    @staticmethod
+    def _get_node_data(nid):
+        """ Gets the node specific data. """
+        return ( nid.children is not None, nid.node, nid.object )
+
+    #---------------------------------------------------------------------------
+    #  Return the index of a specified node id within its parent:
+    #---------------------------------------------------------------------------
+
+    def _node_index ( self, nid ):
+        pnid = nid.parent()
+        if (pnid is None) or (pnid.node is None):
+            return ( None, None, None )
+
+        return ( pnid.node, pnid.object, nid.row )
+
+    #---------------------------------------------------------------------------
+    #  Updates the displayed data of a specified node:
+    #---------------------------------------------------------------------------
+
+    def _set_label(self, nid, text, col=0):
+        """ Set the label of the specified item """
+        self._tree.model().record_changed(nid)
+
+    def _set_column_labels(self, nid, column_labels):
+        """ Set the column labels.
+        """
+        self._tree.model().record_changed(nid)
+
+    def _update_icon(self, nid):
+        """ Updates the icon for a specified node.
+        """
+        self._tree.model().record_changed(nid)
+
+#----- Tree event handlers: ----------------------------------------------------
+
+    #---------------------------------------------------------------------------
+    #  Handles a tree node being expanded:
+    #---------------------------------------------------------------------------
+
+    def _on_item_expanded(self, nid):
+        """ Handles a tree node being expanded.
+        """
+        model = self._tree.model()
+
+        # If 'auto_close' requested for this node type, close all of the node's
+        # siblings:
+        if nid.node.can_auto_close(nid.object):
+            for snid in nid.parent().children[:]:
+                if snid is not nid:
+                    self._tree.setExpanded(model.index_for(snid), False)
+
+        # Make sure the first page of children has been fetched:
+        if nid.children is None:
+            model.fetch(nid)
+
+        self._update_icon(nid)
+
+    #---------------------------------------------------------------------------
+    #  Handles a tree node being collapsed:
+    #---------------------------------------------------------------------------
+
+    def _on_item_collapsed(self, nid):
+        """ Handles a tree node being collapsed by releasing its contents.
+        """
+        self._tree.model().release(nid)
+        self._update_icon(nid)
+
+#----- Model event handlers: ---------------------------------------------------
+
+    #---------------------------------------------------------------------------
+    #  Handles the children of a node being completely replaced:
+    #---------------------------------------------------------------------------
+
+    def _children_replaced ( self, object, name = '', new = None ):
+        """ Handles the children of a node being completely replaced.
+        """
+        model = self._tree.model()
+        for expanded, node, nid in self._object_info_for( object, name ):
+            # Only update the children if the node has already been expanded:
+            if expanded:
+                model.replace_children( nid, node.get_children( object ) )
+
+            model.record_changed( nid )
+
+            # Try to expand the node (if requested):
+            if node.can_auto_open( object ) and (nid is not model.root):
+                self._tree.setExpanded(model.index_for(nid), True)
+
+    #---------------------------------------------------------------------------
+    #  Handles the children of a node being changed:
+    #---------------------------------------------------------------------------
+
+    def _children_updated ( self, object, name, event ):
+        """ Handles the children of a node being changed.
+        """
+        # Log the change that was made made (removing '_items' from the end of
+        # the name):
+        name = name[:-6]
+        self.log_change( self._get_undo_item, object, name, event )
+
+        # Get information about the node that was changed:
+        start = event.index
+        end   = start + len( event.removed )
+        model = self._tree.model()
+
+        for expanded, node, nid in self._object_info_for( object, name ):
+            # Only add/remove the changes if the node has already been expanded:
+            if expanded:
+                complete = (not nid.can_fetch_more())
+                nid.pending[ start: end ] = event.added
+
+                # Remove all of the fetched children that were deleted:
+                model.remove_records( nid, start,
+                                      min( end, len( nid.children ) ) )
+
+                # Add the children that were added within the fetched ones,
+                # otherwise leave them to be fetched later:
+                if start < len( nid.children ):
+                    model.insert_records( nid, start, event.added )
+                elif complete:
+                    model.fetch( nid )
+
+            model.record_changed( nid )
+
+            # Try to expand the node (if requested):
+            if node.can_auto_open( object ) and (nid is not model.root):
+                self._tree.setExpanded(model.index_for(nid), True)
+
+#-------------------------------------------------------------------------------
+#  '_TreeView' class:
+#-------------------------------------------------------------------------------
+
+class _TreeView(QtGui.QTreeView):
+    """ The _TreeView class is the QTreeView used by the VirtualEditor. It
+        provides the subset of the QTreeWidget interface used by the
+        SimpleEditor in terms of TreeRecords.
+    """
+    def __init__(self, editor, parent=None):
+        """ Initialise the tree view.
+        """
+        QtGui.QTreeView.__init__(self, parent)
+
+        self.setModel(TreeModel(editor, self))
+        self.setUniformRowHeights(True)
+        self.setExpandsOnDoubleClick(editor.factory.expands_on_dclick)
+        _init_tree_view(self, editor.factory)
+
+        self.expanded.connect(self._on_expanded)
+        self.collapsed.connect(self._on_collapsed)
+        self.clicked.connect(self._on_clicked)
+        self.doubleClicked.connect(self._on_dclicked)
+        self.activated.connect(self._on_activated)
+        self.selectionModel().selectionChanged.connect(
+            self._on_selection_changed)
+        self.customContextMenuRequested.connect(editor._on_context_menu)
+
+        self._editor = editor
+
+    #-- QTreeWidget compatible interface ---------------------------------------
+
+    def invisibleRootItem(self):
+        """ Returns the root record of the model.
+        """
+        return self.model().root
+
+    def itemAt(self, pos):
+        """ Returns the record at a point in the viewport (if any).
+        """
+        index = self.indexAt(pos)
+        if not index.isValid():
+            return None
+        return self.model().record_for(index)
+
+    def indexFromItem(self, nid, column=0):
+        """ Returns the model index of a record.
+        """
+        return self.model().index_for(nid, column)
+
+    def selectedItems(self):
+        """ Returns the records of the selected rows.
+        """
+        model = self.model()
+        return [ model.record_for(index)
+                 for index in self.selectionModel().selectedRows() ]
+
+    def setCurrentItem(self, nid):
+        """ Makes a record the current item.
+        """
+        if nid is not None:
+            self.setCurrentIndex(self.model().index_for(nid))
+
+    def editItem(self, nid, column=0):
+        """ Starts editing the label of a record.
+        """
+        self.edit(self.model().index_for(nid, column))
+
+    #-- Signal handlers --------------------------------------------------------
+
+    def _on_expanded(self, index):
+        self._editor._on_item_expanded(self.model().record_for(index))
+
+    def _on_collapsed(self, index):
+        self._editor._on_item_collapsed(self.model().record_for(index))
+
+    def _on_clicked(self, index):
+        self._editor._on_item_clicked(self.model().record_for(index),
+                                      index.column())
+
+    def _on_dclicked(self, index):
+        self._editor._on_item_dclicked(self.model().record_for(index),
+                                       index.column())
+
+    def _on_activated(self, index):
+        self._editor._on_item_activated(self.model().record_for(index),
+                                        index.column())
+
+    def _on_selection_changed(self, selected, deselected):
+        self._editor._on_tree_sel_changed()
@@ -0,0 +1,438 @@
+#------------------------------------------------------------------------------
+#
+#  Copyright (c) 2013, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in enthought/LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+#
+#------------------------------------------------------------------------------
+
+""" Defines the item model used by the virtual tree editor for the PyQt user
+    interface toolkit.
+"""
+
+#-------------------------------------------------------------------------------
+#  Imports:
+#-------------------------------------------------------------------------------
+
+from pyface.qt import QtCore, QtGui
+
+from traitsui.helper import match_items
+from traitsui.ui_traits import SequenceTypes
+
+#-------------------------------------------------------------------------------
+#  'TreeRecord' class:
+#-------------------------------------------------------------------------------
+
+class TreeRecord(object):
+    """ A lightweight record describing one node of a virtual tree.
+
+        The **children** list is None until the node has been expanded. The
+        **pending** list holds all of the node's child objects, of which only
+        the first len(children) have been fetched into the model.
+    """
+
+    __slots__ = ('object', 'node', 'row', 'children', 'pending',
+                 '_parent', '_flags', '__weakref__')
+
+    def __init__(self, parent, node, object, row=0):
+        self._parent = parent
+        self.node = node
+        self.object = object
+        self.row = row
+        self.children = None
+        self.pending = None
+        self._flags = None
+
+    #-- QTreeWidgetItem compatible interface -----------------------------------
+
+    def parent(self):
+        """ Returns the parent record (None for the root record).
+        """
+        return self._parent
+
+    def child(self, index):
+        """ Returns the fetched child record at the specified index.
+        """
+        children = self.children
+        if (children is None) or (index >= len(children)):
+            return None
+        return children[index]
+
+    def childCount(self):
+        """ Returns the number of fetched child records.
+        """
+        if self.children is None:
+            return 0
+        return len(self.children)
+
+    def flags(self):
+        """ Returns the item flags of the record.
+        """
+        if self._flags is None:
+            return (QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable)
+        return self._flags
+
+    def setFlags(self, flags):
+        """ Sets the item flags of the record.
+        """
+        self._flags = flags
+
+    #-- Public Methods ---------------------------------------------------------
+
+    def can_fetch_more(self):
+        """ Returns whether the record has child objects which have not been
+            fetched into the model yet.
+        """
+        return ((self.pending is not None) and
+                (len(self.children) < len(self.pending)))
+
+#-------------------------------------------------------------------------------
+#  'TreeModel' class:
+#-------------------------------------------------------------------------------
+
+class TreeModel(QtCore.QAbstractItemModel):
+    """ A model which presents a hierarchy of TreeRecords to a QTreeView.
+
+        Children are only created when a node is expanded, and then only in
+        pages of the editor factory's **fetch_size** as the view asks for
+        them. All knowledge of the tree nodes themselves is delegated to the
+        editor.
+    """
+
+    def __init__(self, editor, parent=None):
+        """ Initialise the object.
+        """
+        QtCore.QAbstractItemModel.__init__(self, parent)
+
+        self._editor = editor
+        self.root = TreeRecord(None, None, None)
+
+    #-- Public Methods ---------------------------------------------------------
+
+    def set_root(self, root):
+        """ Replaces the root record of the model.
+        """
+        self.beginResetModel()
+        self.root = root
+        self.endResetModel()
+
+    def record_for(self, index):
+        """ Returns the record associated with a model index.
+        """
+        if index.isValid():
+            return index.internalPointer()
+        return self.root
+
+    def index_for(self, record, column=0):
+        """ Returns the model index associated with a record.
+        """
+        if (record is None) or (record is self.root):
+            return QtCore.QModelIndex()
+        return self.createIndex(record.row, column, record)
+
+    def record_changed(self, record):
+        """ Notifies the view that the data of a record has changed.
+        """
+        if (record is not None) and (record is not self.root):
+            self.dataChanged.emit(self.index_for(record),
+                self.index_for(record, self.columnCount() - 1))
+
+    def fetch(self, record, count=None):
+        """ Fetches the next page of children of a record into the model.
+        """
+        editor = self._editor
+        if record.children is None:
+            editor._load_children(record)
+
+        pending = record.pending
+        first = len(record.children)
+        if count is None:
+            count = editor.factory.fetch_size
+        if count <= 0:
+            count = len(pending)
+        last = min(first + count, len(pending))
+        if last <= first:
+            return
+
+        self.beginInsertRows(self.index_for(record), first, last - 1)
+        record.children.extend([ editor._create_record(record, pending[i], i)
+                                 for i in xrange(first, last) ])
+        self.endInsertRows()
+
+    def insert_records(self, record, row, objects):
+        """ Inserts records for a list of child objects of a fetched record.
+        """
+        if len(objects) == 0:
+            return
+
+        editor = self._editor
+        self.beginInsertRows(self.index_for(record), row,
+                             row + len(objects) - 1)
+        record.children[row:row] = [
+            editor._create_record(record, object, row + i)
+            for i, object in enumerate(objects) ]
+        self._renumber(record, row + len(objects))
+        self.endInsertRows()
+
+    def remove_records(self, record, first, last):
+        """ Removes the records in the range [first, last) from the children
+            of a fetched record.
+        """
+        if last <= first:
+            return
+
+        editor = self._editor
+        removed = record.children[first:last]
+
+        # Keep the removed records alive until the view has discarded the
+        # indices referring to them:
+        records = self._descendants(removed)
+        self.beginRemoveRows(self.index_for(record), first, last - 1)
+        for child in removed:
+            editor._release_record(child)
+        del record.children[first:last]
+        self._renumber(record, first)
+        self.endRemoveRows()
+        del records
+
+    def replace_children(self, record, objects):
+        """ Replaces the child objects of a fetched record.
+
+            The records of children which are still present keep their
+            listeners, children and view state, and are only moved. As many
+            of the new children are fetched as were fetched before. Removed
+            and added children are reported as row removals and insertions,
+            so that only a reordering of the remaining children is reported
+            as a layout change.
+        """
+        editor = self._editor
+
+        # Copy the children, since removing records shortens the list:
+        old = list(record.children)
+        count = min(len(objects), len(old))
+        resolved = [editor._node_for(object) for object in objects[:count]]
+        matches = match_items([child.object for child in old],
+                              [object for object, node in resolved])
+
+        # The index of the old record reused for each new row (or -1):
+        kept = {}
+        for row, ((object, node), i) in enumerate(zip(resolved, matches)):
+            if (i >= 0) and (old[i].node is node):
+                kept[i] = row
+            else:
+                matches[row] = -1
+
+        record.pending = list(objects)
+
+        # Remove the records which are not reused, a run of rows at a time
+        # (starting from the end, so that the earlier rows do not move):
+        last = len(old)
+        for i in xrange(len(old) - 1, -2, -1):
+            if (i >= 0) and (i not in kept):
+                continue
+            self.remove_records(record, i + 1, last)
+            last = i
+
+        # Move the remaining records into their new order:
+        moved = [old[i] for i in matches if i >= 0]
+        if record.children != moved:
+            self.layoutAboutToBeChanged.emit()
+            persistent = self.persistentIndexList()
+            record.children = moved
+            self._renumber(record, 0)
+
+            # Only the indices of the moved records themselves change:
+            self.changePersistentIndexList(persistent,
+                [self._moved_index(index, record) for index in persistent])
+            self.layoutChanged.emit()
+
+        # Insert the records for the new children, a run of rows at a time:
+        row = 0
+        while row < count:
+            if matches[row] >= 0:
+                row += 1
+                continue
+            first = row
+            while (row < count) and (matches[row] < 0):
+                row += 1
+            self.insert_records(record, first, objects[first:row])
+
+        if (count == 0) and (len(objects) > 0):
+            self.fetch(record)
+
+    def release(self, record):
+        """ Releases all of the child records (and listeners) of a record,
+            returning it to the unexpanded state.
+        """
+        if record.children is None:
+            return
+
+        count = len(record.children)
+        records = self._descendants(record.children)
+        if count > 0:
+            self.beginRemoveRows(self.index_for(record), 0, count - 1)
+        self._editor._release_children(record)
+        if count > 0:
+            self.endRemoveRows()
+        del records
+
+    #-- QAbstractItemModel Interface -------------------------------------------
+
+    def index(self, row, column, parent=QtCore.QModelIndex()):
+        """ Reimplemented to return the index of a fetched child record.
+        """
+        children = self.record_for(parent).children
+        if (children is None) or (row < 0) or (row >= len(children)):
+            return QtCore.QModelIndex()
+        return self.createIndex(row, column, children[row])
+
+    def parent(self, index):
+        """ Reimplemented to return the index of a record's parent.
+        """
+        if not index.isValid():
+            return QtCore.QModelIndex()
+        return self.index_for(index.internalPointer().parent())
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        """ Reimplemented to return the number of fetched child records.
+        """
+        if parent.column() > 0:
+            return 0
+        return self.record_for(parent).childCount()
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        """ Reimplemented to return the number of columns.
+        """
+        return max(1, len(self._editor.factory.column_headers))
+
+    def hasChildren(self, parent=QtCore.QModelIndex()):
+        """ Reimplemented to ask the tree node without fetching anything.
+        """
+        if parent.column() > 0:
+            return False
+        record = self.record_for(parent)
+        if record.children is not None:
+            return ((len(record.children) > 0) or record.can_fetch_more())
+        if record is self.root:
+            return False
+        return self._editor._has_children(record.node, record.object)
+
+    def canFetchMore(self, parent):
+        """ Reimplemented to report unfetched children of an expanded record.
+        """
+        record = self.record_for(parent)
+        if record.children is None:
+            return ((record is not self.root) and
+                    self._editor._has_children(record.node, record.object))
+        return record.can_fetch_more()
+
+    def fetchMore(self, parent):
+        """ Reimplemented to fetch the next page of children.
+        """
+        self.fetch(self.record_for(parent))
+
+    def flags(self, index):
+        """ Reimplemented to return the record's flags.
+        """
+        if not index.isValid():
+            return QtCore.Qt.ItemIsEnabled
+        return index.internalPointer().flags()
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        """ Reimplemented to return the data for a record.
+        """
+        if not index.isValid():
+            return None
+
+        record = index.internalPointer()
+        node, object, column = record.node, record.object, index.column()
+
+        if role in (QtCore.Qt.DisplayRole, QtCore.Qt.EditRole):
+            if column == 0:
+                return node.get_label(object)
+            labels = node.get_column_labels(object)
+            if column <= len(labels):
+                return labels[column - 1]
+        elif role == QtCore.Qt.DecorationRole:
+            if column == 0:
+                return self._editor._get_icon(node, object,
+                                              record.children is not None)
+        elif role == QtCore.Qt.ToolTipRole:
+            if column == 0:
+                return node.get_tooltip(object)
+        elif role == QtCore.Qt.BackgroundRole:
+            color = node.get_background(object)
+            if color:
+                return self._get_brush(color)
+        elif role == QtCore.Qt.ForegroundRole:
+            color = node.get_foreground(object)
+            if color:
+                return self._get_brush(color)
+
+        return None
+
+    def setData(self, index, value, role=QtCore.Qt.EditRole):
+        """ Reimplemented to rename a node.
+        """
+        if (not index.isValid()) or (index.column() != 0):
+            return False
+
+        record = index.internalPointer()
+        label = unicode(value)
+        if (label == '') or (label == record.node.get_label(record.object)):
+            return False
+
+        record.node.set_label(record.object, label)
+        self.record_changed(record)
+
+        return True
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        """ Reimplemented to return the column headers.
+        """
+        headers = self._editor.factory.column_headers
+        if ((orientation == QtCore.Qt.Horizontal) and
+            (role == QtCore.Qt.DisplayRole) and (section < len(headers))):
+            return headers[section]
+        return None
+
+    #-- Private Methods --------------------------------------------------------
+
+    def _moved_index(self, index, parent):
+        """ Returns the current index of a record referred to by a model
+            index, given that only the children of a specified parent record
+            have been moved.
+        """
+        record = index.internalPointer()
+        if record.parent() is not parent:
+            return index
+        return self.createIndex(record.row, index.column(), record)
+
+    def _descendants(self, records):
+        """ Returns a list of the specified records and all of their fetched
+            descendants.
+        """
+        result = list(records)
+        for record in result:
+            if record.children is not None:
+                result.extend(record.children)
+        return result
+
+    def _renumber(self, record, first):
+        """ Updates the row numbers of a record's children from a specified
+            row onwards.
+        """
+        children = record.children
+        for i in xrange(first, len(children)):
+            children[i].row = i
+
+    def _get_brush(self, color):
+        if isinstance(color, SequenceTypes):
+            return QtGui.QBrush(QtGui.QColor(*color))
+        return QtGui.QBrush(QtGui.QColor(color))
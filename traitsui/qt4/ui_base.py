@@ -377,6 +377,10 @@ class _StickyDialog(QtGui.QDialog):
                 # for a non-modal one.
                 is_ok = not self.isModal()
 
+        # Make sure the handler sees any input still waiting to be set:
+        if is_ok:
+            self._ui.flush()
+
         ok_to_close = self._ui.handler.close(self._ui.info, is_ok)
         if ok_to_close:
             # Save the result now.
@@ -194,6 +194,7 @@ class _ModalDialog(BaseDialog):
         """Handles a request to apply changes.
         """
         ui = self.ui
+        ui.flush()
         self._apply_context(ui.context, ui._context)
         self.revert.setEnabled(True)
         ui.handler.apply(ui.info)
@@ -39,6 +39,12 @@ from .view import View
 import logging
 logger = logging.getLogger( __name__ )
 
+# NumPy is only used (if available) to sort numeric columns:
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 #-------------------------------------------------------------------------------
 #  Constants:
 #-------------------------------------------------------------------------------
@@ -46,6 +52,12 @@ logger = logging.getLogger( __name__ )
 # Flag used to indicate user has not specified a column label
 UndefinedLabel = '???'
 
+# The roles whose default TableColumn 'get_' method does not depend upon the
+# object being displayed:
+ObjectIndependentRoles = set( [ 'tooltip', 'text_font', 'text_color',
+    'horizontal_alignment', 'vertical_alignment', 'image', 'renderer',
+    'graph_color', 'type', 'menu', 'view', 'maximum' ] )
+
 #-------------------------------------------------------------------------------
 #  'TableColumn' class:
 #-------------------------------------------------------------------------------
@@ -146,6 +158,10 @@ class TableColumn ( HasPrivateTraits ):
     # Optional maximum value a numeric cell value can have:
     maximum = Float( trait_value = True )
 
+    # Optional function returning the key used to sort an object by this column
+    # (if not specified, the column is sorted using its 'cmp' method):
+    sort_key = Callable
+
     #---------------------------------------------------------------------------
     #  Returns the actual object being edited:
     #---------------------------------------------------------------------------
@@ -351,6 +367,51 @@ class TableColumn ( HasPrivateTraits ):
         """
         return self.maximum
 
+    #---------------------------------------------------------------------------
+    #  Returns the values of a set of roles for a block of objects:
+    #---------------------------------------------------------------------------
+
+    def get_block ( self, objects, roles ):
+        """ Returns the values of the specified *roles* (the names of the
+            'get_' methods, such as 'value', 'text_font' or 'cell_color') for
+            each object in *objects*, as a list containing one tuple of values
+            (in *roles* order) per object. Subclasses can override this method
+            to fetch the values for a block of objects more efficiently.
+
+            Roles whose value does not depend upon the object (because the
+            column uses the default 'get_' method, which returns a trait of
+            the column) are only computed once for the whole block.
+        """
+        columns = [ [] for object in objects ]
+        klass   = self.__class__
+        for role in roles:
+            name   = 'get_' + role
+            getter = getattr( self, name )
+            if ((role in ObjectIndependentRoles) and
+                (getattr( klass, name ) == getattr( TableColumn, name ))):
+                value = getter( None )
+                for values in columns:
+                    values.append( value )
+            else:
+                for object, values in zip( objects, columns ):
+                    values.append( getter( object ) )
+
+        return [ tuple( values ) for values in columns ]
+
+    #---------------------------------------------------------------------------
+    #  Returns the keys used to sort a list of objects by the column:
+    #---------------------------------------------------------------------------
+
+    def get_sort_keys ( self, objects ):
+        """ Returns the list of keys used to sort the specified objects by the
+            column, or None if the column can only be sorted using its 'cmp'
+            method.
+        """
+        if self.sort_key is not None:
+            return [ self.sort_key( object ) for object in objects ]
+
+        return None
+
     #---------------------------------------------------------------------------
     #  Called when the user clicks on the column:
     #---------------------------------------------------------------------------
@@ -525,6 +586,23 @@ class ObjectColumn ( TableColumn ):
         return cmp( self.get_raw_value( object1 ),
                     self.get_raw_value( object2 ) )
 
+    #---------------------------------------------------------------------------
+    #  Returns the keys used to sort a list of objects by the column:
+    #---------------------------------------------------------------------------
+
+    def get_sort_keys ( self, objects ):
+        """ Returns the list of keys used to sort the specified objects by the
+            column, or None if the column can only be sorted using its 'cmp'
+            method.
+        """
+        # Sorting by the raw values gives the same order as the default 'cmp',
+        # but a subclass overriding 'cmp' must still be sorted using it:
+        if ((self.sort_key is None) and
+            (self.cmp.im_func is ObjectColumn.cmp.im_func)):
+            return [ self.get_raw_value( object ) for object in objects ]
+
+        return super( ObjectColumn, self ).get_sort_keys( objects )
+
     #---------------------------------------------------------------------------
     #  Returns whether a specified value is valid for dropping on the column
     #  for a specified object:
@@ -755,6 +833,24 @@ class NumericColumn ( ObjectColumn ):
         except:
             return 'Undefined!'
 
+    #---------------------------------------------------------------------------
+    #  Returns the keys used to sort a list of object rows by the column:
+    #---------------------------------------------------------------------------
+
+    def get_sort_keys ( self, objects ):
+        """ Returns the keys used to sort the specified object rows by the
+            column (as a NumPy array if the values are numeric and NumPy is
+            available), or None if the column can only be sorted using its
+            'cmp' method.
+        """
+        keys = super( NumericColumn, self ).get_sort_keys( objects )
+        if (keys is not None) and (numpy is not None):
+            array = numpy.array( keys )
+            if (array.ndim == 1) and (array.dtype.kind in 'biuf'):
+                return array
+
+        return keys
+
     #---------------------------------------------------------------------------
     #  Sets the value of the column for a specified object row:
     #---------------------------------------------------------------------------
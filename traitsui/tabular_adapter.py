@@ -24,10 +24,30 @@
 
 from __future__ import absolute_import
 
+import re
+
 from traits.api import (Any, Bool, Color, Either, Enum, Event, Float, Font,
     HasPrivateTraits, HasTraits, Instance, Int, Interface, List, Property,
     Str, cached_property, implements, on_trait_change)
 
+#-------------------------------------------------------------------------------
+#  Constants:
+#-------------------------------------------------------------------------------
+
+# The roles whose 'get_' methods only depend upon the column:
+ColumnRoles = set( [ 'alignment', 'width' ] )
+
+# The roles whose 'get_' methods only depend upon the row:
+RowRoles = set( [ 'can_edit', 'drag' ] )
+
+# The roles whose 'get_' methods depend upon the item and column:
+ItemRoles = set( [ 'text', 'content', 'tooltip', 'menu', 'format', 'font',
+                   'text_color', 'bg_color', 'image' ] )
+
+# The traits which describe the item currently being adapted:
+ContextTraits = set( [ 'object', 'name', 'row', 'column', 'column_id', 'value',
+                       'item' ] )
+
 #-------------------------------------------------------------------------------
 #  'ITabularAdapter' interface:
 #-------------------------------------------------------------------------------
@@ -349,6 +369,54 @@ class TabularAdapter ( HasPrivateTraits ):
         """
         return self._result_for( 'get_column_menu', object, trait, row, column )
 
+    def get_block ( self, object, trait, rows, columns, roles ):
+        """ Returns the values of the specified *roles* (the names of the
+            'get_' methods, such as 'text', 'font' or 'bg_color') for every
+            *object.trait[row].column* item in the block defined by *rows* and
+            *columns*. The result is a dictionary mapping each ( row, column )
+            pair to a tuple containing the values in *roles* order.
+            Subclasses can override this method to fetch a block of values
+            more efficiently than one item and role at a time.
+
+            Each item is only fetched once, and a value which only depends
+            upon the class of the item (such as a font or color defined as a
+            plain trait of an adapter) is only computed once per class and
+            column for the whole block.
+        """
+        items  = [ ( row, self.get_item( object, trait, row ) )
+                   for row in rows ]
+        values = dict( [ ( ( row, column ), [] )
+                         for row in rows for column in columns ] )
+        for role in roles:
+            name = 'get_' + role
+            if ((role not in ItemRoles) or
+                (getattr( self.__class__, name ) !=
+                 getattr( TabularAdapter, name ))):
+                # The role is computed differently, so use its method:
+                getter = self._block_getter_for( role )
+                for row, item in items:
+                    for column in columns:
+                        values[ ( row, column ) ].append(
+                            getter( object, trait, row, column ) )
+                continue
+
+            for column in columns:
+                constants = {}
+                for row, item in items:
+                    klass = item.__class__
+                    value = constants.get( klass, values )
+                    if value is values:
+                        value = self._result_for( name, object, trait, row,
+                                                  column, item = item )
+                        plan = self.cache.get( ( klass, name, column ) )
+                        if (plan is not None) and (not plan[1]):
+                            constants[ klass ] = value
+
+                    values[ ( row, column ) ].append( value )
+
+        return dict( [ ( key, tuple( value ) )
+                       for key, value in values.iteritems() ] )
+
     #-- Adapter methods that are not sensitive to item type --------------------
 
     def get_item ( self, object, trait, row ):
@@ -513,48 +581,65 @@ class TabularAdapter ( HasPrivateTraits ):
 
     #-- Private Methods --------------------------------------------------------
 
-    def _result_for ( self, name, object, trait, row, column, value = None ):
+    def _result_for ( self, name, object, trait, row, column, value = None,
+                      item = None ):
         """ Returns/Sets the value of the specified *name* attribute for the
-            specified *object.trait[row].column* item.
+            specified *object.trait[row].column* item (which is fetched if
+            *item* is not specified).
+        """
+        if item is None:
+            item = self.get_item( object, trait, row )
+        plan = self.cache.get( ( item.__class__, name, column ) )
+        if plan is None:
+            self._set_context( object, trait, row, column, value, item )
+            return self._compile_plan( name, item, column )( item, row,
+                                                              column )
+
+        handler, contextual = plan
+        if contextual:
+            self._set_context( object, trait, row, column, value, item )
+
+        return handler( item, row, column )
+
+    def _set_context ( self, object, trait, row, column, value, item ):
+        """ Sets the traits describing the item currently being adapted.
         """
         self.object    = object
         self.name      = trait
         self.row       = row
         self.column    = column
-        self.column_id = column_id = self.column_map[ column ]
+        self.column_id = self.column_map[ column ]
         self.value     = value
-        self.item      = item = self.get_item( object, trait, row )
-        item_class     = item.__class__
-        key            = '%s:%s:%d' % ( item_class.__name__, name, column )
-        handler        = self.cache.get( key )
-        if handler is not None:
-            return handler()
-
+        self.item      = item
+
+    def _compile_plan ( self, name, item, column ):
+        """ Resolves the handler for the specified *name* attribute of the
+            current item and column to a callable with the signature
+            ( item, row, column ), caching the result in the dispatch table
+            when it only depends upon the item's class. Assumes the adapter
+            context has already been set.
+        """
+        item_class = item.__class__
+        column_id  = self.column_id
         prefix     = name[:4]
         trait_name = name[4:]
+        handler    = None
 
         for i, adapter in enumerate( self.adapters ):
             if column in self.adapter_column_indices[i]:
-                adapter.row    = row
+                adapter.row    = self.row
                 adapter.item   = item
-                adapter.value  = value
+                adapter.value  = self.value
                 adapter.column = column_id = self.adapter_column_map[i][column]
                 if adapter.accepts:
                     get_name = '%s_%s' % ( column_id, trait_name )
                     if adapter.trait( get_name ) is not None:
-                        if prefix == 'get_':
-                            handler = lambda: getattr( adapter.set(
-                                row  = self.row, column = column_id,
-                                item = self.item ), get_name )
-                        else:
-                            handler = lambda: setattr( adapter.set(
-                                row  = self.row, column = column_id,
-                                item = self.item ), get_name, self.value )
-
+                        handler = self._adapter_handler_for( adapter,
+                                      get_name, prefix, column_id )
                         if adapter.is_cacheable:
                             break
 
-                        return handler()
+                        return handler[0]
         else:
             if item is not None and hasattr(item_class, '__mro__'):
                 for klass in item_class.__mro__:
@@ -570,21 +655,52 @@ class TabularAdapter ( HasPrivateTraits ):
                               trait_name ), prefix ) or
                            self._get_handler_for( trait_name, prefix ))
 
-        self.cache[ key ] = handler
-        return handler()
+        self.cache[ ( item_class, name, column ) ] = handler
+        return handler[0]
+
+    def _block_getter_for ( self, role ):
+        """ Returns a callable with the signature ( object, trait, row, column )
+            returning the value of the specified *role* for an item.
+        """
+        getter = getattr( self, 'get_' + role )
+        if role in ColumnRoles:
+            return lambda object, trait, row, column: getter( object, trait,
+                                                              column )
+        if role in RowRoles:
+            return lambda object, trait, row, column: getter( object, trait,
+                                                              row )
+        return getter
 
     def _get_handler_for ( self, name, prefix ):
-        """ Returns the handler for a specified trait name (or None if not
-            found).
+        """ Returns the ( handler, contextual ) plan for a specified trait name
+            (or None if not found).
         """
         if self.trait( name ) is not None:
             if prefix == 'get_':
-                return lambda: getattr( self, name )
+                return ( lambda item, row, column: getattr( self, name ),
+                         _is_contextual( self, name ) )
 
-            return lambda: setattr( self, name, self.value )
+            return ( lambda item, row, column: setattr( self, name,
+                                                        self.value ), True )
 
         return None
 
+    def _adapter_handler_for ( self, adapter, name, prefix, column_id ):
+        """ Returns the ( handler, contextual ) plan for the trait *name* of a
+            delegated *adapter*.
+        """
+        if prefix != 'get_':
+            return ( lambda item, row, column: setattr( adapter.set(
+                         row = row, column = column_id, item = item ), name,
+                         self.value ), True )
+
+        if _is_contextual( adapter, name ):
+            return ( lambda item, row, column: getattr( adapter.set(
+                         row = row, column = column_id, item = item ), name ),
+                     True )
+
+        return ( lambda item, row, column: getattr( adapter, name ), False )
+
     @on_trait_change( 'columns,adapters.+update' )
     def _flush_cache ( self ):
         """ Flushes the cache when the columns or any trait on any adapter
@@ -593,3 +709,46 @@ class TabularAdapter ( HasPrivateTraits ):
         self.cache = {}
         self.cache_flushed = True
 
+#-------------------------------------------------------------------------------
+#  Helper functions:
+#-------------------------------------------------------------------------------
+
+# Cache of whether an adapter class listens to changes of its context traits:
+context_observers = {}
+
+def _is_contextual ( adapter, name ):
+    """ Returns whether the value of the *name* trait of *adapter* may depend
+        upon the item currently being adapted (i.e. whether the adapter context
+        must be set before reading it).
+    """
+    if adapter.trait( name ).type == 'property':
+        return True
+
+    klass    = adapter.__class__
+    observed = context_observers.get( klass )
+    if observed is None:
+        observed = context_observers[ klass ] = _observes_context( klass )
+
+    return observed
+
+def _observes_context ( klass ):
+    """ Returns whether the specified adapter class has any static or
+        decorated handlers for changes to its context traits, in which case
+        its plain traits may be updated as a side effect of setting the
+        context.
+    """
+    if hasattr( klass, '_anytrait_changed' ):
+        return True
+
+    for name in ContextTraits:
+        if (hasattr( klass, '_%s_changed' % name ) or
+            hasattr( klass, '_%s_fired' % name )):
+            return True
+
+    for listener in getattr( klass, '__listener_traits__', {} ).values():
+        if listener[0] == 'method':
+            names = set( re.split( r'[^\w]+', listener[1][ 'pattern' ] ) )
+            if not names.isdisjoint( ContextTraits ):
+                return True
+
+    return False
@@ -0,0 +1,129 @@
+#------------------------------------------------------------------------------
+#
+#  Copyright (c) 2013, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in enthought/LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#------------------------------------------------------------------------------
+
+import numpy
+
+from traits.api import Array, HasTraits
+from traitsui.api import Item, View
+from traitsui.editors.array_editor import (ArrayCellUndoItem, ArrayEditor,
+                                           ArrayGrid)
+from traitsui.undo import UndoHistory
+
+from traitsui.tests._tools import *
+
+
+def test_use_grid_above_threshold_and_for_structured_arrays():
+    editor = ArrayEditor(grid_threshold=100)
+    nose.tools.assert_false(editor.use_grid(numpy.zeros((10, 10))))
+    nose.tools.assert_true(editor.use_grid(numpy.zeros((10, 11))))
+    nose.tools.assert_true(editor.use_grid(
+        numpy.zeros(2, dtype=[('x', 'f8'), ('n', 'i4')])))
+
+    editor.grid_threshold = 0
+    nose.tools.assert_false(editor.use_grid(numpy.zeros((100, 100))))
+
+
+def test_array_grid_reads_and_writes_the_array_buffer():
+    array = numpy.zeros((3, 4))
+    grid = ArrayGrid(array)
+    nose.tools.assert_equal((grid.row_count, grid.column_count), (3, 4))
+
+    nose.tools.assert_true(grid.set_text(1, 2, ' 2.5 '))
+    nose.tools.assert_equal(array[1, 2], 2.5)
+    nose.tools.assert_equal(grid.get_text(1, 2), '2.5')
+    nose.tools.assert_false(grid.set_text(0, 0, 'abc'))
+
+    # Assigning an array of the same shape does not change the grid:
+    nose.tools.assert_false(grid.set_array(numpy.ones((3, 4))))
+    nose.tools.assert_true(grid.set_array(numpy.ones(5)))
+    nose.tools.assert_equal((grid.row_count, grid.column_count), (5, 1))
+
+
+def test_array_grid_structured_columns():
+    array = numpy.zeros(2, dtype=[('x', 'f8'), ('n', 'i4'), ('ok', '?')])
+    grid = ArrayGrid(array)
+    nose.tools.assert_equal(grid.column_count, 3)
+    nose.tools.assert_equal(grid.column_name(1), 'n')
+
+    nose.tools.assert_true(grid.set_text(1, 1, '7'))
+    nose.tools.assert_false(grid.set_text(1, 1, '7.5'))
+    nose.tools.assert_true(grid.set_text(0, 2, 'True'))
+    nose.tools.assert_equal(array['n'][1], 7)
+    nose.tools.assert_true(array['ok'][0])
+
+
+class ArrayHolder(HasTraits):
+
+    data = Array
+
+    def _data_changed(self, old, new):
+        self.changes += 1
+
+    changes = 0
+
+
+def test_array_cell_undo_item_restores_the_cell():
+    holder = ArrayHolder(data=numpy.zeros((3, 4)))
+    array = holder.data
+    holder.changes = 0
+    history = UndoHistory()
+
+    array[1, 2] = 5.0
+    history.add(ArrayCellUndoItem(object=holder, name='data', row=1,
+                                  column=2, old_value=0.0, new_value=5.0))
+    array[0, 0] = 7.0
+    history.add(ArrayCellUndoItem(object=holder, name='data', row=0,
+                                  column=0, old_value=0.0, new_value=7.0))
+
+    # Each edited cell is its own undo step:
+    history.undo()
+    nose.tools.assert_equal(array[0, 0], 0.0)
+    nose.tools.assert_equal(array[1, 2], 5.0)
+    history.undo()
+    nose.tools.assert_equal(array[1, 2], 0.0)
+    nose.tools.assert_equal(holder.changes, 2)
+
+    history.redo()
+    nose.tools.assert_equal(array[1, 2], 5.0)
+    nose.tools.assert_equal(array[0, 0], 0.0)
+    nose.tools.assert_true(holder.data is array)
+
+
+@skip_if_not_qt4
+def test_grid_editor_edits_are_undoable():
+    from pyface.qt import QtCore
+
+    holder = ArrayHolder(data=numpy.zeros((30, 30)))
+    array = holder.data
+    view = View(Item('data', editor=ArrayEditor(grid_threshold=100)),
+                buttons=['Undo', 'Revert'])
+    with store_exceptions_on_all_threads():
+        ui = holder.edit_traits(view=view)
+        try:
+            editor = ui.get_editors('data')[0]
+            model = editor._model
+            model.setData(model.index(3, 4), u'2.5', QtCore.Qt.EditRole)
+            model.setData(model.index(5, 6), u'4', QtCore.Qt.EditRole)
+            nose.tools.assert_equal(array[3, 4], 2.5)
+            nose.tools.assert_true(ui.modified)
+            nose.tools.assert_equal(ui.history.now, 2)
+
+            ui.history.undo()
+            nose.tools.assert_equal(array[5, 6], 0.0)
+            nose.tools.assert_equal(array[3, 4], 2.5)
+            nose.tools.assert_equal(model.data(model.index(5, 6)), '0.0')
+
+            ui.history.revert()
+            nose.tools.assert_equal(array[3, 4], 0.0)
+            nose.tools.assert_true(holder.data is array)
+        finally:
+            ui.dispose()
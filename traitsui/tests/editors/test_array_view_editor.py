@@ -0,0 +1,57 @@
+#------------------------------------------------------------------------------
+#
+#  Copyright (c) 2013, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in enthought/LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#------------------------------------------------------------------------------
+
+import os
+import shutil
+import tempfile
+
+import numpy
+
+from traitsui.ui_editors.array_view_editor import (ArrayViewData,
+    array_view_titles)
+
+from traitsui.tests._tools import *
+
+
+def test_array_view_data_formats_blocks_of_a_transposed_memmap():
+    tmpdir = tempfile.mkdtemp()
+    try:
+        filename = os.path.join(tmpdir, 'array.npy')
+        numpy.save(filename, numpy.arange(600.0).reshape(300, 2))
+        array = numpy.load(filename, mmap_mode='r')
+
+        data = ArrayViewData(array, '%.1f', transpose=True)
+        nose.tools.assert_equal((data.row_count, data.column_count),
+                                (2, 300))
+        nose.tools.assert_equal(data.get_text(1, 299), '599.0')
+        nose.tools.assert_true(numpy.may_share_memory(data._data, array))
+        del data, array
+    finally:
+        shutil.rmtree(tmpdir)
+
+
+def test_array_view_data_one_dimensional_and_object_arrays():
+    data = ArrayViewData(numpy.arange(5), '%03d')
+    nose.tools.assert_equal((data.row_count, data.column_count), (5, 1))
+    nose.tools.assert_equal(data.get_text(4, 0), '004')
+
+    data.set_array(numpy.array([[1, 2], [3, 4]], dtype=object))
+    nose.tools.assert_equal(data.get_text(1, 0), '003')
+
+
+def test_array_view_titles():
+    titles = ['x', 'y']
+    nose.tools.assert_equal(array_view_titles((4, 6), titles),
+                            ['x0', 'y0', 'x1', 'y1', 'x2', 'y2'])
+    nose.tools.assert_equal(titles, ['x', 'y'])
+    nose.tools.assert_equal(array_view_titles((4, 3), [], transpose=True),
+                            ['Data 0', 'Data 1', 'Data 2', 'Data 3'])
@@ -0,0 +1,191 @@
+#------------------------------------------------------------------------------
+#
+#  Copyright (c) 2013, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in enthought/LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#------------------------------------------------------------------------------
+
+from traits.api import HasTraits, Instance, Int, List, Str
+from traitsui.api import Item, ListEditor, View
+
+from traitsui.tests._tools import *
+
+
+class Numbers(HasTraits):
+
+    numbers = List(Int)
+
+    traits_view = View(
+        Item('numbers', style='custom',
+             editor=ListEditor(virtual=True, virtual_margin=2)),
+        buttons=['Undo'], width=300, height=200, resizable=True
+    )
+
+
+def _edit_scrolled_numbers():
+    """ Returns a virtual list editor for 200 numbers, scrolled so that its
+    row widgets show the items around index 100.
+    """
+    numbers = Numbers(numbers=range(200))
+    ui = numbers.edit_traits()
+    editor = ui.get_editors('numbers')[0]
+    editor.control.verticalScrollBar().setValue(editor._row_height * 100)
+    nose.tools.assert_true(min(editor._slots) > 50)
+    nose.tools.assert_true(max(editor._slots) < 150)
+    return numbers, ui, editor
+
+
+def _check_slots(numbers, ui, editor, expected):
+    """ Checks that each row widget shows the list item at its index, without
+    the list or the user interface having been modified by the editor.
+    """
+    nose.tools.assert_equal(numbers.numbers, expected)
+    for index, slot in editor._slots.items():
+        nose.tools.assert_equal(slot.proxy.index, index)
+        nose.tools.assert_equal(slot.proxy.value, expected[index])
+        nose.tools.assert_equal(slot.item_editor.control.text(),
+                                str(expected[index]))
+    nose.tools.assert_false(ui.modified)
+    nose.tools.assert_equal(ui.history.now, 0)
+
+
+@skip_if_not_qt4
+def test_virtual_list_editor_insert():
+    with store_exceptions_on_all_threads():
+        numbers, ui, editor = _edit_scrolled_numbers()
+        try:
+            expected = range(200)
+            # Before, inside and after the row widgets:
+            for index, value in [(10, 1000), (103, 1001), (180, 1002)]:
+                numbers.numbers.insert(index, value)
+                expected.insert(index, value)
+                _check_slots(numbers, ui, editor, expected)
+        finally:
+            ui.dispose()
+
+
+@skip_if_not_qt4
+def test_virtual_list_editor_delete():
+    with store_exceptions_on_all_threads():
+        numbers, ui, editor = _edit_scrolled_numbers()
+        try:
+            expected = range(200)
+            for index in [10, 103, 180]:
+                del numbers.numbers[index:index + 2]
+                del expected[index:index + 2]
+                _check_slots(numbers, ui, editor, expected)
+        finally:
+            ui.dispose()
+
+
+@skip_if_not_qt4
+def test_virtual_list_editor_replace():
+    with store_exceptions_on_all_threads():
+        numbers, ui, editor = _edit_scrolled_numbers()
+        try:
+            expected = range(200)
+            for index, value in [(10, 1000), (103, 1001), (180, 1002)]:
+                numbers.numbers[index] = value
+                expected[index] = value
+                _check_slots(numbers, ui, editor, expected)
+
+            # Replacing a range by a longer one spanning the row widgets:
+            numbers.numbers[95:105] = range(2000, 2012)
+            expected[95:105] = range(2000, 2012)
+            _check_slots(numbers, ui, editor, expected)
+        finally:
+            ui.dispose()
+
+
+class Page(HasTraits):
+
+    name = Str
+
+    traits_view = View('name')
+
+
+class Book(HasTraits):
+
+    pages = List(Instance(Page))
+
+    traits_view = View(
+        Item('pages', style='custom', show_label=False,
+             editor=ListEditor(use_notebook=True, lazy=True,
+                               max_live_pages=2, page_name='.name'))
+    )
+
+
+def _edit_book(count):
+    book = Book(pages=[Page(name='page %d' % i) for i in range(count)])
+    ui = book.edit_traits()
+    return book, ui, ui.get_editors('pages')[0]
+
+
+def _live_pages(editor):
+    return [ui is not None for _, ui, _, _ in editor._uis]
+
+
+@skip_if_not_qt4
+def test_lazy_notebook_only_builds_the_current_page():
+    with store_exceptions_on_all_threads():
+        book, ui, editor = _edit_book(5)
+        try:
+            nose.tools.assert_equal(editor.control.count(), 5)
+            nose.tools.assert_equal(_live_pages(editor),
+                                    [True, False, False, False, False])
+        finally:
+            ui.dispose()
+
+
+@skip_if_not_qt4
+def test_lazy_notebook_disposes_of_the_least_recently_viewed_page():
+    with store_exceptions_on_all_threads():
+        book, ui, editor = _edit_book(5)
+        try:
+            first_ui = editor._uis[0][1]
+            editor.control.setCurrentIndex(1)
+            nose.tools.assert_equal(_live_pages(editor),
+                                    [True, True, False, False, False])
+
+            # Viewing a third page disposes of the first one:
+            editor.control.setCurrentIndex(3)
+            nose.tools.assert_equal(_live_pages(editor),
+                                    [False, True, False, True, False])
+            nose.tools.assert_true(first_ui.control is None)
+
+            # Viewing the first page again rebuilds it:
+            editor.control.setCurrentIndex(0)
+            nose.tools.assert_equal(_live_pages(editor),
+                                    [True, False, False, True, False])
+            page, page_ui, _, _ = editor._uis[0]
+            nose.tools.assert_false(page_ui is first_ui)
+            nose.tools.assert_true(page_ui.control.parent() is page)
+        finally:
+            ui.dispose()
+
+
+@skip_if_not_qt4
+def test_lazy_notebook_inserts_a_page_in_order():
+    with store_exceptions_on_all_threads():
+        book, ui, editor = _edit_book(4)
+        try:
+            book.pages.insert(2, Page(name='new'))
+            control = editor.control
+            nose.tools.assert_equal(
+                [control.tabText(i) for i in range(control.count())],
+                ['page 0', 'page 1', 'new', 'page 2', 'page 3'])
+            nose.tools.assert_equal(
+                [view_object for _, _, view_object, _ in editor._uis],
+                book.pages)
+
+            # The new page is shown, and so has been built:
+            nose.tools.assert_equal(control.currentIndex(), 2)
+            nose.tools.assert_equal(_live_pages(editor),
+                                    [True, False, True, False, False])
+        finally:
+            ui.dispose()
@@ -14,7 +14,8 @@
 #------------------------------------------------------------------------------
 
 
-from traits.api import Bool, HasTraits, Instance, Int, List
+from traits.api import (Bool, HasTraits, Instance, Int, Interface, List,
+                        Property, provides)
 from traitsui.api import Item, TreeEditor, TreeNode, View
 
 from traitsui.tests._tools import *
@@ -77,3 +78,240 @@ def test_tree_editor_listeners_with_shown_root():
 
 def test_tree_editor_listeners_with_hidden_root():
     _test_tree_editor_releases_listeners(hide_root=True)
+
+
+class BogusLeaf(Bogus):
+    """ A bogus class which is also handled by a node of its own. """
+
+
+class OddNode(TreeNode):
+    """ A node whose applicability depends on the object, not its class. """
+
+    def is_node_for(self, object):
+        return len(object.bogus_list) % 2 == 1
+
+
+def test_node_resolution_is_cached_per_class():
+    bogus_node = TreeNode(node_for=[Bogus], children='bogus_list')
+    label_node = TreeNode(node_for=[Bogus], label='=Bogus')
+    leaf_node = TreeNode(node_for=[BogusLeaf])
+    editor = TreeEditor(nodes=[leaf_node, bogus_node])
+
+    nose.tools.assert_is(editor.node_for_object(Bogus()), bogus_node)
+    nose.tools.assert_is(editor.node_for_object(Bogus()), bogus_node)
+    nose.tools.assert_is(editor.node_for_object(BogusLeaf()), leaf_node)
+    nose.tools.assert_equal(editor.node_cache_stats,
+                            {'hits': 1, 'misses': 2})
+
+    nose.tools.assert_is(editor.node_for_class(BogusLeaf), leaf_node)
+    nose.tools.assert_equal(editor.node_for_class_name('Bogus'),
+                            (bogus_node, Bogus))
+
+    # Changing the nodes invalidates the cache:
+    editor.nodes = [bogus_node, label_node]
+    multi_node = editor.node_for_object(BogusLeaf())
+    nose.tools.assert_is(multi_node.root_node, label_node)
+    nose.tools.assert_equal(multi_node.nodes, [bogus_node])
+    nose.tools.assert_is(editor.node_for_object(Bogus()), multi_node)
+    nose.tools.assert_is(editor.node_for_class(BogusLeaf), bogus_node)
+    nose.tools.assert_equal(editor.node_for_class_name('BogusLeaf'),
+                            (None, None))
+
+
+def test_non_cacheable_nodes_are_asked_each_time():
+    bogus_node = TreeNode(node_for=[Bogus], children='bogus_list')
+    odd_node = OddNode()
+    nose.tools.assert_true(bogus_node.cacheable)
+    nose.tools.assert_false(odd_node.cacheable)
+
+    editor = TreeEditor(nodes=[odd_node, bogus_node])
+    nose.tools.assert_is(editor.node_for_object(Bogus()), bogus_node)
+    nose.tools.assert_is(editor.node_for_object(Bogus(bogus_list=[1])),
+                         odd_node)
+
+
+def _virtual_tree_ui(bogus, fetch_size=2):
+    """ Returns a UI displaying a Bogus tree using a virtual tree editor, and
+    the tree model of the editor.
+    """
+    tree_editor = TreeEditor(
+        nodes=[TreeNode(node_for=[Bogus], children='bogus_list',
+                        label='=Bogus')],
+        editable=False, virtual=True, fetch_size=fetch_size
+    )
+    ui = HasTraits(bogus=bogus).edit_traits(
+        view=View(Item('bogus', editor=tree_editor))
+    )
+    editor = ui.get_editors('bogus')[0]
+
+    return ui, editor, editor._tree.model()
+
+
+@skip_if_not_qt4
+def test_virtual_tree_fetches_children_in_pages():
+    with store_exceptions_on_all_threads():
+        child = Bogus(bogus_list=[Bogus() for i in range(5)])
+        bogus = Bogus(bogus_list=[child])
+        ui, editor, model = _virtual_tree_ui(bogus)
+
+        # The (shown) root record is the only child of the model root:
+        nose.tools.assert_equal(model.rowCount(), 1)
+        root_index = model.index(0, 0)
+        root = model.record_for(root_index)
+        nose.tools.assert_is(root.object, bogus)
+        nose.tools.assert_equal(model.index_for(root), root_index)
+
+        # Nothing is fetched below a node until it is expanded (the view
+        # fetches further pages of expanded nodes by itself, so page through
+        # the children of a collapsed node):
+        index = model.index(0, 0, root_index)
+        nose.tools.assert_true(model.hasChildren(index))
+        nose.tools.assert_equal(model.rowCount(index), 0)
+        nose.tools.assert_true(model.canFetchMore(index))
+        model.fetchMore(index)
+        nose.tools.assert_equal(model.rowCount(index), 2)
+        model.fetchMore(index)
+        nose.tools.assert_equal(model.rowCount(index), 4)
+        model.fetchMore(index)
+        nose.tools.assert_equal(model.rowCount(index), 5)
+        nose.tools.assert_false(model.canFetchMore(index))
+
+        # Indices map to the records of the child objects, and back:
+        for row, grandchild in enumerate(child.bogus_list):
+            grandchild_index = model.index(row, 0, index)
+            record = model.record_for(grandchild_index)
+            nose.tools.assert_is(record.object, grandchild)
+            nose.tools.assert_equal(record.row, row)
+            nose.tools.assert_equal(model.parent(grandchild_index), index)
+            nose.tools.assert_equal(model.index_for(record), grandchild_index)
+        nose.tools.assert_false(model.index(5, 0, index).isValid())
+
+        ui.dispose()
+
+
+@skip_if_not_qt4
+def test_virtual_tree_replace_children():
+    with store_exceptions_on_all_threads():
+        children = [Bogus() for i in range(3)]
+        bogus = Bogus(bogus_list=children)
+        ui, editor, model = _virtual_tree_ui(bogus, fetch_size=0)
+        root_index = model.index(0, 0)
+        records = model.record_for(root_index).children[:]
+
+        signals = []
+        model.rowsRemoved.connect(
+            lambda parent, first, last: signals.append(('remove', first, last)))
+        model.rowsInserted.connect(
+            lambda parent, first, last: signals.append(('insert', first, last)))
+        model.layoutChanged.connect(lambda *args: signals.append('layout'))
+
+        # Count changes are reported as removals and insertions:
+        new = Bogus()
+        bogus.bogus_list = [children[0], new, children[2]]
+        nose.tools.assert_equal(signals,
+                                [('remove', 1, 1), ('insert', 1, 1)])
+        replaced = model.record_for(root_index).children
+        nose.tools.assert_is(replaced[0], records[0])
+        nose.tools.assert_is(replaced[2], records[2])
+        nose.tools.assert_is(replaced[1].object, new)
+        nose.tools.assert_equal([record.row for record in replaced],
+                                [0, 1, 2])
+
+        # A pure reordering is reported as a layout change:
+        del signals[:]
+        bogus.bogus_list = [children[2], new, children[0]]
+        nose.tools.assert_equal(signals, ['layout'])
+        nose.tools.assert_is(model.index(0, 0, root_index).internalPointer(),
+                             records[2])
+        nose.tools.assert_equal(model.index_for(records[0]).row(), 2)
+
+        ui.dispose()
+
+
+@skip_if_not_qt4
+def test_virtual_tree_release():
+    with store_exceptions_on_all_threads():
+        child = Bogus(bogus_list=[Bogus()])
+        bogus = Bogus(bogus_list=[child])
+        ui, editor, model = _virtual_tree_ui(bogus)
+        root = model.record_for(model.index(0, 0))
+        record = root.children[0]
+
+        model.fetch(record)
+        nose.tools.assert_equal(model.rowCount(model.index_for(record)), 1)
+        notifiers_list = child.trait('bogus_list')._notifiers(False)
+        nose.tools.assert_equal(1, len(notifiers_list))
+
+        # Releasing a record stops listening to its children:
+        model.release(record)
+        nose.tools.assert_true(record.children is None)
+        nose.tools.assert_equal(model.rowCount(model.index_for(record)), 0)
+        nose.tools.assert_true(model.canFetchMore(model.index_for(record)))
+        notifiers_list = child.trait('bogus_list')._notifiers(False)
+        nose.tools.assert_equal(0, len(notifiers_list))
+
+        ui.dispose()
+
+
+@skip_if_not_qt4
+def test_virtual_tree_replace_children_of_selected_grandchild():
+    import gc
+    from pyface.qt import QtCore
+
+    with store_exceptions_on_all_threads():
+        grandchild = Bogus()
+        bogus = Bogus(bogus_list=[Bogus(bogus_list=[grandchild])])
+        ui, editor, model = _virtual_tree_ui(bogus)
+        record = model.record_for(model.index(0, 0)).children[0]
+        model.fetch(record)
+        editor._tree.setExpanded(model.index_for(record), True)
+        index = model.index_for(record.children[0])
+        editor._tree.setCurrentIndex(index)
+        selected = QtCore.QPersistentModelIndex(index)
+        del record, index
+
+        # Replacing the grandparent's children releases the selected record
+        # (and its index), without touching the released record:
+        bogus.bogus_list = [Bogus()]
+        gc.collect()
+        nose.tools.assert_false(selected.isValid())
+        root_index = model.index(0, 0)
+        nose.tools.assert_equal(model.rowCount(root_index), 1)
+        current = editor._tree.currentIndex()
+        if current.isValid():
+            nose.tools.assert_is_not(model.record_for(current).object,
+                                     grandchild)
+
+        ui.dispose()
+
+
+class IBogus(Interface):
+    """ An interface provided by some Bogus objects. """
+
+
+@provides(IBogus)
+class ProvidingBogus(HasTraits):
+    """ A bogus class which is only handled through its interface. """
+
+
+class InterfaceNode(TreeNode):
+    """ A node whose interfaces are set independently of 'node_for'. """
+
+    interfaces = List
+
+    node_for_interface = Property(depends_on='interfaces')
+
+    def _get_node_for_interface(self):
+        return self.interfaces
+
+
+def test_changing_node_interfaces_invalidates_cache():
+    interface_node = InterfaceNode(node_for=[Bogus])
+    other_node = TreeNode(node_for=[HasTraits])
+    editor = TreeEditor(nodes=[interface_node, other_node])
+    nose.tools.assert_is(editor.node_for_object(ProvidingBogus()),
+                         other_node)
+
+    interface_node.interfaces = [IBogus]
+    nose.tools.assert_is(editor.node_for_object(ProvidingBogus()),
+                         interface_node)
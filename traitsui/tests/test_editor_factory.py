@@ -0,0 +1,89 @@
+#------------------------------------------------------------------------------
+#
+#  Copyright (c) 2013, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in enthought/LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#------------------------------------------------------------------------------
+
+"""
+Test cases for the cached lookup of the toolkit editor classes.
+"""
+
+from traitsui.editor_factory import EditorFactory, toolkit_editor_stats
+from traitsui.toolkit import toolkit
+
+from traitsui.tests._tools import *
+
+
+class MissingEditor(EditorFactory):
+    pass
+
+
+def test_missing_editor_is_cached():
+    misses = toolkit_editor_stats['misses']
+    hits = toolkit_editor_stats['hits']
+
+    # No backend defines this editor class, for any factory class:
+    for i in range(3):
+        nose.tools.assert_raises(AttributeError,
+                                 MissingEditor._get_toolkit_editor,
+                                 'NoSuchEditor')
+
+    nose.tools.assert_equal(toolkit_editor_stats['misses'], misses + 1)
+    nose.tools.assert_equal(toolkit_editor_stats['hits'], hits + 2)
+
+
+def test_preload_editors():
+    class PreloadedEditor(EditorFactory):
+        pass
+
+    found = toolkit().preload_editors([PreloadedEditor])
+    misses = toolkit_editor_stats['misses']
+    hits = toolkit_editor_stats['hits']
+
+    # Whichever of the editor classes the backend defines, all of them are
+    # now looked up in the cache:
+    resolved = 0
+    for class_name in ('SimpleEditor', 'CustomEditor', 'TextEditor',
+                       'ReadonlyEditor'):
+        try:
+            PreloadedEditor._get_toolkit_editor(class_name)
+            resolved += 1
+        except AttributeError:
+            pass
+
+    nose.tools.assert_equal(resolved, found)
+    nose.tools.assert_equal(toolkit_editor_stats['misses'], misses)
+    nose.tools.assert_equal(toolkit_editor_stats['hits'], hits + 4)
+
+
+class FoundEditor(object):
+    pass
+
+
+class RetriedEditor(EditorFactory):
+
+    # The results of the backend searches, in order:
+    results = [ImportError('circular import'), FoundEditor]
+
+    @classmethod
+    def _find_toolkit_editor(cls, class_name):
+        result = cls.results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+def test_import_error_is_not_cached():
+    # A backend module which fails to import (e.g. because of a circular
+    # import) is looked up again next time:
+    nose.tools.assert_raises(ImportError, RetriedEditor._get_toolkit_editor,
+                             'SimpleEditor')
+    for i in range(2):
+        nose.tools.assert_is(RetriedEditor._get_toolkit_editor('SimpleEditor'),
+                             FoundEditor)
@@ -0,0 +1,201 @@
+#------------------------------------------------------------------------------
+#
+#  Copyright (c) 2013, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in enthought/LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#------------------------------------------------------------------------------
+
+"""
+Test cases for the helper classes used by the editors.
+"""
+
+import numpy
+
+from traitsui.helper import (EnumValues, RowChanges, RowIndex, UIPool,
+    common_affixes, enum_values_changed, match_items, row_blocks, text_delta)
+
+from traitsui.tests._tools import *
+
+
+class Item(object):
+    def __init__(self, name):
+        self.name = name
+
+    def __eq__(self, other):
+        return self.name == getattr(other, 'name', None)
+
+
+def test_row_index_lookup():
+    items = [Item('a'), Item('b'), Item('c')]
+    index = RowIndex(lambda: items)
+
+    nose.tools.assert_equal([index.row_for(item) for item in items],
+                            [0, 1, 2])
+
+    # Items equal to a list item are still found:
+    nose.tools.assert_equal(index.row_for(Item('b')), 1)
+    nose.tools.assert_equal(index.row_for(Item('z')), -1)
+
+
+def test_row_index_array_lookup():
+    # The rows of an array are new objects each time they are read, and an
+    # array has no index method, so they are not found:
+    items = numpy.arange(6).reshape(3, 2)
+    index = RowIndex(lambda: items)
+    nose.tools.assert_equal(index.row_for(items[1]), -1)
+
+
+def test_row_index_items_changed():
+    items = [Item('a'), Item('b'), Item('c')]
+    index = RowIndex(lambda: items)
+    index.row_for(items[0])
+
+    added = [Item('x'), Item('y')]
+    removed = items[1:2]
+    items[1:2] = added
+    index.items_changed(1, removed, added)
+    nose.tools.assert_equal([index.row_for(item) for item in items],
+                            [0, 1, 2, 3])
+
+    # Duplicated items resolve to their first row:
+    items.append(items[0])
+    index.items_changed(4, [], items[4:])
+    nose.tools.assert_equal(index.row_for(items[0]), 0)
+
+    del items[0]
+    index.items_changed(0, [items[-1]], [])
+    nose.tools.assert_equal(index.row_for(items[-1]), 3)
+    nose.tools.assert_equal(index.row_for(items[2]), 2)
+
+
+def test_row_blocks():
+    nose.tools.assert_equal(row_blocks([7, 1, 2, 3, 5, 6, 9]),
+                            [(1, 3), (5, 7), (9, 9)])
+    nose.tools.assert_equal(row_blocks([]), [])
+
+
+def test_row_changes_are_coalesced():
+    updates = []
+    scheduled = []
+    changes = RowChanges(updates.append, scheduled.append, max_rows=4)
+
+    for row in (3, 4, 3, 8):
+        changes.add(row)
+    nose.tools.assert_equal(len(scheduled), 1)
+
+    scheduled.pop()()
+    nose.tools.assert_equal(updates, [[(3, 4), (8, 8)]])
+
+    # Too many changed rows cause a full refresh:
+    for row in range(10):
+        changes.add(row)
+    scheduled.pop()()
+    nose.tools.assert_equal(updates[-1], None)
+
+    # Reset changes are never reported:
+    changes.add(1)
+    changes.reset()
+    scheduled.pop()()
+    nose.tools.assert_equal(len(updates), 2)
+
+
+def test_match_items_by_identity():
+    a, b, c, d = [Item('x') for i in range(4)]
+
+    nose.tools.assert_equal(match_items([a, b, c], [c, a, d, b]),
+                            [2, 0, -1, 1])
+
+    # Duplicates are matched in order, and at most once each:
+    nose.tools.assert_equal(match_items([a, b, a], [a, a, a, b]),
+                            [0, 2, -1, 1])
+    nose.tools.assert_equal(match_items([], [a]), [-1])
+
+
+class _PooledUI(object):
+    def __init__(self, can_retarget=True):
+        self.can_retarget = can_retarget
+        self.context = None
+        self.disposed = False
+
+    def retarget(self, context):
+        if self.can_retarget:
+            self.context = context
+        return self.can_retarget
+
+    def dispose(self):
+        self.disposed = True
+
+
+def test_ui_pool_reuses_and_evicts():
+    pool = UIPool(size=2)
+    a, b, c = _PooledUI(), _PooledUI(), _PooledUI(can_retarget=False)
+
+    nose.tools.assert_is_none(pool.get('a', {}))
+    pool.add('a', a)
+    pool.add('b', b)
+    nose.tools.assert_is(pool.get('a', {'object': 1}), a)
+    nose.tools.assert_equal(a.context, {'object': 1})
+    nose.tools.assert_equal(len(pool), 1)
+
+    # A user interface which cannot be re-targeted is disposed of:
+    pool.add('c', c)
+    nose.tools.assert_is_none(pool.get('c', {}))
+    nose.tools.assert_true(c.disposed)
+
+    # The least recently used user interface is evicted:
+    pool.add('a', a)
+    pool.add('c', _PooledUI())
+    nose.tools.assert_true(b.disposed)
+    nose.tools.assert_false(a.disposed)
+    nose.tools.assert_equal((pool.hits, pool.misses), (1, 2))
+
+    pool.clear()
+    nose.tools.assert_true(a.disposed)
+    nose.tools.assert_equal(len(pool), 0)
+
+
+def test_enum_values_changed_sorts_mapped_values():
+    names, mapping, inverse = enum_values_changed({1: '2:b', 2: '1:a'})
+    nose.tools.assert_equal(names, ['a', 'b'])
+    nose.tools.assert_equal(mapping, {'a': 2, 'b': 1})
+    nose.tools.assert_equal(inverse, {2: 'a', 1: 'b'})
+
+
+def test_enum_values_update_items_and_complete():
+    enum = EnumValues(['IBM', 'AAPL', 'MSFT'], str)
+    nose.tools.assert_equal(enum.complete('A'), ['AAPL'])
+
+    # Replace 'AAPL' by two new values:
+    nose.tools.assert_true(enum.update_items(1, ['AAPL'], ['AMZN', 'AMD']))
+    nose.tools.assert_equal(enum.names, ['IBM', 'AMZN', 'AMD', 'MSFT'])
+    nose.tools.assert_equal(enum.mapping['AMD'], 'AMD')
+    nose.tools.assert_false('AAPL' in enum.inverse_mapping)
+    nose.tools.assert_equal(enum.complete('AM'), ['AMD', 'AMZN'])
+    nose.tools.assert_equal(enum.complete('A', limit=1), ['AMD'])
+
+    # Duplicates and extended slices can not be applied incrementally:
+    nose.tools.assert_false(enum.update_items(0, [], ['MSFT']))
+    nose.tools.assert_false(enum.update_items(slice(0, 4, 2), [], []))
+    nose.tools.assert_equal(len(enum.names), 4)
+
+    nose.tools.assert_true(enum.update_items(0, ['IBM', 'AMZN'], []))
+    nose.tools.assert_equal(enum.names, ['AMD', 'MSFT'])
+    nose.tools.assert_equal(enum.complete(''), ['AMD', 'MSFT'])
+
+
+def test_text_delta():
+    for old, new in [('hello world', 'hello brave world'),
+                     ('aaaa', 'aa'), ('', 'xyz'), ('xyz', ''),
+                     ('abcabc', 'abc'), ('same', 'same')]:
+        start, end, text = text_delta(old, new)
+        nose.tools.assert_equal(old[:start] + text + old[end:], new)
+
+    nose.tools.assert_equal(text_delta('hello world', 'hello brave world'),
+                            (6, 6, 'brave '))
+    # The suffix never overlaps the prefix:
+    nose.tools.assert_equal(common_affixes('aaaa', 'aa'), (2, 0))
@@ -0,0 +1,226 @@
+#------------------------------------------------------------------------------
+#
+#  Copyright (c) 2013, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in enthought/LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#------------------------------------------------------------------------------
+
+"""
+Test cases for the image volume index used by the ImageLibrary.
+"""
+
+import os
+import shutil
+import tempfile
+import threading
+import time
+from zipfile import ZipFile
+
+from traitsui.image.image import (ImageLibrary, ImageVolumeIndex, FastZipFile,
+                                  ZipFilePool, zip_file_pool)
+from traitsui.image.memory_cache import (ImageMemoryCache, UnknownImageBytes,
+                                         image_bytes)
+
+from traitsui.tests._tools import *
+
+
+volume_code = """
+from traitsui.image.image import ImageVolume, ImageVolumeInfo
+
+volume = ImageVolume(
+    category    = 'Test',
+    keywords    = [ 'test' ],
+    aliases     = [ 'tests' ],
+    time_stamp  = '29990101010000',
+    info        = [ ImageVolumeInfo( copyright = 'Nobody' ) ]
+)
+"""
+
+images_code = """
+from traitsui.image.image import ImageInfo
+from traitsui.ui_traits   import Margin, Border
+
+images = [
+    ImageInfo(
+        name        = 'dot',
+        image_name  = '@sample:dot',
+        width       = 16,
+        height      = 8,
+        border      = Border( 1, 2, 3, 4 ),
+        alignment   = 'center'
+    )
+]
+"""
+
+
+def _make_volume(path):
+    zf = ZipFile(path, 'w')
+    zf.writestr('image_volume.py', volume_code)
+    zf.writestr('image_info.py', images_code)
+    zf.writestr('dot.png', 'not really a png')
+    zf.close()
+
+
+def test_indexed_volume_is_not_opened():
+    temp_dir = tempfile.mkdtemp()
+    try:
+        zip_path = os.path.join(temp_dir, 'sample.zip')
+        index_path = os.path.join(temp_dir, 'cache', 'volumes.idx')
+        _make_volume(zip_path)
+
+        library_class = ImageLibrary.__class__
+        library = library_class(index=ImageVolumeIndex(path=index_path))
+        library.add_volume(zip_path)
+        nose.tools.assert_true(os.path.exists(index_path))
+        zip_file_pool.close(zip_path)
+
+        # A new library is built from the index alone:
+        library = library_class(index=ImageVolumeIndex(path=index_path))
+        library.add_volume(zip_path)
+        volume = library.find_volume('@tests:dot')
+        nose.tools.assert_equal(volume.name, 'sample')
+        nose.tools.assert_equal(volume.keywords, ['test'])
+        nose.tools.assert_equal(volume.info[0].copyright, 'Nobody')
+
+        info = library.image_info('@sample:dot')
+        nose.tools.assert_equal((info.width, info.height), (16, 8))
+        nose.tools.assert_equal(info.border.get('left', 'bottom'),
+                                {'left': 1, 'bottom': 4})
+        nose.tools.assert_equal(info.alignment, 'center')
+        nose.tools.assert_false(zip_file_pool.is_open(zip_path))
+
+        # The image data is still read from the zip file on demand:
+        nose.tools.assert_equal(volume.image_data('@sample:dot'),
+                                'not really a png')
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def test_modified_volume_is_reloaded():
+    temp_dir = tempfile.mkdtemp()
+    try:
+        zip_path = os.path.join(temp_dir, 'sample.zip')
+        index_path = os.path.join(temp_dir, 'volumes.idx')
+        _make_volume(zip_path)
+
+        index = ImageVolumeIndex(path=index_path)
+        library = ImageLibrary.__class__(index=index)
+        library.add_volume(zip_path)
+        nose.tools.assert_true(index.volume_for(zip_path) is not None)
+
+        mtime = os.stat(zip_path).st_mtime
+        os.utime(zip_path, (mtime + 10, mtime + 10))
+        nose.tools.assert_true(index.volume_for(zip_path) is None)
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def test_zip_file_pool():
+    temp_dir = tempfile.mkdtemp()
+    idle_timeout = zip_file_pool.idle_timeout
+    try:
+        zip_path = os.path.join(temp_dir, 'sample.zip')
+        _make_volume(zip_path)
+        zip_file_pool.idle_timeout = 0.1
+        zf = FastZipFile(path=zip_path)
+
+        nose.tools.assert_equal(zf.read_many(['dot.png', 'image_info.py']),
+                                ['not really a png', images_code])
+
+        # Each reading thread uses its own handle:
+        results = []
+        def read():
+            results.append(zf.read('dot.png'))
+        threads = [threading.Thread(target=read) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        nose.tools.assert_equal(results, ['not really a png'] * 4)
+        nose.tools.assert_true(zip_file_pool.is_open(zip_path))
+
+        # Idle handles are closed by the reaper:
+        for i in range(50):
+            if not zip_file_pool.is_open(zip_path):
+                break
+            time.sleep(0.1)
+        nose.tools.assert_false(zip_file_pool.is_open(zip_path))
+    finally:
+        zip_file_pool.idle_timeout = idle_timeout
+        shutil.rmtree(temp_dir)
+
+
+def test_close_before_read():
+    temp_dir = tempfile.mkdtemp()
+    try:
+        zip_path = os.path.join(temp_dir, 'sample.zip')
+        _make_volume(zip_path)
+
+        # Closing a pool which has never opened a zip file does nothing:
+        pool = ZipFilePool()
+        pool.close(zip_path)
+        nose.tools.assert_false(pool.is_open(zip_path))
+
+        FastZipFile(path=zip_path).close()
+        nose.tools.assert_false(zip_file_pool.is_open(zip_path))
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def test_image_memory_cache_eviction():
+    cache = ImageMemoryCache(budget=100)
+    cache.add(('std', 'a.png', None), 'a', 40)
+    cache.add(('std', 'b.png', None), 'b', 40)
+
+    nose.tools.assert_equal(cache.get(('std', 'a.png', None)), 'a')
+    nose.tools.assert_true(cache.get(('std', 'c.png', None)) is None)
+
+    # 'b' is the least recently used image, so it is evicted first:
+    cache.add(('std', 'c.png', None), 'c', 40)
+    nose.tools.assert_true(cache.get(('std', 'b.png', None)) is None)
+    nose.tools.assert_equal(cache.image_for(('std', 'c.png', None), None), 'c')
+
+    nose.tools.assert_equal(cache.stats(),
+                            {'count': 2, 'bytes': 80, 'budget': 100,
+                             'hits': 2, 'misses': 2, 'evictions': 1})
+
+    cache.budget = 50
+    nose.tools.assert_equal(cache.stats()['count'], 1)
+    nose.tools.assert_equal(cache.image_for(('std', 'a.png', None),
+                                            lambda: 'new a'), 'new a')
+
+
+def test_image_memory_cache_unknown_size():
+    # An image whose size cannot be determined still uses part of the budget:
+    nose.tools.assert_equal(image_bytes(object()), UnknownImageBytes)
+
+    cache = ImageMemoryCache(budget=UnknownImageBytes)
+    cache.add(('std', 'a.png', None), 'a')
+    cache.add(('std', 'b.png', None), 'b')
+    nose.tools.assert_equal(cache.stats()['count'], 1)
+    nose.tools.assert_equal(cache.stats()['bytes'], UnknownImageBytes)
+
+
+@skip_if_not_qt4
+def test_icon_cache_shares_decoded_images():
+    from pyface.image_resource import ImageResource
+    from traitsui.image.memory_cache import image_memory_cache
+    from traitsui.qt4.helper import icon_cache, pixmap_cache
+
+    image_memory_cache.clear()
+    resource = ImageResource('closetab')
+    hits = image_memory_cache.hits
+    icon = icon_cache(resource)
+    nose.tools.assert_false(icon.isNull())
+
+    # Icons for the same image file share the decoded image:
+    icon_cache(ImageResource('closetab'))
+    nose.tools.assert_equal(image_memory_cache.hits, hits + 1)
+    pixmap = pixmap_cache(resource.absolute_path)
+    nose.tools.assert_equal(image_memory_cache.hits, hits + 2)
+    nose.tools.assert_equal(pixmap.size(), icon.availableSizes()[0])
@@ -0,0 +1,75 @@
+#------------------------------------------------------------------------------
+#
+#  Copyright (c) 2013, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in enthought/LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#------------------------------------------------------------------------------
+
+"""
+Test cases for the dispatching of keys by KeyBindings.
+"""
+
+import nose
+
+from traitsui.key_bindings import KeyBinding, KeyBindings
+
+
+class Controller(object):
+
+    def __init__(self):
+        self.called = []
+
+    def save(self):
+        self.called.append('save')
+
+    def child_undo(self):
+        self.called.append('undo')
+
+    def ignore(self):
+        # Returning False lets the next binding handle the key:
+        return False
+
+
+def test_dispatch():
+    parent = KeyBindings(
+        KeyBinding(binding1='Ctrl-S', method_name='save'),
+        KeyBinding(binding1='Ctrl-I', method_name='ignore'))
+    child = KeyBindings(
+        KeyBinding(binding1='Ctrl-Z', binding2='Ctrl-I', method_name='undo'),
+        prefix='child_')
+    parent.children.append(child)
+    controller = Controller()
+
+    nose.tools.assert_true(parent._do('Ctrl-S', [controller], (), False))
+    nose.tools.assert_equal(controller.called, ['save'])
+
+    # Child bindings are only searched when recursive:
+    nose.tools.assert_false(parent._do('Ctrl-Z', [controller], (), False))
+    nose.tools.assert_true(parent._do('Ctrl-Z', [controller], (), True))
+    nose.tools.assert_true(parent._do('Ctrl-I', [controller], (), True))
+    nose.tools.assert_equal(controller.called, ['save', 'undo', 'undo'])
+    nose.tools.assert_false(parent._do('Ctrl-Q', [controller], (), True))
+
+
+def test_dispatch_after_changes():
+    parent = KeyBindings(KeyBinding(binding1='Ctrl-S', method_name='save'))
+    child = KeyBindings(KeyBinding(binding1='Ctrl-Z', method_name='undo'),
+                        prefix='child_')
+    controller = Controller()
+    nose.tools.assert_false(parent._do('Ctrl-Z', [controller], (), True))
+
+    # Adding a child, or changing a binding, updates the compiled table:
+    parent.children.append(child)
+    nose.tools.assert_true(parent._do('Ctrl-Z', [controller], (), True))
+
+    child.bindings[0].binding1 = 'Ctrl-Y'
+    nose.tools.assert_false(parent._do('Ctrl-Z', [controller], (), True))
+    nose.tools.assert_true(parent._do('Ctrl-Y', [controller], (), True))
+
+    child.dispose()
+    nose.tools.assert_false(parent._do('Ctrl-Y', [controller], (), True))
@@ -0,0 +1,78 @@
+#------------------------------------------------------------------------------
+#
+#  Copyright (c) 2013, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in enthought/LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#------------------------------------------------------------------------------
+
+"""
+Test cases for the TableColumn block and sort key interfaces.
+"""
+
+from traits.api import HasTraits, Float, Str
+
+from traitsui.table_column import NumericColumn, ObjectColumn
+
+from traitsui.tests._tools import *
+
+
+class Point(HasTraits):
+    name = Str
+    x = Float
+
+
+class ReversedColumn(ObjectColumn):
+
+    def cmp(self, object1, object2):
+        return -ObjectColumn.cmp(self, object1, object2)
+
+
+def _points():
+    return [Point(name='b', x=2.0), Point(name='a', x=3.5),
+            Point(name='c', x=-1.0)]
+
+
+def test_object_column_sort_keys():
+    points = _points()
+
+    keys = ObjectColumn(name='name').get_sort_keys(points)
+    nose.tools.assert_equal(keys, ['b', 'a', 'c'])
+
+    column = ObjectColumn(name='name', sort_key=lambda p: -p.x)
+    nose.tools.assert_equal(column.get_sort_keys(points), [-2.0, -3.5, 1.0])
+
+
+def test_cmp_override_disables_sort_keys():
+    nose.tools.assert_is_none(
+        ReversedColumn(name='name').get_sort_keys(_points()))
+
+
+def test_numeric_column_sort_keys():
+    keys = NumericColumn(name='x').get_sort_keys(_points())
+    nose.tools.assert_equal(list(keys.argsort()), [2, 0, 1])
+
+
+def test_get_block():
+    column = ObjectColumn(name='x', format='%.1f')
+    block = column.get_block(_points(), ['value', 'horizontal_alignment'])
+    nose.tools.assert_equal(block, [('2.0', 'left'), ('3.5', 'left'),
+                                    ('-1.0', 'left')])
+
+
+class TooltipColumn(ObjectColumn):
+
+    def get_tooltip(self, object):
+        return 'point %s' % object.name
+
+
+def test_get_block_overridden_role():
+    # A role whose 'get_' method is overridden is computed for each object:
+    column = TooltipColumn(name='x', tooltip='ignored')
+    block = column.get_block(_points(), ['tooltip', 'text_color'])
+    nose.tools.assert_equal([values[0] for values in block],
+                            ['point b', 'point a', 'point c'])
@@ -0,0 +1,146 @@
+#------------------------------------------------------------------------------
+#
+#  Copyright (c) 2013, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in enthought/LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#------------------------------------------------------------------------------
+
+"""
+Test cases for the compiled dispatch of TabularAdapter requests.
+"""
+
+from traits.api import HasTraits, Int, List, Property, Str
+
+from traitsui.tabular_adapter import AnITabularAdapter, TabularAdapter
+
+from traitsui.tests._tools import *
+
+
+class Person(HasTraits):
+    name = Str
+    age = Int
+
+
+class Team(HasTraits):
+    people = List(Person)
+
+
+class PersonAdapter(TabularAdapter):
+    columns = [('Name', 'name'), ('Age', 'age')]
+
+    age_alignment = Str('right')
+
+    Person_age_text = Property
+
+    def _get_Person_age_text(self):
+        return '%d (row %d)' % (self.item.age, self.row)
+
+
+class AgeAdapter(AnITabularAdapter):
+    columns = [('Age', 'age')]
+
+    age_format = Str('<%s>')
+
+
+class RowWatcherAdapter(PersonAdapter):
+
+    def _row_changed(self):
+        self.tooltip = 'row %d' % self.row
+
+
+def _team():
+    return Team(people=[Person(name='Ann', age=40), Person(name='Bob', age=32)])
+
+
+def test_results_match_handlers():
+    team = _team()
+    adapter = PersonAdapter()
+
+    nose.tools.assert_equal(adapter.get_text(team, 'people', 0, 0), 'Ann')
+    nose.tools.assert_equal(adapter.get_text(team, 'people', 1, 1),
+                            '32 (row 1)')
+    nose.tools.assert_equal(adapter.get_alignment(team, 'people', 1), 'right')
+    nose.tools.assert_equal(adapter.get_alignment(team, 'people', 0), 'left')
+
+    # Second pass is served from the dispatch table:
+    nose.tools.assert_equal(adapter.get_text(team, 'people', 0, 1),
+                            '40 (row 0)')
+    nose.tools.assert_equal(adapter.get_text(team, 'people', 1, 0), 'Bob')
+
+
+def test_plain_traits_skip_context():
+    team = _team()
+    adapter = PersonAdapter()
+
+    adapter.get_alignment(team, 'people', 1)
+    adapter.get_text(team, 'people', 1, 0)
+    nose.tools.assert_equal(adapter.row, 1)
+
+    # Reading a plain trait does not need (or update) the row context:
+    nose.tools.assert_equal(adapter.get_format(team, 'people', 0, 0), '%s')
+    nose.tools.assert_equal(adapter.row, 1)
+
+    plan = adapter.cache[(Person, 'get_format', 0)]
+    nose.tools.assert_false(plan[1])
+    plan = adapter.cache[(Person, 'get_text', 0)]
+    nose.tools.assert_true(plan[1])
+
+
+def test_context_observers_keep_context():
+    team = _team()
+    adapter = RowWatcherAdapter()
+
+    nose.tools.assert_equal(adapter.get_tooltip(team, 'people', 1, 0),
+                            'row 1')
+    nose.tools.assert_equal(adapter.get_tooltip(team, 'people', 0, 0),
+                            'row 0')
+    nose.tools.assert_true(adapter.cache[(Person, 'get_tooltip', 0)][1])
+
+
+def test_delegated_adapters_and_flush():
+    team = _team()
+    age_adapter = AgeAdapter()
+    adapter = PersonAdapter(adapters=[age_adapter])
+
+    nose.tools.assert_equal(adapter.get_format(team, 'people', 0, 1), '<%s>')
+    nose.tools.assert_equal(adapter.get_format(team, 'people', 0, 0), '%s')
+
+    age_adapter.accepts = False
+    nose.tools.assert_equal(len(adapter.cache), 2)
+    adapter._flush_cache()
+    nose.tools.assert_equal(adapter.cache, {})
+    nose.tools.assert_equal(adapter.get_format(team, 'people', 0, 1), '%s')
+
+
+def test_set_text():
+    team = _team()
+    adapter = PersonAdapter()
+
+    adapter.set_text(team, 'people', 1, 0, 'Bill')
+    adapter.set_text(team, 'people', 0, 0, 'Anna')
+    nose.tools.assert_equal([p.name for p in team.people], ['Anna', 'Bill'])
+
+
+def test_get_block():
+    team = _team()
+    adapter = PersonAdapter()
+
+    block = adapter.get_block(team, 'people', [0, 1], [0, 1],
+                              ['text', 'alignment', 'can_edit'])
+    nose.tools.assert_equal(block[(0, 0)], ('Ann', 'left', True))
+    nose.tools.assert_equal(block[(1, 1)], ('32 (row 1)', 'right', True))
+    nose.tools.assert_equal(len(block), 4)
+
+
+def test_get_block_item_roles():
+    team = _team()
+    adapter = PersonAdapter(tooltip='a person')
+
+    block = adapter.get_block(team, 'people', [0, 1], [1], ['text', 'tooltip'])
+    nose.tools.assert_equal(block[(0, 1)], ('40 (row 0)', 'a person'))
+    nose.tools.assert_equal(block[(1, 1)], ('32 (row 1)', 'a person'))
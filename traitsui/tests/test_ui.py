@@ -18,9 +18,15 @@ Test cases for the UI object.
 """
 
 from traits.has_traits import HasTraits
-from traits.trait_types import Str, Int
+from traits.api import Property
+from traits.trait_types import Bool, Str, Int, List
 import traitsui
+from traitsui.editor import Editor
+from traitsui.editor_factory import EditorFactory
+from traitsui.editors.list_editor import ListEditor
+from traitsui.handler import Handler
 from traitsui.item import Item
+from traitsui.ui import UI, compile_condition
 from traitsui.view import View
 
 from traitsui.tests._tools import *
@@ -196,3 +202,143 @@ def test_destroy_after_ok_qt():
     for c in ui_children:
         if isinstance(c, qt.QtGui.QWidget):
             nose.tools.assert_equal(c.deleteLater._n_calls, 1)
+
+
+class WhenObject(HasTraits):
+    count = Int
+    names = List(Str)
+    label = Str
+    total = Property
+
+    def _get_total(self):
+        return self.count + len(self.names)
+
+
+class WhenEditor(HasTraits):
+    visible = Bool(True)
+    evaluated = Int
+
+    def _visible_changed(self):
+        self.evaluated += 1
+
+
+def test_condition_names():
+    code, names = compile_condition('object.count > 1 and label == "x"')
+    nose.tools.assert_true(set(['object', 'count', 'label',
+                                'count_items']).issubset(names))
+
+    # Expressions calling functions may depend on anything:
+    nose.tools.assert_is_none(compile_condition('len(names) > 0')[1])
+
+    # Compiled conditions are shared:
+    nose.tools.assert_is(compile_condition('count > 1')[0],
+                         compile_condition('count > 1')[0])
+
+
+def test_conditions_use_their_dependencies():
+    obj = WhenObject()
+    ui = UI(view=View(), context={'object': obj}, handler=Handler())
+    count_editor = WhenEditor()
+    names_editor = WhenEditor()
+    total_editor = WhenEditor()
+    ui.add_visible('count > 1', count_editor)
+    ui.add_visible('object.names', names_editor)
+    ui.add_visible('total > 2', total_editor)
+    ui._check_condition_names()
+    ui._do_evaluate_when(at_init=True)
+
+    nose.tools.assert_false(count_editor.visible)
+    nose.tools.assert_false(names_editor.visible)
+
+    obj.count = 2
+    ui._evaluate_when(obj, 'count', 0, 2)
+    nose.tools.assert_true(count_editor.visible)
+    nose.tools.assert_false(names_editor.visible)
+
+    obj.names.append('a')
+    ui._evaluate_when(obj, 'names_items', None, None)
+    nose.tools.assert_true(names_editor.visible)
+
+    # 'total' has no declared dependencies, so it is always evaluated:
+    obj.label = 'x'
+    ui._evaluate_when(obj, 'label', '', 'x')
+    nose.tools.assert_true(total_editor.visible)
+
+
+class _Control(object):
+    _object = None
+
+
+def test_retarget_rebinds_context_and_conditions():
+    old, new = WhenObject(), WhenObject(count=5)
+    ui = UI(view=View(), context={'object': old}, handler=Handler())
+    ui.control = _Control()
+    ui.info.bind_context()
+    editor = WhenEditor()
+    ui.add_visible('count > 1', editor)
+    ui._check_condition_names()
+    ui._do_evaluate_when(at_init=True)
+    nose.tools.assert_false(editor.visible)
+
+    nose.tools.assert_true(ui.retarget({'object': new}))
+    nose.tools.assert_is(ui.context['object'], new)
+    nose.tools.assert_is(ui.info.object, new)
+    nose.tools.assert_is(ui.control._object, new)
+    nose.tools.assert_true(editor.visible)
+
+    # The handler in the context is kept if the new context has none:
+    handler = Handler()
+    ui.context['handler'] = handler
+    nose.tools.assert_true(ui.retarget({'object': old}))
+    nose.tools.assert_is(ui.context['handler'], handler)
+    nose.tools.assert_true(ui.retarget({'object': new}))
+
+    # Contexts with different names or classes need a new user interface:
+    nose.tools.assert_false(ui.retarget({'object': new, 'other': old}))
+    nose.tools.assert_false(ui.retarget({'object': WhenEditor()}))
+    nose.tools.assert_is(ui.context['object'], new)
+
+
+def test_retarget_is_refused_by_editors_which_are_not_retargetable():
+    old, new = WhenObject(), WhenObject(count=5)
+    ui = UI(view=View(), context={'object': old}, handler=Handler())
+    ui.control = _Control()
+    ui.info.bind_context()
+    editor = Editor(None, factory=EditorFactory(), ui=ui, object=old,
+                    name='count')
+    ui._editors = [editor]
+
+    nose.tools.assert_true(ui.retarget({'object': new}))
+    nose.tools.assert_is(editor.object, new)
+    nose.tools.assert_equal(editor.old_value, 5)
+
+    editor.retargetable = False
+    nose.tools.assert_false(ui.retarget({'object': old}))
+    nose.tools.assert_is(editor.object, new)
+
+
+@skip_if_not_qt4
+def test_retarget_list_editor_qt():
+    old = WhenObject(names=['a'])
+    new = WhenObject(names=['b', 'c'])
+    view = View(Item('names', editor=ListEditor()))
+
+    with store_exceptions_on_all_threads():
+        ui = old.edit_traits(view=view)
+        editor = ui.get_editors('names')[0]
+        old_notifiers = len(old.trait('names_items')._notifiers(True))
+
+        nose.tools.assert_true(ui.retarget({'object': new}))
+        nose.tools.assert_is(editor.object, new)
+
+        # The list items listener has moved to the new object:
+        nose.tools.assert_equal(
+            len(old.trait('names_items')._notifiers(True)),
+            old_notifiers - 1)
+        nose.tools.assert_equal(
+            len(new.trait('names_items')._notifiers(True)), old_notifiers)
+
+        new.names.append('d')
+        nose.tools.assert_equal(editor.value, ['b', 'c', 'd'])
+
+        ui.dispose()
@@ -0,0 +1,87 @@
+#------------------------------------------------------------------------------
+#
+#  Copyright (c) 2013, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in enthought/LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#------------------------------------------------------------------------------
+
+"""
+Test cases for the user preference stores.
+"""
+
+import os
+import shelve
+import shutil
+import tempfile
+
+import nose
+
+from traitsui.ui_db import ShelvePrefsStore, SQLitePrefsStore
+
+
+def _with_tempdir(test):
+    def wrapper():
+        path = tempfile.mkdtemp()
+        try:
+            test(path)
+        finally:
+            shutil.rmtree(path)
+
+    wrapper.__name__ = test.__name__
+    return wrapper
+
+
+@_with_tempdir
+def test_sqlite_store_writes_back(path):
+    db_path = os.path.join(path, 'traits_ui.sqlite')
+    store = SQLitePrefsStore(db_path, flush_delay=None)
+
+    prefs = {'': (10, 20, 300, 400), 'table': [50, 60]}
+    store['view.id'] = prefs
+    # Later changes to the object do not change the stored value:
+    prefs['table'].append(70)
+    nose.tools.assert_equal(store.get('view.id'),
+                            {'': (10, 20, 300, 400), 'table': [50, 60]})
+    nose.tools.assert_is_none(store.get('other.id'))
+
+    # Nothing is written until the store is flushed:
+    reader = SQLitePrefsStore(db_path, flush_delay=None)
+    nose.tools.assert_is_none(reader.get('view.id'))
+
+    store.flush()
+    reader = SQLitePrefsStore(db_path, flush_delay=None)
+    nose.tools.assert_equal(reader['view.id']['table'], [50, 60])
+    nose.tools.assert_raises(KeyError, reader.__getitem__, 'other.id')
+
+    store.shutdown()
+    reader.shutdown()
+
+
+@_with_tempdir
+def test_sqlite_store_migrates_shelve(path):
+    shelve_path = os.path.join(path, 'traits_ui')
+    shelf = shelve.open(shelve_path, flag='c', protocol=-1)
+    shelf['old.view'] = {'': (1, 2, 3, 4)}
+    shelf.close()
+
+    store = SQLitePrefsStore(os.path.join(path, 'traits_ui.sqlite'),
+                             migrate_from=shelve_path, flush_delay=None)
+    nose.tools.assert_equal(store.get('old.view'), {'': (1, 2, 3, 4)})
+    store.shutdown()
+
+
+@_with_tempdir
+def test_shelve_store(path):
+    store = ShelvePrefsStore(os.path.join(path, 'traits_ui'),
+                             flush_delay=None)
+    store['view.id'] = {'': (1, 2, 3, 4)}
+    store.flush()
+
+    reader = ShelvePrefsStore(os.path.join(path, 'traits_ui'))
+    nose.tools.assert_equal(reader.get('view.id'), {'': (1, 2, 3, 4)})
+    nose.tools.assert_is_none(reader.get('other.id'))
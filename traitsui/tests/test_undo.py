@@ -0,0 +1,152 @@
+#------------------------------------------------------------------------------
+#
+#  Copyright (c) 2013, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in enthought/LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#------------------------------------------------------------------------------
+
+"""
+Test cases for the undo history.
+"""
+
+import numpy
+
+from traits.api import Any, HasTraits, List, Str
+
+from traitsui.undo import UndoHistory, UndoItem
+
+from traitsui.tests._tools import *
+
+
+class Document(HasTraits):
+    text = Str
+    items = List
+    data = Any
+
+
+def _change(history, object, name, value):
+    old_value = getattr(object, name)
+    setattr(object, name, value)
+    history.add(UndoItem(object=object, name=name, old_value=old_value,
+                         new_value=value))
+
+
+def test_compacted_string_undo_and_redo():
+    document = Document()
+    history = UndoHistory()
+    texts = ['x' * 10000, 'x' * 5000 + 'abc' + 'x' * 5000,
+             'x' * 5000 + 'abc' + 'x' * 4000, 'yy' + 'x' * 5000 + 'abc']
+    for text in texts:
+        _change(history, document, 'text', text)
+
+    # All but the most recent step only keep the changed range:
+    nose.tools.assert_true(history.memory_use < 4 * 10000)
+
+    for text in reversed(texts):
+        nose.tools.assert_equal(document.text, text)
+        history.undo()
+    nose.tools.assert_equal(document.text, '')
+
+    for text in texts:
+        history.redo()
+        nose.tools.assert_equal(document.text, text)
+
+
+def test_single_character_string_edits_are_merged():
+    document = Document()
+    history = UndoHistory()
+    _change(history, document, 'text', 'a')
+    for text in ['ab', 'abc', 'abXc', 'aXc', 'aYc']:
+        _change(history, document, 'text', text)
+
+    # Typing one character at a time (inserting, deleting or replacing it)
+    # is a single undo step:
+    nose.tools.assert_equal(history.now, 1)
+    history.undo()
+    nose.tools.assert_equal(document.text, '')
+    history.redo()
+    nose.tools.assert_equal(document.text, 'aYc')
+
+
+def test_larger_string_edits_are_separate_steps():
+    document = Document()
+    history = UndoHistory()
+    texts = ['abc', 'abcde', 'e', 'xyz', 'xyz']
+    for text in texts:
+        _change(history, document, 'text', text)
+
+    # Only the identical last value is merged:
+    nose.tools.assert_equal(history.now, 4)
+    for text in ['xyz', 'e', 'abcde', 'abc']:
+        nose.tools.assert_equal(document.text, text)
+        history.undo()
+    nose.tools.assert_equal(document.text, '')
+
+
+def test_compacted_list_and_array_undo():
+    document = Document(items=range(1000), data=numpy.zeros(1000))
+    history = UndoHistory()
+
+    _change(history, document, 'items', range(500) + [-1] + range(501, 1000))
+    data = document.data.copy()
+    data[10] = 5.0
+    _change(history, document, 'data', data)
+    _change(history, document, 'text', 'done')
+
+    history.undo()
+    history.undo()
+    nose.tools.assert_equal(document.data[10], 0.0)
+    history.undo()
+    nose.tools.assert_equal(document.items, range(1000))
+    history.redo()
+    history.redo()
+    nose.tools.assert_equal(document.items[500], -1)
+    nose.tools.assert_equal(document.data[10], 5.0)
+
+
+def test_undo_history_budget():
+    document = Document()
+    history = UndoHistory(max_steps=3)
+    for i in range(5):
+        _change(history, document, 'text', 'step %d' % i * 100)
+    nose.tools.assert_equal(len(history.history), 3)
+    nose.tools.assert_equal(history.now, 3)
+
+    history.max_bytes = 1
+    nose.tools.assert_equal(len(history.history), 1)
+    history.undo()
+    nose.tools.assert_equal(document.text, 'step 3' * 100)
+    nose.tools.assert_false(history.can_undo)
+
+
+def test_compacted_list_detects_outside_changes():
+    document = Document(items=['a', 'b', 'c'])
+    item = UndoItem(object=document, name='items', old_value=['a', 'b', 'c'],
+                    new_value=['a', 'x', 'c'])
+    document.items = ['a', 'x', 'c']
+    item.compact()
+    nose.tools.assert_equal(item.old_value, ['a', 'b', 'c'])
+
+    # A change which keeps the length of the list is still detected:
+    document.items[0] = 'z'
+    with nose.tools.assert_raises(ValueError):
+        item.old_value
+
+
+def test_compacted_list_of_unhashable_items_undo():
+    rows = [[i] for i in range(5)]
+    document = Document(items=rows)
+    history = UndoHistory()
+    _change(history, document, 'items', rows[:2] + [['new']] + rows[3:])
+    _change(history, document, 'text', 'done')
+
+    history.undo()
+    history.undo()
+    nose.tools.assert_equal(document.items, rows)
+    history.redo()
+    nose.tools.assert_equal(document.items[2], ['new'])
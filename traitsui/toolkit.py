@@ -418,6 +418,39 @@ class Toolkit ( HasPrivateTraits ):
     def ui_editor ( self ):
         raise NotImplementedError
 
+    #---------------------------------------------------------------------------
+    #  Resolves the editor classes of the editor factories ahead of time:
+    #---------------------------------------------------------------------------
+
+    def preload_editors ( self, factories = None ):
+        """ Resolves the toolkit editor classes of the specified editor factory
+            classes (or of every EditorFactory subclass defined so far), so
+            that views built later on do not have to look them up. Returns the
+            number of editor classes found.
+        """
+        from .editor_factory import EditorFactory
+
+        if factories is None:
+            factories = []
+            pending   = [ EditorFactory ]
+            while len( pending ) > 0:
+                factory = pending.pop()
+                if factory not in factories:
+                    factories.append( factory )
+                    pending.extend( factory.__subclasses__() )
+
+        found = 0
+        for factory in factories:
+            for class_name in ( 'SimpleEditor', 'CustomEditor', 'TextEditor',
+                                'ReadonlyEditor' ):
+                try:
+                    factory._get_toolkit_editor( class_name )
+                    found += 1
+                except Exception:
+                    pass
+
+        return found
+
     #---------------------------------------------------------------------------
     #  'EditorFactory' factory methods:
     #---------------------------------------------------------------------------
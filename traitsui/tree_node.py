@@ -127,6 +127,10 @@ class TreeNode ( HasPrivateTraits ):
     # View to use for editing the object
     view = AView
 
+    # Can the user interface built for editing the object be kept and reused
+    # (re-targeted) for other objects of the same class using the same view?
+    reuse_view = Bool( True )
+
     # Right-click context menu. The value can be one of:
     #
     # - Instance( Menu ): Use this menu as the context menu
@@ -152,6 +156,11 @@ class TreeNode ( HasPrivateTraits ):
     # Selector or name for foreground color
     foreground = Any
 
+    # Does 'is_node_for' depend only on the class of an object, so that tree
+    # editors can cache the node used for each class? Defaults to True unless
+    # a subclass overrides 'is_node_for':
+    cacheable = Bool
+
     # fixme: The 'menu' trait should really be defined as:
     #        Instance( 'traitsui.menu.MenuBar' ), but it doesn't work
     #        right currently.
@@ -165,6 +174,14 @@ class TreeNode ( HasPrivateTraits ):
         if self.icon_path == '':
             self.icon_path = get_resource_path()
 
+    #---------------------------------------------------------------------------
+    #  Returns the default value of the 'cacheable' trait:
+    #---------------------------------------------------------------------------
+
+    def _cacheable_default ( self ):
+        return (self.__class__.is_node_for.im_func is
+                TreeNode.is_node_for.im_func)
+
     #-- Property Implementations -----------------------------------------------
 
     @cached_property
@@ -423,6 +440,16 @@ class TreeNode ( HasPrivateTraits ):
         """
         return self.view
 
+    #---------------------------------------------------------------------------
+    #  Returns whether the view used to edit an object can be reused:
+    #---------------------------------------------------------------------------
+
+    def can_reuse_view ( self, object ):
+        """ Returns whether the user interface built to edit an object can be
+            reused for other objects of the same class.
+        """
+        return self.reuse_view
+
     #---------------------------------------------------------------------------
     #  Returns the right-click context menu for an object:
     #---------------------------------------------------------------------------
@@ -1213,6 +1240,12 @@ class ITreeNodeAdapterBridge ( HasPrivateTraits ):
         """
         return self.adapter.get_view()
 
+    def can_reuse_view ( self, object ):
+        """ Returns whether the user interface built to edit an object can be
+            reused for other objects of the same class.
+        """
+        return True
+
     def get_menu ( self, object ):
         """ Returns the right-click context menu for an object.
         """
@@ -2237,6 +2270,16 @@ class MultiTreeNode ( TreeNode ):
         """
         return self.root_node.get_view( object )
 
+    #---------------------------------------------------------------------------
+    #  Returns whether the view used to edit an object can be reused:
+    #---------------------------------------------------------------------------
+
+    def can_reuse_view ( self, object ):
+        """ Returns whether the user interface built to edit an object can be
+            reused for other objects of the same class.
+        """
+        return self.root_node.can_reuse_view( object )
+
     #---------------------------------------------------------------------------
     #  Returns the right-click context menu for an object:
     #---------------------------------------------------------------------------
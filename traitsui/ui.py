@@ -25,14 +25,14 @@
 
 from __future__ import absolute_import
 
-import shelve
-import os
+from dis import opname, HAVE_ARGUMENT
+from types import CodeType
 
 from traits.api import (Any, Bool, Callable, DictStrAny, Event, HasPrivateTraits,
     Instance, Int, List, Property, Str, TraitError, on_trait_change,
     property_depends_on)
 
-from traits.trait_base import traits_home, is_str
+from traits.trait_base import is_str
 
 from .editor import Editor
 
@@ -42,6 +42,8 @@ from .handler import Handler, ViewHandler
 
 from .toolkit import toolkit
 
+from .ui_db import get_ui_db
+
 from .ui_info import UIInfo
 
 from .item import Item
@@ -55,6 +57,63 @@ from .group import Group, ShadowGroup
 # List of **kind** types for views that must have a **parent** window specified
 kind_must_have_parent = ( 'panel', 'subpanel' )
 
+# Byte codes which call a function (making the names an expression depends on
+# impossible to determine statically):
+CallOpcodes = set( [ opcode for opcode, name in enumerate( opname )
+                     if name.startswith( 'CALL_FUNCTION' ) ] )
+
+#-------------------------------------------------------------------------------
+#  Data:
+#-------------------------------------------------------------------------------
+
+# Cache of compiled condition expressions (the keys are the expression
+# strings, and the values are ( code, names ) tuples):
+compiled_conditions = {}
+
+#-------------------------------------------------------------------------------
+#  Compiles a 'visible_when', 'enabled_when' or 'checked_when' expression:
+#-------------------------------------------------------------------------------
+
+def compile_condition ( when ):
+    """ Returns a ( code, names ) tuple for the specified condition expression
+        string, where *code* is the compiled expression and *names* is the set
+        of trait names whose changes can affect the value of the expression
+        (or None if they cannot be determined statically).
+    """
+    result = compiled_conditions.get( when )
+    if result is None:
+        code   = compile( when, '<string>', 'eval' )
+        result = compiled_conditions[ when ] = ( code, condition_names( code ) )
+
+    return result
+
+def condition_names ( code ):
+    """ Returns the set of names referenced by a compiled expression, or None
+        if the expression calls any function or method (since the result of
+        the call may depend upon any trait).
+    """
+    names = set()
+    codes = [ code ]
+    while len( codes ) > 0:
+        code = codes.pop()
+        names.update( code.co_names )
+        codes.extend( [ const for const in code.co_consts
+                        if isinstance( const, CodeType ) ] )
+
+        byte_code = code.co_code
+        i, n      = 0, len( byte_code )
+        while i < n:
+            opcode = ord( byte_code[ i ] )
+            if opcode in CallOpcodes:
+                return None
+
+            i += (3 if opcode >= HAVE_ARGUMENT else 1)
+
+    # Changes to the contents of a list trait are reported as 'name_items':
+    names.update( [ name + '_items' for name in names ] )
+
+    return frozenset( names )
+
 #-------------------------------------------------------------------------------
 #  'UI' class:
 #-------------------------------------------------------------------------------
@@ -138,15 +197,18 @@ class UI ( HasPrivateTraits ):
     # List of methods to call once the user interface is created
     _defined = List
 
-    # List of (visible_when,Editor) pairs
+    # List of (visible_when,Editor,names) tuples
     _visible = List
 
-    # List of (enabled_when,Editor) pairs
+    # List of (enabled_when,Editor,names) tuples
     _enabled = List
 
-    # List of (checked_when,Editor) pairs
+    # List of (checked_when,Editor,names) tuples
     _checked = List
 
+    # The context used to evaluate 'when' expressions (None if not built yet)
+    _when_context = Any
+
     # Search stack used while building a user interface
     _search = List
 
@@ -186,7 +248,7 @@ class UI ( HasPrivateTraits ):
     recyclable_traits = [
         '_context', '_revert', '_defined', '_visible', '_enabled', '_checked',
         '_search', '_dispatchers', '_editors', '_names', '_active_group',
-        '_undoable', '_rebuild', '_groups_cache'
+        '_undoable', '_rebuild', '_groups_cache', '_when_context'
     ]
 
     # List of additional traits that are discarded when a user interface is
@@ -255,6 +317,62 @@ class UI ( HasPrivateTraits ):
         # Reset all recyclable traits:
         self.reset_traits( self.recyclable_traits )
 
+    #---------------------------------------------------------------------------
+    #  Re-targets the user interface at a new context:
+    #---------------------------------------------------------------------------
+
+    def retarget ( self, context ):
+        """ Re-targets the user interface at a new context, which must contain
+            objects of the same classes under the same names as the current
+            one, by re-binding its editors instead of rebuilding it.
+
+            Returns False (leaving the user interface unchanged) if the user
+            interface cannot be re-targeted, in which case a new user
+            interface should be built instead.
+        """
+        # The handler which View.ui adds to the context stays the same:
+        old_context = self.context
+        if ('handler' in old_context) and ('handler' not in context):
+            context = context.copy()
+            context[ 'handler' ] = old_context[ 'handler' ]
+
+        if ((self.control is None) or (len( self._dispatchers ) > 0) or
+            (sorted( context.keys() ) != sorted( old_context.keys() ))):
+            return False
+
+        for name, object in context.items():
+            if object.__class__ is not old_context[ name ].__class__:
+                return False
+
+        for editor in self._editors:
+            if not editor.can_retarget():
+                return False
+
+        # Stop listening to the old context objects:
+        for object in old_context.values():
+            object.on_trait_change( self._evaluate_when, remove = True )
+
+        for editor in self._editors:
+            editor.retarget( remove = True )
+
+        # Switch to the new context and re-bind everything to it:
+        self.context = context.copy()
+        self.info.rebind_context()
+        self.control._object = context.get( 'object' )
+
+        for editor in self._editors:
+            editor.retarget()
+
+        if (len( self._visible ) +
+            len( self._enabled ) +
+            len( self._checked )) > 0:
+            self._check_condition_names()
+            for object in context.values():
+                object.on_trait_change( self._evaluate_when, dispatch = 'ui' )
+            self._do_evaluate_when( at_init = True )
+
+        return True
+
     #---------------------------------------------------------------------------
     #  Finishes a user interface:
     #---------------------------------------------------------------------------
@@ -451,6 +569,7 @@ class UI ( HasPrivateTraits ):
         if (len( self._visible ) +
             len( self._enabled ) +
             len( self._checked )) > 0:
+            self._check_condition_names()
             for object in context.values():
                 object.on_trait_change( self._evaluate_when, dispatch = 'ui' )
             self._do_evaluate_when(at_init=True)
@@ -606,10 +725,13 @@ class UI ( HasPrivateTraits ):
 
     def get_ui_db ( self, mode = 'r' ):
         """ Returns a reference to the Traits UI preference database.
+
+            The database is shared by all user interfaces and stays open, so
+            the *mode* argument is ignored, and calling its **close** method
+            is harmless.
         """
         try:
-            return shelve.open( os.path.join( traits_home(), 'traits_ui' ),
-                                flag = mode, protocol = -1 )
+            return get_ui_db()
         except:
             return None
 
@@ -622,6 +744,17 @@ class UI ( HasPrivateTraits ):
         """
         return [ editor for editor in self._editors if editor.name == name ]
 
+    #---------------------------------------------------------------------------
+    #  Assigns any user input not yet assigned by the user interface's editors:
+    #---------------------------------------------------------------------------
+
+    def flush ( self ):
+        """ Assigns any user input which the editors of the user interface
+            have not yet assigned to the traits they edit.
+        """
+        for editor in self._editors:
+            editor.flush()
+
     #---------------------------------------------------------------------------
     #  Returns the list of editor error controls contained by the user
     #  interface:
@@ -662,8 +795,8 @@ class UI ( HasPrivateTraits ):
             'visible_when' objects.
         """
         try:
-            self._visible.append( ( compile( visible_when, '<string>', 'eval' ),
-                                    editor ) )
+            code, names = compile_condition( visible_when )
+            self._visible.append( ( code, editor, names ) )
         except:
             pass
             # fixme: Log an error here...
@@ -678,8 +811,8 @@ class UI ( HasPrivateTraits ):
             'enabled_when' objects.
         """
         try:
-            self._enabled.append( ( compile( enabled_when, '<string>', 'eval' ),
-                                    editor ) )
+            code, names = compile_condition( enabled_when )
+            self._enabled.append( ( code, editor, names ) )
         except:
             pass
             # fixme: Log an error here...
@@ -694,8 +827,8 @@ class UI ( HasPrivateTraits ):
             monitored 'checked_when' objects.
         """
         try:
-            self._checked.append( ( compile( checked_when, '<string>', 'eval' ),
-                                    editor ) )
+            code, names = compile_condition( checked_when )
+            self._checked.append( ( code, editor, names ) )
         except:
             pass
             # fixme: Log an error here...
@@ -774,13 +907,11 @@ class UI ( HasPrivateTraits ):
         """
         context = self._get_context( self.context )
         try:
-            result = eval( when, globals(), context )
+            result = eval( compile_condition( when )[0], globals(), context )
         except:
             from traitsui.api import raise_to_debug
             raise_to_debug()
 
-        del context[ 'ui' ]
-
         return result
 
     #---------------------------------------------------------------------------
@@ -788,8 +919,13 @@ class UI ( HasPrivateTraits ):
     #---------------------------------------------------------------------------
 
     def _get_context ( self, context ):
-        """ Gets the context to use for evaluating an expression.
+        """ Gets the context to use for evaluating an expression. The context
+            is only built once (until the UI's context changes), since it
+            looks up the traits of the context object when they are used.
         """
+        if (self._when_context is not None) and (context is self.context):
+            return self._when_context
+
         name = 'object'
         n    = len( context )
         if (n == 2) and ('handler' in context):
@@ -799,32 +935,51 @@ class UI ( HasPrivateTraits ):
         elif n == 1:
             name = context.keys()[0]
 
-        value = context.get( name )
-        if value is not None:
-            context2 = value.trait_get()
-            context2.update( context )
-        else:
-            context2 = context.copy()
-
-        context2['ui'] = self
+        context2 = ConditionContext( context, context.get( name ), self )
+        if context is self.context:
+            self._when_context = context2
 
         return context2
 
+    #---------------------------------------------------------------------------
+    #  Makes every condition using a property whose dependencies are not
+    #  declared be evaluated on every trait change:
+    #---------------------------------------------------------------------------
+
+    def _check_condition_names ( self ):
+        """ Makes every condition which uses a property trait with no declared
+            dependencies be evaluated on every trait change, since changes to
+            such a property are never reported.
+        """
+        undeclared = set()
+        for object in self.context.values():
+            for name, trait in object.traits( type = 'property' ).items():
+                if trait.depends_on is None:
+                    undeclared.add( name )
+
+        if len( undeclared ) == 0:
+            return
+
+        for conditions in ( self._visible, self._enabled, self._checked ):
+            for i, ( when, editor, names ) in enumerate( conditions ):
+                if (names is not None) and (not undeclared.isdisjoint( names )):
+                    conditions[ i ] = ( when, editor, None )
+
     #---------------------------------------------------------------------------
     #  Sets the 'visible', 'enabled' and/or 'checked' state for all Editors
     #  controlled by a 'visible_when', 'enabled_when' or 'checked_when'
     #  expression:
     #---------------------------------------------------------------------------
 
-    def _evaluate_when(self):
+    def _evaluate_when(self, object, name, old, new):
         """ Set the 'visible', 'enabled', and 'checked' states for all Editors
             controlled by a 'visible_when', 'enabled_when' or 'checked_when'
-            expression.
+            expression which depends on the trait that changed.
         """
-        self._do_evaluate_when(at_init=False)
+        self._do_evaluate_when(at_init=False, name=name)
 
 
-    def _do_evaluate_when(self, at_init=False):
+    def _do_evaluate_when(self, at_init=False, name=None):
         """ Set the 'visible', 'enabled', and 'checked' states for all Editors.
 
         This function does the job of _evaluate_when. We define it here to
@@ -834,10 +989,13 @@ class UI ( HasPrivateTraits ):
         :attr:`at_init` is set to true when this function is called the first
         time at initialization. In that case, we want to force the state of
         the items to be set (normally it is set only if it changes).
+
+        :attr:`name` is the name of the trait that changed. If it is not None,
+        only the conditions which may depend on that trait are evaluated.
         """
-        self._evaluate_condition(self._visible, 'visible', at_init)
-        self._evaluate_condition(self._enabled, 'enabled', at_init)
-        self._evaluate_condition(self._checked, 'checked', at_init)
+        self._evaluate_condition(self._visible, 'visible', at_init, name)
+        self._evaluate_condition(self._enabled, 'enabled', at_init, name)
+        self._evaluate_condition(self._checked, 'checked', at_init, name)
 
 
     #---------------------------------------------------------------------------
@@ -845,7 +1003,7 @@ class UI ( HasPrivateTraits ):
     #  each editor to reflect the boolean truth of the expression evaluated:
     #---------------------------------------------------------------------------
 
-    def _evaluate_condition(self, conditions, trait, at_init=False):
+    def _evaluate_condition(self, conditions, trait, at_init=False, name=None):
         """ Evaluates a list of (eval, editor) pairs and sets a specified trait
         on each editor to reflect the Boolean value of the expression.
 
@@ -864,10 +1022,11 @@ class UI ( HasPrivateTraits ):
 
         Parameters
         ----------
-        conditions : list of (str, Editor) tuple
-            A list of tuples, each formed by 1) a string that contains a
-            condition that evaluates to either True or False, and
-            2) the editor whose state depends on the condition
+        conditions : list of (code, Editor, names) tuple
+            A list of tuples, each formed by 1) the compiled condition that
+            evaluates to either True or False, 2) the editor whose state
+            depends on the condition, and 3) the set of trait names the
+            condition depends on (or None if they are not known)
 
         trait : str
             The trait that is set by the condition.
@@ -878,6 +1037,10 @@ class UI ( HasPrivateTraits ):
             (e.g., a visible element would not be updated to visible=True
             again). If True, the state is always updated (used at
             initialization).
+
+        name : str
+            The name of the trait that changed. If it is not None, only the
+            conditions which may depend on it are evaluated.
         """
 
         context = self._get_context( self.context )
@@ -888,7 +1051,10 @@ class UI ( HasPrivateTraits ):
         # list of elements that should be de-activated
         deactivate = []
 
-        for when, editor in conditions:
+        for when, editor, names in conditions:
+            if (name is not None) and (names is not None) and (name not in names):
+                continue
+
             try:
                 cond_value = eval(when, globals(), context)
                 editor_state = getattr(editor, trait)
@@ -968,6 +1134,10 @@ class UI ( HasPrivateTraits ):
         if self.control is not None:
             toolkit().set_icon( self )
 
+    @on_trait_change( 'context, context_items' )
+    def _context_modified ( self ):
+        self._when_context = None
+
     @on_trait_change( 'parent, view, context' )
     def _pvc_changed ( self ):
         parent = self.parent
@@ -981,6 +1151,33 @@ class UI ( HasPrivateTraits ):
             if parent.key_bindings is not None:
                 parent.key_bindings.children.append( self.key_bindings )
 
+#-------------------------------------------------------------------------------
+#  'ConditionContext' class:
+#-------------------------------------------------------------------------------
+
+class ConditionContext ( dict ):
+    """ The namespace used to evaluate 'when' expressions. It contains the
+        UI's context and the UI itself, and it looks up the traits of the main
+        context object only when an expression uses them (so that no snapshot
+        of the object's traits has to be taken for each evaluation).
+    """
+
+    def __init__ ( self, context, object, ui ):
+        dict.__init__( self, context )
+        self[ 'ui' ] = ui
+        self.object  = object
+
+    def __missing__ ( self, name ):
+        object = self.object
+        if (object is not None) and ((name in object.__base_traits__) or
+            ((name in object.__dict__) and
+             (object.trait( name ) is not None))):
+            value = getattr( object, name, self )
+            if value is not self:
+                return value
+
+        raise KeyError( name )
+
 #-------------------------------------------------------------------------------
 #  'Dispatcher' class:
 #-------------------------------------------------------------------------------
@@ -0,0 +1,380 @@
+#------------------------------------------------------------------------------
+#
+#  Copyright (c) 2005, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in enthought/LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+#
+#------------------------------------------------------------------------------
+
+""" Defines the stores used to persist the user preferences of Traits UIs
+    (such as window positions and column widths) between sessions.
+
+    A single store is shared by all user interfaces and is returned by
+    **get_ui_db**. It is kept open for the life of the process, and caches
+    the values read and written, so that opening and closing views does not
+    touch the disk. Changed values are written in a single batch once the
+    application is idle, and when the process exits.
+
+    The default store is an SQLite database (in write-ahead logging mode, so
+    that several processes sharing the same traits home directory can use it
+    concurrently). The contents of the 'traits_ui' shelve database used by
+    previous versions are copied into it the first time it is created. A
+    different store can be installed using **set_ui_db**.
+"""
+
+#-------------------------------------------------------------------------------
+#  Imports:
+#-------------------------------------------------------------------------------
+
+from __future__ import absolute_import
+
+import atexit
+import os
+import shelve
+
+from cPickle import dumps, loads, HIGHEST_PROTOCOL
+
+from traits.trait_base import traits_home
+
+from .helper import LRUCache
+
+try:
+    import sqlite3
+except ImportError:
+    sqlite3 = None
+
+#-------------------------------------------------------------------------------
+#  Constants:
+#-------------------------------------------------------------------------------
+
+# The name (within the traits home directory) of the shelve database used by
+# earlier versions:
+SHELVE_NAME = 'traits_ui'
+
+# The name (within the traits home directory) of the SQLite database:
+SQLITE_NAME = 'traits_ui.sqlite'
+
+#-------------------------------------------------------------------------------
+#  Data:
+#-------------------------------------------------------------------------------
+
+# The shared preference store (created on first use):
+_ui_db = None
+
+#-------------------------------------------------------------------------------
+#  Returns the shared user preference store:
+#-------------------------------------------------------------------------------
+
+def get_ui_db ( ):
+    """ Returns the preference store shared by all Traits UIs, creating the
+        default store if no store has been set.
+    """
+    global _ui_db
+
+    if _ui_db is None:
+        home = traits_home()
+        if sqlite3 is not None:
+            _ui_db = SQLitePrefsStore( os.path.join( home, SQLITE_NAME ),
+                                       migrate_from = os.path.join( home,
+                                                              SHELVE_NAME ) )
+        else:
+            _ui_db = ShelvePrefsStore( os.path.join( home, SHELVE_NAME ) )
+
+    return _ui_db
+
+#-------------------------------------------------------------------------------
+#  Sets the shared user preference store:
+#-------------------------------------------------------------------------------
+
+def set_ui_db ( store ):
+    """ Sets the preference store shared by all Traits UIs. Any store
+        previously in use is flushed and closed. Passing None restores the
+        default store on the next use.
+    """
+    global _ui_db
+
+    if (_ui_db is not None) and (_ui_db is not store):
+        _ui_db.shutdown()
+
+    _ui_db = store
+
+#-------------------------------------------------------------------------------
+#  Flushes the shared store when the process exits:
+#-------------------------------------------------------------------------------
+
+def _flush_at_exit ( ):
+    if _ui_db is not None:
+        try:
+            _ui_db.flush()
+        except Exception:
+            pass
+
+atexit.register( _flush_at_exit )
+
+#-------------------------------------------------------------------------------
+#  'PrefsStore' class:
+#-------------------------------------------------------------------------------
+
+class PrefsStore ( object ):
+    """ Abstract base class for user preference stores.
+
+        A store maps UI ids to preference values using the same subset of the
+        dictionary interface as the shelve databases previously used (i.e.
+        **get**, item access and **close**). Values are pickled when they are
+        assigned, and unpickled each time they are read, so (as with a shelf)
+        later changes to an object do not affect the value stored for it.
+
+        Assigned values are held in memory until **flush** writes them all to
+        the backing storage. A flush is scheduled (using the GUI toolkit's
+        timer) *flush_delay* milliseconds after the first unwritten change.
+        Subclasses implement **_load**, **_save** and **_close**.
+    """
+
+    def __init__ ( self, flush_delay = 1000, cache_size = 64 ):
+        # The delay before writing changes (None to only write on **flush**):
+        self.flush_delay = flush_delay
+
+        # The pickled values most recently read or written, by id:
+        self._cache = LRUCache( cache_size )
+
+        # The pickled values not yet written, by id:
+        self._dirty = {}
+
+        # Has a flush been scheduled?
+        self._flush_pending = False
+
+    #-- Dictionary interface ---------------------------------------------------
+
+    def get ( self, id, default = None ):
+        """ Returns the value stored for *id*, or *default* if there is none.
+        """
+        data = self._dirty.get( id )
+        if data is None:
+            data = self._cache.get( id )
+            if data is None:
+                data = self._load( id )
+                if data is None:
+                    return default
+
+                self._cache[ id ] = data
+
+        return loads( data )
+
+    def __getitem__ ( self, id ):
+        value = self.get( id, self )
+        if value is self:
+            raise KeyError( id )
+
+        return value
+
+    def __setitem__ ( self, id, value ):
+        data = dumps( value, HIGHEST_PROTOCOL )
+        self._dirty[ id ] = self._cache[ id ] = data
+        self._schedule_flush()
+
+    def __contains__ ( self, id ):
+        return (self.get( id, self ) is not self)
+
+    def close ( self ):
+        """ Ends the use of the store by a caller. The store stays open (it is
+            shared by all user interfaces), so this does nothing, and exists
+            only for compatibility with the shelve interface.
+        """
+        pass
+
+    #-- Public methods ---------------------------------------------------------
+
+    def flush ( self ):
+        """ Writes all unwritten changes to the backing storage.
+        """
+        self._flush_pending = False
+        if len( self._dirty ) > 0:
+            dirty, self._dirty = self._dirty, {}
+            try:
+                self._save( dirty )
+            except:
+                # Keep the changes so that a later flush can retry them:
+                dirty.update( self._dirty )
+                self._dirty = dirty
+                raise
+
+    def shutdown ( self ):
+        """ Writes all unwritten changes and releases the backing storage.
+        """
+        try:
+            self.flush()
+        finally:
+            self._cache.clear()
+            self._close()
+
+    #-- Private methods --------------------------------------------------------
+
+    def _schedule_flush ( self ):
+        """ Arranges for the unwritten changes to be written once the
+            application is idle.
+        """
+        if self._flush_pending or (self.flush_delay is None):
+            return
+
+        try:
+            from pyface.timer.api import do_after
+
+            do_after( self.flush_delay, self._idle_flush )
+            self._flush_pending = True
+        except Exception:
+            # There is no GUI event loop to wait for, so write at once:
+            self._idle_flush()
+
+    def _idle_flush ( self ):
+        try:
+            self.flush()
+        except Exception:
+            pass
+
+    def _load ( self, id ):
+        """ Returns the pickled value stored for *id*, or None.
+        """
+        raise NotImplementedError
+
+    def _save ( self, items ):
+        """ Writes a dictionary of pickled values, keyed by id.
+        """
+        raise NotImplementedError
+
+    def _close ( self ):
+        """ Releases the backing storage.
+        """
+        pass
+
+#-------------------------------------------------------------------------------
+#  'SQLitePrefsStore' class:
+#-------------------------------------------------------------------------------
+
+class SQLitePrefsStore ( PrefsStore ):
+    """ A preference store which keeps the pickled values in an SQLite
+        database.
+
+        The database uses write-ahead logging, so that readers in other
+        processes are not blocked while changes are written. If the database
+        does not exist yet and a shelve database exists at *migrate_from*, its
+        contents are copied into the new database.
+    """
+
+    def __init__ ( self, path, migrate_from = None, timeout = 10.0, **kw ):
+        super( SQLitePrefsStore, self ).__init__( **kw )
+
+        self.path         = path
+        self.migrate_from = migrate_from
+        self.timeout      = timeout
+        self._connection  = None
+
+    def _get_connection ( self ):
+        """ Returns the open database connection, opening (and creating or
+            migrating) the database if necessary.
+        """
+        connection = self._connection
+        if connection is None:
+            exists     = os.path.exists( self.path )
+            connection = sqlite3.connect( self.path, timeout = self.timeout )
+            try:
+                connection.execute( 'PRAGMA journal_mode=WAL' )
+                with connection:
+                    connection.execute( 'CREATE TABLE IF NOT EXISTS prefs '
+                                '(id TEXT PRIMARY KEY, value BLOB NOT NULL)' )
+                if (not exists) and (self.migrate_from is not None):
+                    self._migrate( connection )
+            except:
+                connection.close()
+                raise
+
+            self._connection = connection
+
+        return connection
+
+    def _migrate ( self, connection ):
+        """ Copies the contents of an existing shelve database into the new
+            database.
+        """
+        try:
+            shelf = shelve.open( self.migrate_from, flag = 'r' )
+        except Exception:
+            # There is no (readable) shelve database to migrate:
+            return
+
+        try:
+            # The shelf's values are already pickled, so copy them unchanged:
+            data  = shelf.dict
+            items = [ ( unicode( id ), sqlite3.Binary( data[ id ] ) )
+                      for id in data.keys() ]
+        finally:
+            shelf.close()
+
+        # Another process may have migrated at the same time, so do not
+        # overwrite anything it has since written:
+        with connection:
+            connection.executemany(
+                'INSERT OR IGNORE INTO prefs (id, value) VALUES (?, ?)', items )
+
+    def _load ( self, id ):
+        row = self._get_connection().execute(
+                  'SELECT value FROM prefs WHERE id = ?',
+                  ( unicode( id ), ) ).fetchone()
+        if row is None:
+            return None
+
+        return str( row[0] )
+
+    def _save ( self, items ):
+        connection = self._get_connection()
+        with connection:
+            connection.executemany(
+                'INSERT OR REPLACE INTO prefs (id, value) VALUES (?, ?)',
+                [ ( unicode( id ), sqlite3.Binary( data ) )
+                  for id, data in items.iteritems() ] )
+
+    def _close ( self ):
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+#-------------------------------------------------------------------------------
+#  'ShelvePrefsStore' class:
+#-------------------------------------------------------------------------------
+
+class ShelvePrefsStore ( PrefsStore ):
+    """ A preference store which keeps the values in a shelve database (as
+        used by earlier versions). It is used when SQLite is not available.
+        The database is only opened while values are read or written.
+    """
+
+    def __init__ ( self, path, **kw ):
+        super( ShelvePrefsStore, self ).__init__( **kw )
+
+        self.path = path
+
+    def _load ( self, id ):
+        try:
+            shelf = shelve.open( self.path, flag = 'r' )
+        except Exception:
+            return None
+
+        try:
+            return shelf.dict[ str( id ) ]
+        except KeyError:
+            return None
+        finally:
+            shelf.close()
+
+    def _save ( self, items ):
+        shelf = shelve.open( self.path, flag = 'c', protocol = -1 )
+        try:
+            for id, data in items.iteritems():
+                shelf.dict[ str( id ) ] = data
+        finally:
+            shelf.close()
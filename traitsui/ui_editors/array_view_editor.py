@@ -22,8 +22,12 @@
 
 from __future__ import absolute_import
 
+import numpy
+
 from traits.api import Instance, Property, List, Str, Bool, Font
 
+from ..helper import LRUCache
+
 from ..api import View, Item, TabularEditor, BasicEditorFactory
 
 from ..tabular_adapter import TabularAdapter
@@ -74,6 +78,103 @@ class ArrayViewAdapter ( TabularAdapter ):
 
         return super( ArrayViewAdapter, self ).len( object, trait )
 
+#-- Column Titles --------------------------------------------------------------
+
+def array_view_titles ( shape, titles, transpose = False ):
+    """ Returns the titles of the data columns used to display an array of
+        the specified shape, given the (optional) titles specified by the
+        user.
+    """
+    titles = list( titles )
+    if len( shape ) != 2:
+        return titles
+
+    cols = shape[ 0 if transpose else 1 ]
+    n    = len( titles )
+    if n == 0:
+        return [ 'Data %d' % i for i in range( cols ) ]
+
+    if n > cols:
+        titles = titles[:cols]
+    elif n < cols:
+        if (cols % n) == 0:
+            titles, old_titles, i = [], titles, 0
+            while len( titles ) < cols:
+                titles.extend( '%s%d' % ( title, i )
+                               for title in old_titles )
+                i += 1
+        else:
+            titles.extend( [ '' ] * (cols - n) )
+
+    return titles
+
+#-- Array View Data Definition -------------------------------------------------
+
+class ArrayViewData ( object ):
+    """ Presents a 1D or 2D array as rows of formatted cells, without copying
+        it.
+
+        The array (which may be a memory mapped array) is only read in blocks
+        of cells as they are asked for, and each block is formatted in a
+        single vectorized operation. The most recently used formatted blocks
+        are cached. A 1D array is a single column, and transposing a 2D array
+        only creates a transposed view of it.
+    """
+
+    # The number of rows and columns formatted together:
+    block_rows    = 128
+    block_columns = 32
+
+    def __init__ ( self, array, format = '%s', transpose = False,
+                         cache_size = 64 ):
+        self.format    = format
+        self.transpose = transpose
+        self._blocks   = LRUCache( cache_size )
+        self.set_array( array )
+
+    def set_array ( self, array ):
+        """ Sets the array being presented, discarding any formatted cells.
+        """
+        shape = array.shape
+        if len( shape ) == 1:
+            data = array.reshape( ( shape[0], 1 ) )
+        elif len( shape ) == 2:
+            data = array.T if self.transpose else array
+        else:
+            raise ValueError( "ArrayViewEditor can only display 1D or 2D "
+                              "arrays" )
+
+        self.array = array
+        self._data = data
+        self.row_count, self.column_count = data.shape
+        self._blocks.clear()
+
+    def get_text ( self, row, column ):
+        """ Returns the formatted text of a cell.
+        """
+        block_rows, block_columns = self.block_rows, self.block_columns
+        key   = ( row // block_rows, column // block_columns )
+        block = self._blocks.get( key )
+        if block is None:
+            first_row    = key[0] * block_rows
+            first_column = key[1] * block_columns
+            block = self._blocks[ key ] = self.format_block(
+                self._data[ first_row:    first_row    + block_rows,
+                            first_column: first_column + block_columns ] )
+
+        return block[ row % block_rows, column % block_columns ]
+
+    def format_block ( self, data ):
+        """ Returns an array of the formatted text of a block of cells.
+        """
+        try:
+            return numpy.char.mod( self.format, data )
+        except ( TypeError, ValueError ):
+            format = self.format
+            return numpy.array( [ [ format % value for value in row ]
+                                  for row in data ], dtype = object
+                              ).reshape( data.shape )
+
 # Define the actual abstract Traits UI array view editor (each backend should
 # implement its own editor that inherits from this class.
 class _ArrayViewEditor ( UIEditor ):
@@ -115,30 +216,10 @@ class _ArrayViewEditor ( UIEditor ):
                               "arrays" )
 
         factory          = self.factory
-        cols             = 1
-        titles           = factory.titles
-        n                = len( titles )
-        self.show_titles = (n > 0)
+        titles           = array_view_titles( shape, factory.titles,
+                                              factory.transpose )
+        self.show_titles = (len( factory.titles ) > 0)
         is_2d            = (len_shape == 2)
-        if is_2d:
-            index = 1
-            if factory.transpose:
-                index = 0
-            cols = shape[ index ]
-            if self.show_titles:
-                if n > cols:
-                    titles = titles[:cols]
-                elif n < cols:
-                    if (cols % n) == 0:
-                        titles, old_titles, i = [], titles, 0
-                        while len( titles ) < cols:
-                            titles.extend( '%s%d' % ( title, i )
-                                           for title in old_titles )
-                            i += 1
-                    else:
-                        titles.extend( [ '' ] * (cols - n) )
-            else:
-                titles = [ 'Data %d' % i for i in range( cols ) ]
 
         columns = [ ( title, i ) for i, title in enumerate( titles ) ]
 
@@ -57,6 +57,22 @@ class UIInfo ( HasPrivateTraits ):
         for name, value in self.ui.context.items():
             self.bind( name, value )
 
+    #---------------------------------------------------------------------------
+    #  Re-binds all of the associated context objects after the context has
+    #  been replaced:
+    #---------------------------------------------------------------------------
+
+    def rebind_context ( self ):
+        """ Re-binds all of the associated context objects as traits of the
+            object, replacing any existing bindings of the same names.
+        """
+        for name, value in self.ui.context.items():
+            if self.trait( name ) is not None:
+                self.remove_trait( name )
+                self.add_trait( name, Constant( value ) )
+            else:
+                self.bind( name, value )
+
     #---------------------------------------------------------------------------
     #  Binds a name to a value if it is not already bound:
     #---------------------------------------------------------------------------
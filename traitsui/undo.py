@@ -26,12 +26,20 @@
 from __future__ import absolute_import
 
 from operator import isSequenceType
+from sys import getsizeof
 
 from traits.api import (Event, HasPrivateTraits, HasStrictTraits, HasTraits,
     Instance, Int, List, Property, Str, Trait)
 
 from traits.trait_base import enumerate
 
+from .helper import common_affixes, text_delta
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 #-------------------------------------------------------------------------------
 #  Constants:
 #-------------------------------------------------------------------------------
@@ -39,6 +47,134 @@ from traits.trait_base import enumerate
 NumericTypes = ( int, long, float, complex )
 SimpleTypes  = ( str, unicode, int, long, float, complex )
 
+#-------------------------------------------------------------------------------
+#  Returns the (approximate) number of bytes used by a value:
+#-------------------------------------------------------------------------------
+
+def value_size ( value ):
+    """ Returns the (approximate) number of bytes used by a value.
+    """
+    if (numpy is not None) and isinstance( value, numpy.ndarray ):
+        return value.nbytes
+
+    try:
+        size = getsizeof( value )
+        if isinstance( value, ( list, tuple ) ):
+            size += sum( getsizeof( item ) for item in value )
+    except TypeError:
+        return 0
+
+    return size
+
+#-------------------------------------------------------------------------------
+#  Value deltas:
+#-------------------------------------------------------------------------------
+
+def value_delta ( old, new ):
+    """ Returns a delta from which either of two string, list or array values
+        can be rebuilt from the other one, or None if there is no compact
+        delta between them.
+    """
+    kind = type( old )
+    if kind is not type( new ):
+        return None
+
+    try:
+        if issubclass( kind, ( basestring, list ) ):
+            return _SequenceDelta( old, new )
+
+        if (numpy is not None) and issubclass( kind, numpy.ndarray ):
+            return _ArrayDelta( old, new )
+    except ( ValueError, TypeError ):
+        pass
+
+    return None
+
+class _SequenceDelta ( object ):
+    """ The single changed range between two strings or lists.
+    """
+
+    def __init__ ( self, old, new ):
+        start, suffix = common_affixes( old, new )
+        self.start     = start
+        self.suffix    = suffix
+        self.old       = old[ start: len( old ) - suffix ]
+        self.new       = new[ start: len( new ) - suffix ]
+        self.new_check = self._check( new )
+        self.size      = value_size( self.old ) + value_size( self.new )
+
+        # The old value is checked as it is rebuilt from the new one (i.e.
+        # sharing the unchanged items of the new value):
+        self.old_check = self._check( self.old_value( new ) )
+
+    def old_value ( self, new ):
+        """ Rebuilds the old value from the new one.
+        """
+        return self._apply( new, self.new_check, self.old )
+
+    def new_value ( self, old ):
+        """ Rebuilds the new value from the old one.
+        """
+        return self._apply( old, self.old_check, self.new )
+
+    def _apply ( self, value, check, middle ):
+        if self._check( value ) != check:
+            raise ValueError( 'The value has been changed outside of the undo '
+                              'history' )
+
+        return (value[ :self.start ] + middle +
+                value[ len( value ) - self.suffix: ])
+
+    def _check ( self, value ):
+        if isinstance( value, basestring ):
+            return ( len( value ), hash( value ) )
+
+        try:
+            return ( len( value ), hash( tuple( value ) ) )
+        except TypeError:
+            # The items are not hashable, so check their identities instead:
+            return ( len( value ), hash( tuple( [ id( item )
+                                                  for item in value ] ) ) )
+
+class _ArrayDelta ( object ):
+    """ The changed elements between two arrays of the same shape and type.
+    """
+
+    def __init__ ( self, old, new ):
+        if (old.shape != new.shape) or (old.dtype != new.dtype):
+            raise ValueError( 'Arrays of different shapes' )
+
+        index = numpy.flatnonzero( old != new )
+        if (2 * len( index )) > old.size:
+            raise ValueError( 'Too many changed elements' )
+
+        self.shape = old.shape
+        self.dtype = old.dtype
+        self.index = index
+        self.old   = old.ravel()[ index ]
+        self.new   = new.ravel()[ index ]
+        self.size  = index.nbytes + self.old.nbytes + self.new.nbytes
+
+    def old_value ( self, new ):
+        """ Rebuilds the old value from the new one.
+        """
+        return self._apply( new, self.old )
+
+    def new_value ( self, old ):
+        """ Rebuilds the new value from the old one.
+        """
+        return self._apply( old, self.new )
+
+    def _apply ( self, value, items ):
+        if (value.shape != self.shape) or (value.dtype != self.dtype):
+            raise ValueError( 'The value has been changed outside of the undo '
+                              'history' )
+
+        result = value.copy()
+        result.ravel()[ self.index ] = items
+
+        return result
+
 #-------------------------------------------------------------------------------
 #  'AbstractUndoItem' class:
 #-------------------------------------------------------------------------------
@@ -73,12 +209,37 @@ class AbstractUndoItem ( HasPrivateTraits ):
         """
         return False
 
+    #---------------------------------------------------------------------------
+    #  Reduces the memory used by the undo item:
+    #---------------------------------------------------------------------------
+
+    def compact ( self ):
+        """ Reduces the memory used by the undo item, once it can no longer be
+            merged with other undo items.
+        """
+        pass
+
+    #---------------------------------------------------------------------------
+    #  Returns the (approximate) memory used by the undo item:
+    #---------------------------------------------------------------------------
+
+    def memory_size ( self ):
+        """ Returns the (approximate) number of bytes used by the undo item's
+            data.
+        """
+        return 0
+
 #-------------------------------------------------------------------------------
 #  'UndoItem' class:
 #-------------------------------------------------------------------------------
 
 class UndoItem ( AbstractUndoItem ):
     """ A change to an object trait, which can be undone.
+
+        Once compacted, an undo item for a string, list or array value only
+        keeps a delta between its old and new values, and rebuilds them from
+        the trait's current value (which the undo history guarantees to be
+        the new value when undoing, and the old value when redoing).
     """
     #---------------------------------------------------------------------------
     #  Trait definitions:
@@ -98,21 +259,66 @@ class UndoItem ( AbstractUndoItem ):
     #---------------------------------------------------------------------------
 
     def _get_old_value ( self ):
-        return self._old_value
+        delta = self._delta
+        if delta is None:
+            return self._old_value
+
+        value = getattr( self.object, self.name )
+        if self._undone:
+            return value
+
+        return delta.old_value( value )
 
     def _set_old_value ( self, value ):
+        self._expand()
         if isinstance( value, list ):
             value = value[:]
         self._old_value = value
 
     def _get_new_value ( self ):
-        return self._new_value
+        delta = self._delta
+        if delta is None:
+            return self._new_value
+
+        value = getattr( self.object, self.name )
+        if self._undone:
+            return delta.new_value( value )
+
+        return value
 
     def _set_new_value ( self, value ):
+        self._expand()
         if isinstance( value, list ):
             value = value[:]
         self._new_value = value
 
+    #---------------------------------------------------------------------------
+    #  Replaces the old and new values by a delta between them:
+    #---------------------------------------------------------------------------
+
+    def compact ( self ):
+        """ Replaces the old and new values by a delta between them (if
+            they are strings, lists or arrays).
+        """
+        if self._delta is None:
+            delta = value_delta( self._old_value, self._new_value )
+            if delta is not None:
+                self._delta     = delta
+                self._old_value = self._new_value = None
+
+    #---------------------------------------------------------------------------
+    #  Returns the (approximate) memory used by the undo item:
+    #---------------------------------------------------------------------------
+
+    def memory_size ( self ):
+        """ Returns the (approximate) number of bytes used by the undo item's
+            data.
+        """
+        if self._delta is not None:
+            return self._delta.size
+
+        return value_size( self._old_value ) + value_size( self._new_value )
+
     #---------------------------------------------------------------------------
     #  Undoes the change:
     #---------------------------------------------------------------------------
@@ -122,6 +328,7 @@ class UndoItem ( AbstractUndoItem ):
         """
         try:
             setattr( self.object, self.name, self.old_value )
+            self._undone = True
         except:
             pass
 
@@ -134,6 +341,7 @@ class UndoItem ( AbstractUndoItem ):
         """
         try:
             setattr( self.object, self.name, self.new_value )
+            self._undone = False
         except:
             pass
 
@@ -144,6 +352,11 @@ class UndoItem ( AbstractUndoItem ):
     def merge_undo ( self, undo_item ):
         """ Merges two undo items if possible.
         """
+        # A compacted undo item can only rebuild its values from the current
+        # trait value, which a new change has already replaced:
+        if self._delta is not None:
+            return False
+
         # Undo items are potentially mergeable only if they are of the same
         # class and refer to the same object trait, so check that first:
         if (isinstance( undo_item, self.__class__ ) and
@@ -154,18 +367,13 @@ class UndoItem ( AbstractUndoItem ):
             t1 = type( v1 )
             if t1 is type( v2 ):
 
-                if isinstance(t1, basestring):
+                if issubclass( t1, basestring ):
                     # Merge two undo items if they have new values which are
                     # strings which only differ by one character (corresponding
                     # to a single character insertion, deletion or replacement
                     # operation in a text editor):
-                    n1 = len( v1 )
-                    n2 = len( v2 )
-                    n  = min( n1, n2 )
-                    i  = 0
-                    while (i < n) and (v1[i] == v2[i]):
-                        i += 1
-                    if v1[i + (n2 <= n1):] == v2[i + (n2 >= n1):]:
+                    start, end, text = text_delta( v1, v2 )
+                    if ((end - start) <= 1) and (len( text ) <= 1):
                         self.new_value = v2
                         return True
 
@@ -212,9 +420,24 @@ class UndoItem ( AbstractUndoItem ):
         """
         n  = self.name
         cn = self.object.__class__.__name__
+        if self._delta is not None:
+            return 'undo/redo( %s.%s ) [compacted]' % ( cn, n )
+
         return 'undo( %s.%s = %s )\nredo( %s.%s = %s )' % (
                       cn, n, self.old_value, cn, n, self.new_value )
 
+    #-- Private Methods --------------------------------------------------------
+
+    def _expand ( self ):
+        """ Replaces the delta of a compacted undo item by the old and new
+            values it represents.
+        """
+        if self._delta is not None:
+            old_value, new_value = self.old_value, self.new_value
+            self._delta     = None
+            self._old_value = old_value
+            self._new_value = new_value
+
 #-------------------------------------------------------------------------------
 #  'ListUndoItem' class:
 #-------------------------------------------------------------------------------
@@ -292,6 +515,16 @@ class ListUndoItem ( AbstractUndoItem ):
                         return True
         return False
 
+    #---------------------------------------------------------------------------
+    #  Returns the (approximate) memory used by the undo item:
+    #---------------------------------------------------------------------------
+
+    def memory_size ( self ):
+        """ Returns the (approximate) number of bytes used by the undo item's
+            data.
+        """
+        return value_size( self.added ) + value_size( self.removed )
+
     #---------------------------------------------------------------------------
     #  Returns a 'pretty print' form of the object:
     #---------------------------------------------------------------------------
@@ -326,6 +559,13 @@ class UndoHistory ( HasStrictTraits ):
     can_undo = Property
     # Can an action be redone?
     can_redo = Property
+    # The maximum number of undoable steps kept (0 means no limit)
+    max_steps = Int
+    # The maximum (approximate) number of bytes used by the steps kept (0
+    # means no limit). The most recent step is always kept.
+    max_bytes = Int
+    # The (approximate) number of bytes used by the history
+    memory_use = Property
 
     #---------------------------------------------------------------------------
     #  Adds an UndoItem to the history:
@@ -346,6 +586,11 @@ class UndoHistory ( HasStrictTraits ):
                 self.history[ now: ] = []
                 return
 
+        # The previous step can no longer be merged with, so compact it:
+        if now > 0:
+            for item in self.history[ now - 1 ]:
+                item.compact()
+
         old_len = len( self.history )
         self.history[ now: ] = [ [ undo_item ] ]
         self.now += 1
@@ -354,6 +599,40 @@ class UndoHistory ( HasStrictTraits ):
         if self.now <= old_len:
             self.redoable = False
 
+        self.trim()
+
+    #---------------------------------------------------------------------------
+    #  Discards the oldest steps which exceed the history's budget:
+    #---------------------------------------------------------------------------
+
+    def trim ( self ):
+        """ Discards the oldest steps in the history which exceed its
+            **max_steps** or **max_bytes** budget (always keeping the most
+            recent step).
+        """
+        max_steps, max_bytes = self.max_steps, self.max_bytes
+        if (max_steps <= 0) and (max_bytes <= 0):
+            return
+
+        history = self.history
+        sizes   = []
+        total   = 0
+        if max_bytes > 0:
+            sizes = [ self._step_size( items ) for items in history ]
+            total = sum( sizes )
+
+        count = 0
+        while ((count < (self.now - 1)) and
+               (((self.now - count) > max_steps > 0) or
+                (total > max_bytes > 0))):
+            if max_bytes > 0:
+                total -= sizes[ count ]
+            count += 1
+
+        if count > 0:
+            del history[ :count ]
+            self.now -= count
+
     #---------------------------------------------------------------------------
     #  Extends the most recent 'undo' item:
     #---------------------------------------------------------------------------
@@ -450,6 +729,28 @@ class UndoHistory ( HasStrictTraits ):
         """
         return self.now < len( self.history )
 
+    #---------------------------------------------------------------------------
+    #  Returns the (approximate) memory used by the history:
+    #---------------------------------------------------------------------------
+
+    def _get_memory_use ( self ):
+        """ Returns the (approximate) number of bytes used by the history.
+        """
+        return sum( self._step_size( items ) for items in self.history )
+
+    def _step_size ( self, items ):
+        return sum( item.memory_size() for item in items )
+
+    #---------------------------------------------------------------------------
+    #  Trims the history when its budget changes:
+    #---------------------------------------------------------------------------
+
+    def _max_steps_changed ( self ):
+        self.trim()
+
+    def _max_bytes_changed ( self ):
+        self.trim()
+
 #-------------------------------------------------------------------------------
 #  'UndoHistoryUndoItem' class:
 #-------------------------------------------------------------------------------
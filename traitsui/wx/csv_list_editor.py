@@ -35,14 +35,20 @@ class SimpleEditor(WXSimpleEditor):
     prepare = _prepare_method
     dispose = _dispose_method
 
+    # The evaluation and formatting functions are specific to the edited
+    # object, so the editor cannot be re-targeted at a new context:
+    retargetable = False
+
 class CustomEditor(WXCustomEditor):
     """ Custom Editor style for CSVListEditor. """
     prepare = _prepare_method
     dispose = _dispose_method
+    retargetable = False
 
 class ReadonlyEditor(WXReadonlyEditor):
     """ Readonly Editor style for CSVListEditor. """
     prepare = _prepare_method
     dispose = _dispose_method
+    retargetable = False
 
 TextEditor = SimpleEditor
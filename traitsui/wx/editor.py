@@ -238,6 +238,11 @@ class Editor ( UIEditor ):
 class EditorWithList ( Editor ):
     """ Editor for an object that contains a list.
     """
+
+    # The editor listens to the edited object itself, so it cannot be
+    # re-targeted at a new context:
+    retargetable = False
+
     #---------------------------------------------------------------------------
     #  Trait definitions:
     #---------------------------------------------------------------------------
@@ -91,6 +91,10 @@ class TableEditor ( Editor, BaseTableEditor ):
         their criteria.
     """
 
+    # The editor listens to the edited object itself, so it cannot be
+    # re-targeted at a new context:
+    retargetable = False
+
     #---------------------------------------------------------------------------
     #  Trait definitions:
     #---------------------------------------------------------------------------
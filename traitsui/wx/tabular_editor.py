@@ -37,6 +37,9 @@ from traits.api \
 from traitsui.editors.tabular_editor \
     import TabularEditor
 
+from traitsui.helper \
+    import RowChanges, RowIndex
+
 from traitsui.ui_traits \
     import Image
 
@@ -50,7 +53,7 @@ from pyface.image_resource \
     import ImageResource
 
 from pyface.timer.api \
-    import do_later
+    import do_after, do_later
 
 from constants \
     import is_mac, scrollbar_dx
@@ -175,6 +178,10 @@ class TabularEditor ( Editor ):
         lists of objects, etc).
     """
 
+    # The editor listens to the edited object itself, so it cannot be
+    # re-targeted at a new context:
+    retargetable = False
+
     #-- Trait Definitions ------------------------------------------------------
 
     # The event fired when a table update is needed:
@@ -247,6 +254,13 @@ class TabularEditor ( Editor ):
         # Set up the adapter to use:
         self.adapter = factory.adapter
 
+        # Set up the object to row mapping and the changed row collector used
+        # when items are updated:
+        self._row_index   = RowIndex( lambda: self.value )
+        self._row_changes = RowChanges( self._rows_changed,
+                                        self._schedule_row_changes,
+                                        factory.update_batch_size )
+
         # Determine the style to use for the list control:
         style = wx.LC_REPORT | wx.LC_VIRTUAL | wx.BORDER_NONE
 
@@ -390,6 +404,8 @@ class TabularEditor ( Editor ):
         self.on_trait_change( self._rebuild_all, 'adapter.columns',
                               remove = True )
 
+        self._row_changes.reset()
+
         super( TabularEditor, self ).dispose()
 
     def _update_changed ( self, event ):
@@ -405,20 +421,59 @@ class TabularEditor ( Editor ):
     def refresh_editor ( self, item, name, old, new ):
         """ Handles a table item attribute being changed.
         """
-        self._refresh_editor( item )
+        # Only redraw the changed row, once any other pending changes have been
+        # collected:
+        self._row_changes.add( self._row_for( item ) )
 
     def _refresh_editor ( self, item ):
         """ Handles a table item being changed.
         """
+        row = self._row_for( item )
+        if row is not None:
+            self._refresh_row( row )
+        else:
+            self.update_editor()
+
+    def _row_for ( self, item ):
+        """ Returns the row containing a specified table item, or None if the
+            item is not in the table.
+        """
         adapter      = self.adapter
         object, name = self.object, self.name
         agi          = adapter.get_item
+        row          = self._row_index.row_for( item )
+        if (row != -1) and (agi( object, name, row ) is item):
+            return row
+
+        # The adapter does not map rows directly to the list items, so search
+        # for the item:
         for row in xrange( adapter.len( object, name ) ):
             if item is agi( object, name, row ):
-                self._refresh_row( row )
-                return
+                return row
 
-        self.update_editor()
+        return None
+
+    def _schedule_row_changes ( self, flush ):
+        """ Schedules the collected row changes to be redrawn.
+        """
+        interval = self.factory.update_interval
+        if interval > 0:
+            do_after( interval, flush )
+        else:
+            do_later( flush )
+
+    def _rows_changed ( self, blocks ):
+        """ Redraws the specified blocks of changed rows (or the whole table if
+            blocks is None).
+        """
+        if self.control is None:
+            return
+
+        if blocks is None:
+            self.update_editor()
+        else:
+            for first, last in blocks:
+                self.control.RefreshItems( first, last )
 
     def _refresh_row ( self, row ):
         """ Updates the editor control when a specified table row changes.
@@ -440,6 +495,8 @@ class TabularEditor ( Editor ):
         """ Updates the editor when the object trait changes externally to the
             editor.
         """
+        self._row_index.reset()
+
         control = self.control
         n       = self.adapter.len( self.object, self.name )
         top     = control.GetTopItem()
@@ -497,11 +554,10 @@ class TabularEditor ( Editor ):
                 for row in self._get_selected():
                     self.control.SetItemState( row, 0, wx.LIST_STATE_SELECTED )
             else:
-                try:
-                    self.control.SetItemState( self.value.index( selected ),
-                                wx.LIST_STATE_SELECTED, wx.LIST_STATE_SELECTED )
-                except:
-                    pass
+                row = self._row_index.row_for( selected )
+                if row != -1:
+                    self.control.SetItemState( row, wx.LIST_STATE_SELECTED,
+                                                    wx.LIST_STATE_SELECTED )
 
     def _selected_row_changed ( self, old, new ):
         """ Handles the editor's 'selected_index' trait being changed.
@@ -518,23 +574,20 @@ class TabularEditor ( Editor ):
         """ Handles the editor's 'multi_selected' trait being changed.
         """
         if not self._no_update:
-            values = self.value
-            try:
-                self._multi_selected_rows_changed( [ values.index( item )
-                                                     for item in selected ] )
-            except:
-                pass
+            row_for = self._row_index.row_for
+            rows    = [ row_for( item ) for item in selected ]
+            if -1 not in rows:
+                self._multi_selected_rows_changed( rows )
 
     def _multi_selected_items_changed ( self, event ):
         """ Handles the editor's 'multi_selected' trait being modified.
         """
-        values = self.values
-        try:
+        row_for = self._row_index.row_for
+        removed = [ row_for( item ) for item in event.removed ]
+        added   = [ row_for( item ) for item in event.added   ]
+        if (-1 not in removed) and (-1 not in added):
             self._multi_selected_rows_items_changed( TraitListEvent( 0,
-                [ values.index( item ) for item in event.removed ],
-                [ values.index( item ) for item in event.added   ] ) )
-        except:
-            pass
+                                                         removed, added ) )
 
     def _multi_selected_rows_changed ( self, selected_rows ):
         """ Handles the editor's 'multi_selected_rows' trait being changed.
@@ -49,6 +49,10 @@ class _ThemedVerticalNotebookEditor ( Editor ):
         traits.
     """
 
+    # The editor listens to the edited object itself, so it cannot be
+    # re-targeted at a new context:
+    retargetable = False
+
     #-- Trait Definitions ------------------------------------------------------
 
     # Is the notebook editor scrollable? This values overrides the default:
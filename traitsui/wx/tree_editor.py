@@ -796,52 +796,7 @@ class SimpleEditor ( Editor ):
             isinstance( object[1], TreeNode )):
             return object
 
-        # Select all nodes which understand this object:
-        factory = self.factory
-        nodes   = [ node for node in factory.nodes
-                    if object is not None and node.is_node_for( object ) ]
-
-        # If only one found, we're done, return it:
-        if len( nodes ) == 1:
-            return ( object, nodes[0] )
-
-        # If none found, try to create an adapted node for the object:
-        if len( nodes ) == 0:
-           return ( object, ITreeNodeAdapterBridge( adapter = object ) )
-
-        # Use all selected nodes that have the same 'node_for' list as the
-        # first selected node:
-        base  = nodes[0].node_for
-        nodes = [ node for node in nodes if base == node.node_for ]
-
-        # If only one left, then return that node:
-        if len( nodes ) == 1:
-            return ( object, nodes[0] )
-
-        # Otherwise, return a MultiTreeNode based on all selected nodes...
-
-        # Use the node with no specified children as the root node. If not
-        # found, just use the first selected node as the 'root node':
-        root_node = None
-        for i, node in enumerate( nodes ):
-            if node.get_children_id( object ) == '':
-                root_node = node
-                del nodes[i]
-                break
-        else:
-            root_node = nodes[0]
-
-        # If we have a matching MultiTreeNode already cached, return it:
-        key = ( root_node, ) + tuple( nodes )
-        if key in factory.multi_nodes:
-            return ( object, factory.multi_nodes[ key ] )
-
-        # Otherwise create one, cache it, and return it:
-        factory.multi_nodes[ key ] = multi_node = MultiTreeNode(
-                                                       root_node = root_node,
-                                                       nodes     = nodes )
-
-        return ( object, multi_node )
+        return ( object, self.factory.node_for_object( object ) )
 
     #---------------------------------------------------------------------------
     #  Returns the TreeNode associated with a specified class:
@@ -850,10 +805,7 @@ class SimpleEditor ( Editor ):
     def _node_for_class ( self, klass ):
         """ Returns the TreeNode associated with a specified class.
         """
-        for node in self.factory.nodes:
-            if issubclass( klass, tuple( node.node_for ) ):
-                return node
-        return None
+        return self.factory.node_for_class( klass )
 
     #---------------------------------------------------------------------------
     #  Returns the node and class associated with a specified class name:
@@ -862,11 +814,7 @@ class SimpleEditor ( Editor ):
     def _node_for_class_name ( self, class_name ):
         """ Returns the node and class associated with a specified class name.
         """
-        for node in self.factory.nodes:
-            for klass in node.node_for:
-                if class_name == klass.__name__:
-                    return ( node, klass )
-        return ( None, None )
+        return self.factory.node_for_class_name( class_name )
 
     #---------------------------------------------------------------------------
     #  Updates the icon for a specified node: